@@ -0,0 +1,97 @@
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from block_markdown import BlockType, block_to_block_type, classify_blocks
+
+
+SAMPLE_BLOCKS = {
+    BlockType.HEADER: "### A heading for the section",
+    BlockType.PARAGRAPH: (
+        "A paragraph of text that spans\nmore than one line\nof the source."
+    ),
+    BlockType.CODE: "```\ndef main():\n    return 0\n```",
+    BlockType.QUOTE: "> A quote\n> that continues\n> for three lines",
+    BlockType.UNORDERED_LIST: "\n".join(f"- item {i}" for i in range(20)),
+    BlockType.ORDERED_LIST: "\n".join(f"{i}. item" for i in range(1, 21)),
+}
+
+
+def reference_block_to_block_type(block):
+    if not block:
+        raise ValueError("Block cannot be empty.")
+
+    if re.match(r"^(#{1,6})\s(.+)$", block):
+        return BlockType.HEADER
+
+    if block[:3] == "```" and block[-3:] == "```":
+        return BlockType.CODE
+
+    if block.startswith(">"):
+        if "\n" in block:
+            for line in block.split("\n"):
+                if ">" not in line:
+                    return BlockType.PARAGRAPH
+        return BlockType.QUOTE
+
+    if block.startswith("- "):
+        if "\n" in block:
+            for line in block.split("\n"):
+                if not line.startswith("- "):
+                    return BlockType.PARAGRAPH
+        return BlockType.UNORDERED_LIST
+
+    if block.startswith("1. "):
+        if "\n" in block:
+            item_number = 1
+            for line in block.split("\n"):
+                if not line.startswith(f"{item_number}. "):
+                    return BlockType.PARAGRAPH
+                item_number += 1
+        return BlockType.ORDERED_LIST
+
+    return BlockType.PARAGRAPH
+
+
+def best_time(function, argument, number, repeat=5):
+    timer = timeit.Timer(lambda: function(argument))
+    return min(timer.repeat(number=number, repeat=repeat)) / number
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    print(f"{'block type':<16}{'reference':>14}{'classifier':>14}{'speedup':>10}")
+    for block_type, block in SAMPLE_BLOCKS.items():
+        if block_to_block_type(block) is not block_type:
+            raise SystemExit(f"{block_type} sample was misclassified.")
+
+        reference = best_time(reference_block_to_block_type, block, number)
+        classifier = best_time(block_to_block_type, block, number)
+        print(
+            f"{block_type.value:<16}"
+            f"{reference * 1e9:>11.0f} ns"
+            f"{classifier * 1e9:>11.0f} ns"
+            f"{reference / classifier:>9.2f}x"
+        )
+
+    blocks = list(SAMPLE_BLOCKS.values()) * 1000
+    reference = best_time(
+        lambda blocks: [reference_block_to_block_type(b) for b in blocks],
+        blocks,
+        number=10
+    )
+    batch = best_time(classify_blocks, blocks, number=10)
+    print(
+        f"{'batch':<16}"
+        f"{reference * 1e3:>11.2f} ms"
+        f"{batch * 1e3:>11.2f} ms"
+        f"{reference / batch:>9.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
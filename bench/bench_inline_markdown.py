@@ -0,0 +1,56 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from inline_markdown import (
+    split_nodes_delimiter,
+    split_nodes_image,
+    split_nodes_link,
+    text_to_textnodes
+)
+from textnode import TextNode, TextType
+
+
+SENTENCE = (
+    "This is **bold** text with an _italic_ word, some `inline code`, "
+    "a [link](https://example.com/docs) and an "
+    "![image](https://example.com/logo.png) in it. "
+)
+
+
+def chained_text_to_textnodes(text):
+    nodes = [TextNode(text, TextType.TEXT)]
+    nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
+    nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
+    nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
+    nodes = split_nodes_image(nodes)
+    nodes = split_nodes_link(nodes)
+    return nodes
+
+
+def best_time(function, text, repeat):
+    return min(timeit.repeat(lambda: function(text), number=1, repeat=repeat))
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    text = SENTENCE * int(size_mb * 1024 * 1024 / len(SENTENCE))
+
+    if chained_text_to_textnodes(text) != text_to_textnodes(text):
+        raise SystemExit("Single-pass lexer output differs from chained passes.")
+
+    chained = best_time(chained_text_to_textnodes, text, repeat)
+    single = best_time(text_to_textnodes, text, repeat)
+    megabytes = len(text) / (1024 * 1024)
+
+    print(f"input: {megabytes:.1f} MB")
+    print(f"chained passes:   {chained:.3f}s ({megabytes / chained:.1f} MB/s)")
+    print(f"single-pass lexer: {single:.3f}s ({megabytes / single:.1f} MB/s)")
+    print(f"speedup: {chained / single:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
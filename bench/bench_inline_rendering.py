@@ -0,0 +1,69 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from corpora import build_corpus, corpus_names
+from markdown_to_html import markdown_to_html_node, render_markdown
+from parsed_document import parse_document, records_to_text_nodes
+from parentnode import ParentNode
+from textnode import text_nodes_to_html, text_nodes_to_html_nodes
+
+
+def leaf_node_html(streams):
+    return [
+        ParentNode("p", text_nodes_to_html_nodes(stream)).to_html()
+        for stream in streams
+    ]
+
+
+def direct_html(streams):
+    return [f"<p>{text_nodes_to_html(stream)}</p>" for stream in streams]
+
+
+def best_time(function, argument, repeat=5):
+    return min(
+        timeit.repeat(lambda: function(argument), number=1, repeat=repeat)
+    )
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1 << 20
+
+    print(f"{size} bytes per corpus")
+    print(
+        f"{'corpus':<10}{'leaf nodes':>13}{'direct':>11}{'speedup':>10}"
+        f"{'page tree':>13}{'direct':>11}{'speedup':>10}"
+    )
+    for name in corpus_names():
+        markdown = build_corpus(name, size)
+        streams = [
+            records_to_text_nodes(stream)
+            for _, block_streams in parse_document(markdown)
+            for stream in block_streams
+        ]
+        if direct_html(streams) != leaf_node_html(streams):
+            raise SystemExit(f"{name} corpus renders differently.")
+        if render_markdown(markdown) != markdown_to_html_node(markdown).to_html():
+            raise SystemExit(f"{name} corpus pages render differently.")
+
+        leaf_nodes = best_time(leaf_node_html, streams)
+        direct = best_time(direct_html, streams)
+        tree = best_time(
+            lambda markdown: markdown_to_html_node(markdown).to_html(), markdown
+        )
+        page = best_time(render_markdown, markdown)
+        print(
+            f"{name:<10}"
+            f"{leaf_nodes * 1e3:>10.1f} ms"
+            f"{direct * 1e3:>8.1f} ms"
+            f"{leaf_nodes / direct:>9.2f}x"
+            f"{tree * 1e3:>10.1f} ms"
+            f"{page * 1e3:>8.1f} ms"
+            f"{tree / page:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
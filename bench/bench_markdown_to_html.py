@@ -0,0 +1,85 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from block_markdown import BlockType, block_to_block_type, markdown_to_blocks
+from corpora import build_corpus, corpus_names
+from inline_markdown import text_to_textnodes
+from leafnode import LeafNode
+from markdown_to_html import markdown_to_html_node
+from parentnode import ParentNode
+from textnode import text_node_to_html_node
+
+
+def reference_text_to_children(text):
+    return [text_node_to_html_node(node) for node in text_to_textnodes(text)]
+
+
+def reference_block_to_html_node(block):
+    match block_to_block_type(block):
+        case BlockType.HEADER:
+            level = len(block) - len(block.lstrip("#"))
+            children = reference_text_to_children(block[level + 1:])
+            return ParentNode(f"h{level}", children)
+        case BlockType.CODE:
+            code = block[3:-3]
+            if code.startswith("\n"):
+                code = code[1:]
+            return ParentNode("pre", [LeafNode("code", code)])
+        case BlockType.QUOTE:
+            lines = [line.lstrip(">").strip() for line in block.split("\n")]
+            children = reference_text_to_children(" ".join(lines))
+            return ParentNode("blockquote", children)
+        case BlockType.UNORDERED_LIST:
+            items = [
+                ParentNode("li", reference_text_to_children(line[2:]))
+                for line in block.split("\n")
+            ]
+            return ParentNode("ul", items)
+        case BlockType.ORDERED_LIST:
+            items = [
+                ParentNode(
+                    "li", reference_text_to_children(line.split(". ", 1)[1])
+                )
+                for line in block.split("\n")
+            ]
+            return ParentNode("ol", items)
+        case _:
+            children = reference_text_to_children(" ".join(block.split("\n")))
+            return ParentNode("p", children)
+
+
+def reference_markdown_to_html_node(markdown):
+    blocks = markdown_to_blocks(markdown)
+    return ParentNode("div", [reference_block_to_html_node(b) for b in blocks])
+
+
+def best_time(function, argument, repeat=5):
+    return min(timeit.repeat(lambda: function(argument), number=1, repeat=repeat))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1 << 20
+
+    print(f"{size} bytes per corpus")
+    print(f"{'corpus':<10}{'reference':>12}{'parse_block':>14}{'speedup':>10}")
+    for name in corpus_names():
+        markdown = build_corpus(name, size)
+        expected = reference_markdown_to_html_node(markdown).to_html()
+        if markdown_to_html_node(markdown).to_html() != expected:
+            raise SystemExit(f"{name} corpus differs from the reference.")
+
+        reference = best_time(reference_markdown_to_html_node, markdown)
+        single_pass = best_time(markdown_to_html_node, markdown)
+        print(
+            f"{name:<10}"
+            f"{reference * 1e3:>9.1f} ms"
+            f"{single_pass * 1e3:>11.1f} ms"
+            f"{reference / single_pass:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
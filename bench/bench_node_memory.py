@@ -0,0 +1,81 @@
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from leafnode import LeafNode
+from parentnode import ParentNode
+from textnode import TextNode, TextType
+
+
+class DictTextNode:
+    def __init__(self, text, text_type, url=None):
+        self.text = text
+        self.text_type = text_type
+        self.url = url
+
+
+class DictHTMLNode:
+    def __init__(self, tag=None, value=None, children=None, props=None):
+        self.tag = tag
+        self.value = value
+        self.children = children
+        self.props = props
+
+
+class DictLeafNode(DictHTMLNode):
+    def __init__(self, tag, value, props=None):
+        super().__init__(tag, value, None, props)
+
+
+class DictParentNode(DictHTMLNode):
+    def __init__(self, tag, children, props=None):
+        super().__init__(tag, None, children, props)
+
+
+def bytes_per_node(factory, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    nodes = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    container = sys.getsizeof(nodes)
+    del nodes
+    return (after - before - container) / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    children = []
+    cases = [
+        (
+            "TextNode",
+            lambda: DictTextNode("text", TextType.TEXT),
+            lambda: TextNode("text", TextType.TEXT),
+        ),
+        (
+            "LeafNode",
+            lambda: DictLeafNode("b", "text"),
+            lambda: LeafNode("b", "text"),
+        ),
+        (
+            "ParentNode",
+            lambda: DictParentNode("p", children),
+            lambda: ParentNode("p", children),
+        ),
+    ]
+
+    print(f"{'node':<12}{'dict-backed':>14}{'slotted':>12}{'saved':>10}")
+    for name, before_factory, after_factory in cases:
+        before = bytes_per_node(before_factory, count)
+        after = bytes_per_node(after_factory, count)
+        print(
+            f"{name:<12}{before:>8.0f} bytes{after:>6.0f} bytes"
+            f"{1 - after / before:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from corpora import build_corpus, corpus_names
+from markdown_to_html import markdown_to_html_node
+from parsed_document import (
+    document_to_html_node,
+    dump_document,
+    load_document,
+    parse_document,
+    source_digest
+)
+
+
+def best_time(function, repeat=5):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1 << 20
+
+    print(f"{size} bytes per corpus")
+    print(
+        f"{'corpus':<10}{'parse':>11}{'load':>11}{'speedup':>10}"
+        f"{'render':>13}{'warm':>11}{'speedup':>10}"
+    )
+    for name in corpus_names():
+        markdown = build_corpus(name, size)
+        source = markdown.encode("utf-8")
+        digest = source_digest(source)
+        data = dump_document(parse_document(markdown), digest)
+        document = load_document(data, digest)
+        expected = markdown_to_html_node(markdown).to_html()
+        if document_to_html_node(document).to_html() != expected:
+            raise SystemExit(f"{name} corpus differs after loading.")
+
+        parse = best_time(lambda: parse_document(markdown))
+        load = best_time(lambda: load_document(data, digest))
+        render = best_time(lambda: markdown_to_html_node(markdown).to_html())
+        warm = best_time(
+            lambda: document_to_html_node(load_document(data, digest)).to_html()
+        )
+        print(
+            f"{name:<10}"
+            f"{parse * 1e3:>8.1f} ms"
+            f"{load * 1e3:>8.1f} ms"
+            f"{parse / load:>9.1f}x"
+            f"{render * 1e3:>10.1f} ms"
+            f"{warm * 1e3:>8.1f} ms"
+            f"{render / warm:>9.2f}x"
+        )
+    print(f"{len(data)} bytes serialized for the last corpus")
+
+
+if __name__ == "__main__":
+    main()
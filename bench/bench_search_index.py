@@ -0,0 +1,96 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from corpora import DOCS_PAGE
+from markdown_to_html import parse_markdown
+from search_index import SearchIndexBuilder, page_terms
+
+
+def build_pages(count):
+    return [
+        f"# Page {i}\n\nTopic{i % 500} covers item{i} and "
+        f"**keyword{i % 50}**.\n\n{DOCS_PAGE}"
+        for i in range(count)
+    ]
+
+
+def list_postings(pages_terms):
+    postings = {}
+    for document, terms in enumerate(pages_terms):
+        for term, (weight, positions) in terms.items():
+            postings.setdefault(term, []).append(
+                (document, weight, list(positions))
+            )
+    return postings
+
+
+def measure(function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def build_index(output_dir, pages_terms, memory_budget):
+    builder = SearchIndexBuilder(output_dir, memory_budget)
+    for document, terms in enumerate(pages_terms):
+        builder.add_page(f"{document}.html", str(document), terms)
+    builder.write()
+    return builder
+
+
+def read_shards(directory):
+    shards = {}
+    for filename in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, filename), "rb") as file:
+            shards[filename] = file.read()
+    return shards
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    pages = build_pages(count)
+    start = time.perf_counter()
+    pages_terms = [page_terms(parse_markdown(page)) for page in pages]
+    tokenize = time.perf_counter() - start
+
+    _, _, list_peak = measure(lambda: list_postings(pages_terms))
+    with tempfile.TemporaryDirectory() as directory:
+        memory_dir = os.path.join(directory, "memory")
+        spill_dir = os.path.join(directory, "spill")
+        _, memory_time, memory_peak = measure(
+            lambda: build_index(memory_dir, pages_terms, 1 << 30)
+        )
+        spilled, spill_time, spill_peak = measure(
+            lambda: build_index(spill_dir, pages_terms, 1 << 20)
+        )
+        if read_shards(memory_dir) != read_shards(spill_dir):
+            raise SystemExit("Spilled index differs from in-memory index.")
+        shard_bytes = sum(map(len, read_shards(memory_dir).values()))
+
+    print(f"{count} pages, parsed and tokenized in {tokenize * 1e3:.0f} ms")
+    print(f"{'postings':<22}{'time':>10}{'peak':>12}")
+    print(f"{'list of tuples':<22}{'':>10}{list_peak / 1e6:>9.1f} MB")
+    print(
+        f"{'arrays, in memory':<22}{memory_time * 1e3:>7.0f} ms"
+        f"{memory_peak / 1e6:>9.1f} MB"
+    )
+    print(
+        f"{'arrays, 1 MB budget':<22}{spill_time * 1e3:>7.0f} ms"
+        f"{spill_peak / 1e6:>9.1f} MB  ({spilled.spills} spills)"
+    )
+    print(f"{shard_bytes / 1e6:.1f} MB of JSON shards")
+
+
+if __name__ == "__main__":
+    main()
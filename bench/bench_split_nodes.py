@@ -0,0 +1,93 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from inline_markdown import (
+    extract_markdown_images,
+    extract_markdown_links,
+    split_nodes_image,
+    split_nodes_link
+)
+from textnode import TextNode, TextType
+
+
+def reference_split_nodes(old_nodes, type):
+    new_nodes = []
+    for node in old_nodes:
+        if node.text_type is not TextType.TEXT:
+            new_nodes.append(node)
+            continue
+
+        extracted_items = None
+        if type == TextType.IMAGE:
+            extracted_items = extract_markdown_images(node.text)
+        if type == TextType.LINK:
+            extracted_items = extract_markdown_links(node.text)
+
+        if len(extracted_items) == 0:
+            if node.text:
+                new_nodes.append(node)
+            continue
+
+        node_text = node.text
+        for item in extracted_items:
+            split_text = None
+            if type == TextType.IMAGE:
+                split_text = node_text.split(f"![{item[0]}]({item[1]})", 1)
+            if type == TextType.LINK:
+                split_text = node_text.split(f"[{item[0]}]({item[1]})", 1)
+
+            if split_text[0] != "":
+                new_nodes.append(TextNode(split_text[0], TextType.TEXT))
+            new_nodes.append(TextNode(item[0], type, item[1]))
+            node_text = split_text[1]
+
+        if node_text != "":
+            new_nodes.append(TextNode(node_text, TextType.TEXT))
+
+    return new_nodes
+
+
+def link_paragraph(count):
+    return " ".join(
+        f"see [page {i}](https://example.com/docs/page-{i}.html) and"
+        for i in range(count)
+    )
+
+
+def image_paragraph(count):
+    return " ".join(
+        f"figure ![diagram {i}](https://example.com/img/{i}.png) shows"
+        for i in range(count)
+    )
+
+
+def best_time(function, repeat=3):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    cases = [
+        ("links", link_paragraph(count), split_nodes_link, TextType.LINK),
+        ("images", image_paragraph(count), split_nodes_image, TextType.IMAGE),
+    ]
+
+    print(f"{count} items per paragraph")
+    for name, text, split, type in cases:
+        nodes = [TextNode(text, TextType.TEXT)]
+        if split(nodes) != reference_split_nodes(nodes, type):
+            raise SystemExit(f"Split {name} differ from the reference.")
+
+        reference = best_time(lambda: reference_split_nodes(nodes, type))
+        spans = best_time(lambda: split(nodes))
+        print(
+            f"{name:<8}reference {reference:.3f}s  "
+            f"spans {spans:.3f}s  speedup {reference / spans:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from corpora import DOCS_PAGE
+from markdown_to_html import render_markdown
+from template import TemplateLoader
+
+
+LAYOUT = (
+    "<!DOCTYPE html>\n<html>\n<head>\n<title>{{ title }} | Docs</title>\n"
+    "{% include \"head.html\" %}\n</head>\n<body>\n{{> nav }}\n"
+    "<article>\n<h1>{{ title }}</h1>\n{{ content }}\n</article>\n"
+    "{% include \"footer.html\" %}\n</body>\n</html>\n"
+)
+HEAD = "\n".join(
+    f'<link rel="stylesheet" href="/css/{name}.css">'
+    for name in ["reset", "layout", "code", "print"]
+)
+NAV = "<nav>" + "".join(
+    f'<a href="/docs/{i}.html">Section {i}</a>' for i in range(20)
+) + "<span>{{ title }}</span></nav>"
+FOOTER = "<footer>Built by the static site generator.</footer>"
+VARIABLE_PATTERN = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+def write_templates(directory):
+    files = {
+        "base.html": LAYOUT,
+        "head.html": HEAD,
+        "footer.html": FOOTER,
+        os.path.join("partials", "nav.html"): NAV,
+    }
+    for name, text in files.items():
+        path = os.path.join(directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+    return os.path.join(directory, "base.html")
+
+
+def inline_layout():
+    return (
+        LAYOUT
+        .replace("{% include \"head.html\" %}", HEAD)
+        .replace("{% include \"footer.html\" %}", FOOTER)
+        .replace("{{> nav }}", NAV)
+    )
+
+
+def render_replace(layout, values):
+    return (
+        layout
+        .replace("{{ title }}", values["title"])
+        .replace("{{ content }}", values["content"])
+    )
+
+
+def render_regex(layout, values):
+    return VARIABLE_PATTERN.sub(lambda match: values[match.group(1)], layout)
+
+
+def timed(function, pages):
+    start = time.perf_counter()
+    for values in pages:
+        function(values)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    content = render_markdown(DOCS_PAGE)
+    pages = [
+        {"title": f"Page {i}", "content": content} for i in range(count)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        template_path = write_templates(directory)
+        loader = TemplateLoader()
+        start = time.perf_counter()
+        template = loader.load(template_path)
+        compile_time = time.perf_counter() - start
+
+        layout = inline_layout()
+        for values in pages[:10]:
+            expected = render_replace(layout, values)
+            if template.render(values) != expected:
+                raise SystemExit("Compiled template differs from replace.")
+            if render_regex(layout, values) != expected:
+                raise SystemExit("Regex template differs from replace.")
+
+        cases = [
+            ("str.replace", lambda values: render_replace(layout, values)),
+            ("regex", lambda values: render_regex(layout, values)),
+            (
+                "compiled",
+                lambda values: loader.load(template_path).render(values)
+            ),
+        ]
+        print(
+            f"{count} pages, {len(content)} bytes of content each, "
+            f"compiled once in {compile_time * 1e3:.2f} ms"
+        )
+        reference = None
+        for name, function in cases:
+            elapsed = timed(function, pages)
+            reference = reference or elapsed
+            print(
+                f"{name:<12}{elapsed * 1e3:>9.1f} ms"
+                f"{elapsed / count * 1e6:>9.2f} us/page"
+                f"{reference / elapsed:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
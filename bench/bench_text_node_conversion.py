@@ -0,0 +1,92 @@
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from corpora import build_corpus, corpus_names
+from parsed_document import parse_document, records_to_text_nodes
+from textnode import (
+    TextNode,
+    TextType,
+    interned_leaf_node,
+    text_node_to_html_node,
+    text_nodes_to_html_nodes
+)
+
+
+def per_node(streams):
+    return [[text_node_to_html_node(node) for node in s] for s in streams]
+
+
+def batched(streams):
+    return [text_nodes_to_html_nodes(stream) for stream in streams]
+
+
+def allocations(convert, streams):
+    interned_leaf_node.cache_clear()
+    tracemalloc.start()
+    html_streams = convert(streams)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    leaf_nodes = {id(node) for stream in html_streams for node in stream}
+    return len(leaf_nodes), size
+
+
+def best_time(function, streams, repeat=5):
+    interned_leaf_node.cache_clear()
+    return min(
+        timeit.repeat(lambda: function(streams), number=1, repeat=repeat)
+    )
+
+
+def corpus_streams(size):
+    for name in corpus_names():
+        document = parse_document(build_corpus(name, size))
+        yield name, [
+            records_to_text_nodes(stream)
+            for _, streams in document
+            for stream in streams
+        ]
+
+    count = size // 16
+    yield "unique", [
+        [TextNode(f"word {i}", TextType.TEXT)] for i in range(count)
+    ]
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1 << 20
+
+    print(f"{size} bytes per corpus")
+    print(
+        f"{'corpus':<10}{'nodes':>9}{'leaves':>9}{'saved':>9}"
+        f"{'memory':>10}{'batched':>10}{'time':>11}{'batched':>10}"
+        f"{'speedup':>10}"
+    )
+    for name, streams in corpus_streams(size):
+        if batched(streams) != per_node(streams):
+            raise SystemExit(f"{name} corpus converts differently.")
+
+        nodes = sum(len(stream) for stream in streams)
+        _, memory = allocations(per_node, streams)
+        leaves, batched_memory = allocations(batched, streams)
+        reference = best_time(per_node, streams)
+        batch = best_time(batched, streams)
+        print(
+            f"{name:<10}"
+            f"{nodes:>9}"
+            f"{leaves:>9}"
+            f"{1 - leaves / nodes:>8.1%}"
+            f"{memory / 1024:>7.0f} KB"
+            f"{batched_memory / 1024:>7.0f} KB"
+            f"{reference * 1e3:>8.1f} ms"
+            f"{batch * 1e3:>7.1f} ms"
+            f"{reference / batch:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import itertools
+
+
+PROSE_PARAGRAPH = (
+    "Static sites are built ahead of time, so every page can be served\n"
+    "straight from disk. The generator reads **markdown** files, turns\n"
+    "each block into _HTML_, and writes the result to the public\n"
+    "directory where any web server can pick it up."
+)
+
+LINK_PARAGRAPH = " ".join(
+    f"See [section {i}](https://example.com/docs/section-{i}.html) or the "
+    f"![figure {i}](https://example.com/img/figure-{i}.png) for details."
+    for i in range(12)
+)
+
+UNORDERED_LIST = "\n".join(
+    f"- item {i} with **bold** and `code` text" for i in range(25)
+)
+
+ORDERED_LIST = "\n".join(
+    f"{i}. step {i} follows [the guide](https://example.com/guide)"
+    for i in range(1, 26)
+)
+
+CODE_BLOCK = (
+    "```\n"
+    + "\n".join(
+        f"def handler_{i}(request):\n    return render(request, {i})"
+        for i in range(10)
+    )
+    + "\n```"
+)
+
+QUOTE_BLOCK = "\n".join(
+    f"> quoted line {i} with _emphasis_ and `inline code`" for i in range(8)
+)
+
+NESTED_LIST = "\n".join(
+    f"- **level {i}** _item_ `code {i}` [link](https://example.com/{i}) "
+    f"![icon](https://example.com/icons/{i}.png)"
+    for i in range(40)
+)
+
+DOCS_PAGE = "\n\n".join([
+    "# Getting started",
+    PROSE_PARAGRAPH,
+    "## Installation",
+    ORDERED_LIST,
+    CODE_BLOCK,
+    "## Configuration",
+    LINK_PARAGRAPH,
+    QUOTE_BLOCK,
+    UNORDERED_LIST,
+])
+
+CORPUS_BLOCKS = {
+    "prose": ["## A section heading", PROSE_PARAGRAPH, PROSE_PARAGRAPH],
+    "links": [LINK_PARAGRAPH],
+    "lists": [UNORDERED_LIST, ORDERED_LIST],
+    "code": ["### Example", CODE_BLOCK],
+    "nested": [QUOTE_BLOCK, NESTED_LIST],
+    "docs": [DOCS_PAGE],
+}
+
+
+def build_corpus(name, size):
+    blocks = []
+    length = 0
+    for block in itertools.cycle(CORPUS_BLOCKS[name]):
+        if length >= size:
+            break
+        blocks.append(block)
+        length += len(block) + 2
+    return "\n\n".join(blocks)
+
+
+def corpus_names():
+    return list(CORPUS_BLOCKS)
@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from block_markdown import BlockType, block_to_block_type, markdown_to_blocks
+from corpora import build_corpus, corpus_names
+from inline_markdown import text_to_textnodes
+from markdown_to_html import markdown_to_html_node
+from parentnode import ParentNode
+from textnode import text_node_to_html_node
+
+
+class Corpus:
+    def __init__(self, name, markdown):
+        self.name = name
+        self.markdown = markdown
+        self.size = len(markdown.encode("utf-8"))
+        self.blocks = markdown_to_blocks(markdown)
+        self.inline_blocks = [
+            block for block in self.blocks
+            if block_to_block_type(block) is not BlockType.CODE
+        ]
+        self.text_nodes = [
+            node
+            for block in self.inline_blocks
+            for node in text_to_textnodes(block)
+        ]
+        self.html_node = markdown_to_html_node(markdown)
+        self.html_node_count = count_html_nodes(self.html_node)
+
+
+def count_html_nodes(root):
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        if isinstance(node, ParentNode):
+            stack.extend(node.children)
+    return count
+
+
+def run_markdown_to_blocks(corpus):
+    blocks = markdown_to_blocks(corpus.markdown)
+    return blocks, len(blocks)
+
+
+def run_block_to_block_type(corpus):
+    block_types = [block_to_block_type(block) for block in corpus.blocks]
+    return block_types, len(block_types)
+
+
+def run_text_to_textnodes(corpus):
+    text_nodes = [text_to_textnodes(block) for block in corpus.inline_blocks]
+    return text_nodes, sum(map(len, text_nodes))
+
+
+def run_text_node_to_html_node(corpus):
+    html_nodes = [text_node_to_html_node(node) for node in corpus.text_nodes]
+    return html_nodes, len(html_nodes)
+
+
+def run_to_html(corpus):
+    return corpus.html_node.to_html(), corpus.html_node_count
+
+
+def run_end_to_end(corpus):
+    return (
+        markdown_to_html_node(corpus.markdown).to_html(),
+        corpus.html_node_count
+    )
+
+
+STAGES = {
+    "markdown_to_blocks": run_markdown_to_blocks,
+    "block_to_block_type": run_block_to_block_type,
+    "text_to_textnodes": run_text_to_textnodes,
+    "text_node_to_html_node": run_text_node_to_html_node,
+    "to_html": run_to_html,
+    "end_to_end": run_end_to_end,
+}
+
+
+def measure(stage, corpus, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result, nodes = stage(corpus)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del result
+
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    result, nodes = stage(corpus)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    allocated_blocks = sys.getallocatedblocks() - blocks_before
+    del result
+
+    return {
+        "seconds": best,
+        "mb_per_second": corpus.size / (1024 * 1024) / best,
+        "nodes": nodes,
+        "nodes_per_second": nodes / best,
+        "peak_bytes": peak,
+        "allocated_blocks": allocated_blocks,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(corpora, stages, size, repeat):
+    results = {}
+    for name in corpora:
+        corpus = Corpus(name, build_corpus(name, size))
+        results[name] = {
+            stage: measure(STAGES[stage], corpus, repeat) for stage in stages
+        }
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "size_bytes": size,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def print_results(report):
+    print(
+        f"{'corpus':<8}{'stage':<24}{'time':>10}{'MB/s':>9}"
+        f"{'nodes/s':>12}{'peak':>10}{'blocks':>10}"
+    )
+    for corpus, stages in report["results"].items():
+        for stage, result in stages.items():
+            print(
+                f"{corpus:<8}{stage:<24}"
+                f"{result['seconds'] * 1000:>8.1f}ms"
+                f"{result['mb_per_second']:>9.1f}"
+                f"{result['nodes_per_second']:>12,.0f}"
+                f"{result['peak_bytes'] / (1024 * 1024):>8.1f}MB"
+                f"{result['allocated_blocks']:>10,}"
+            )
+
+
+def compare_results(report, baseline, threshold):
+    regressions = []
+    for corpus, stages in report["results"].items():
+        for stage, result in stages.items():
+            previous = baseline["results"].get(corpus, {}).get(stage)
+            if previous is None:
+                continue
+
+            ratio = result["seconds"] / previous["seconds"]
+            marker = ""
+            if ratio > 1 + threshold:
+                marker = "  REGRESSION"
+                regressions.append((corpus, stage, ratio))
+            print(f"{corpus:<8}{stage:<24}{ratio:>8.2f}x{marker}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark each stage of the markdown to HTML pipeline."
+    )
+    parser.add_argument(
+        "--size-mb", type=float, default=1, help="size of each corpus"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--corpus", action="append", choices=corpus_names(), dest="corpora"
+    )
+    parser.add_argument(
+        "--stage", action="append", choices=list(STAGES), dest="stages"
+    )
+    parser.add_argument("--output", help="save results to this JSON file")
+    parser.add_argument(
+        "--compare", help="compare against results saved by --output"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown ratio above which a stage counts as a regression"
+    )
+    args = parser.parse_args()
+
+    report = run_suite(
+        args.corpora or corpus_names(),
+        args.stages or list(STAGES),
+        int(args.size_mb * 1024 * 1024),
+        args.repeat
+    )
+    print_results(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print(f"\nCompared with {baseline.get('commit') or args.compare}:")
+        regressions = compare_results(report, baseline, args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
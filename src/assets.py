@@ -0,0 +1,344 @@
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from leafnode import LeafNode
+from parentnode import ParentNode
+
+
+ASSET_MANIFEST_VERSION = 1
+FINGERPRINT_LENGTH = 8
+COPY_CHUNK_SIZE = 1 << 20
+URL_ATTRIBUTES = {"a": "href", "img": "src"}
+ASSET_EXCLUDE_PATTERNS = (".*", "_*")
+FINGERPRINT_EXTENSIONS = frozenset([
+    ".avif", ".gif", ".jpeg", ".jpg", ".png", ".svg", ".webp"
+])
+
+
+def is_excluded(relative_path, patterns):
+    name = posixpath.basename(relative_path)
+    return any(
+        fnmatch.fnmatchcase(name, pattern)
+        or fnmatch.fnmatchcase(relative_path, pattern)
+        for pattern in patterns
+    )
+
+
+def find_assets(content_dir, exclude=ASSET_EXCLUDE_PATTERNS):
+    for dirpath, dirnames, filenames in os.walk(content_dir):
+        directory = os.path.relpath(dirpath, content_dir).replace(os.sep, "/")
+        prefix = "" if directory == "." else f"{directory}/"
+        dirnames[:] = sorted(
+            name for name in dirnames
+            if not is_excluded(prefix + name, exclude)
+        )
+        for filename in sorted(filenames):
+            relative_path = prefix + filename
+            if not (
+                filename.endswith(".md")
+                or is_excluded(relative_path, exclude)
+            ):
+                yield relative_path
+
+
+def content_patterns(paths, content_dir):
+    patterns = []
+    for path in paths:
+        relative_path = os.path.relpath(path, content_dir)
+        if relative_path.split(os.sep)[0] != os.pardir:
+            patterns.append(glob.escape(relative_path.replace(os.sep, "/")))
+    return tuple(patterns)
+
+
+def file_digest(path):
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def is_fingerprinted(relative_path):
+    extension = posixpath.splitext(relative_path)[1].lower()
+    return extension in FINGERPRINT_EXTENSIONS
+
+
+def fingerprint_path(relative_path, digest):
+    root, extension = posixpath.splitext(relative_path)
+    return f"{root}.{digest[:FINGERPRINT_LENGTH]}{extension}"
+
+
+def copy_range(source_fd, output_fd, size):
+    copied = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                sent = os.copy_file_range(source_fd, output_fd, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+            return copied
+        except OSError:
+            if copied:
+                raise
+
+    if hasattr(os, "sendfile"):
+        try:
+            while copied < size:
+                sent = os.sendfile(output_fd, source_fd, copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+            os.lseek(output_fd, copied, os.SEEK_SET)
+            return copied
+        except OSError:
+            if copied:
+                raise
+
+    with open(source_fd, "rb", closefd=False) as source:
+        with open(output_fd, "wb", closefd=False) as output:
+            shutil.copyfileobj(source, output, COPY_CHUNK_SIZE)
+            return output.tell()
+
+
+def copy_file(source_path, output_path):
+    temp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(source_path, "rb") as source:
+            size = os.fstat(source.fileno()).st_size
+            with open(temp_path, "wb") as output:
+                copied = copy_range(source.fileno(), output.fileno(), size)
+        shutil.copystat(source_path, temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return copied
+
+
+class AssetReport:
+    def __init__(self):
+        self.assets = 0
+        self.hashed = 0
+        self.copied = 0
+        self.copied_bytes = 0
+        self.removed = 0
+
+    def __repr__(self):
+        return (
+            f"AssetReport(assets={self.assets}, hashed={self.hashed}, "
+            f"copied={self.copied}, removed={self.removed})"
+        )
+
+
+class AssetPipeline:
+    def __init__(
+        self,
+        content_dir,
+        public_dir,
+        manifest_path=None,
+        fingerprint=False,
+        threads=4,
+        exclude=ASSET_EXCLUDE_PATTERNS
+    ):
+        self.content_dir = content_dir
+        self.public_dir = public_dir
+        self.manifest_path = manifest_path
+        self.fingerprint = fingerprint
+        self.threads = threads
+        self.exclude = tuple(exclude)
+        self.lock = threading.Lock()
+        self.assets = self.load_manifest()
+
+    def __repr__(self):
+        return (
+            f"AssetPipeline({self.content_dir}, {self.public_dir}, "
+            f"{len(self.assets)} assets)"
+        )
+
+    def load_manifest(self):
+        if self.manifest_path is None:
+            return {}
+        try:
+            with open(self.manifest_path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+        if data.get("version") != ASSET_MANIFEST_VERSION:
+            return {}
+        return {
+            relative_path: tuple(entry)
+            for relative_path, entry in data.get("assets", {}).items()
+        }
+
+    def save_manifest(self):
+        if self.manifest_path is None:
+            return
+
+        manifest_dir = os.path.dirname(self.manifest_path)
+        os.makedirs(manifest_dir or ".", exist_ok=True)
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": ASSET_MANIFEST_VERSION, "assets": self.assets},
+                file,
+                sort_keys=True
+            )
+        os.replace(temp_path, self.manifest_path)
+
+    def source_path(self, relative_path):
+        return os.path.join(self.content_dir, *relative_path.split("/"))
+
+    def output_path(self, relative_path):
+        return os.path.join(self.public_dir, *relative_path.split("/"))
+
+    def process(self, relative_path, report):
+        source_path = self.source_path(relative_path)
+        stat = os.stat(source_path)
+        source_stat = (stat.st_size, stat.st_mtime_ns)
+        previous = self.assets.get(relative_path)
+        digest = None
+        if previous is not None and previous[:2] == source_stat:
+            digest = previous[2]
+
+        if self.fingerprint and is_fingerprinted(relative_path):
+            if digest is None:
+                digest = self.hash(source_path, report)
+            output_relative_path = fingerprint_path(relative_path, digest)
+            copy = not os.path.exists(self.output_path(output_relative_path))
+        else:
+            output_relative_path = relative_path
+            output_path = self.output_path(relative_path)
+            output_stat = self.output_stat(relative_path)
+            copy = output_stat != source_stat
+            if copy and output_stat and output_stat[0] == stat.st_size:
+                digest = self.hash(source_path, report)
+                if self.hash(output_path, report) == digest:
+                    shutil.copystat(source_path, output_path)
+                    copy = False
+
+        if copy:
+            output_path = self.output_path(output_relative_path)
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            copied = copy_file(source_path, output_path)
+            with self.lock:
+                report.copied += 1
+                report.copied_bytes += copied
+
+        if previous is not None and previous[3] != output_relative_path:
+            self.remove_output(previous[3], report)
+        return relative_path, source_stat + (digest, output_relative_path)
+
+    def hash(self, source_path, report):
+        digest = file_digest(source_path)
+        with self.lock:
+            report.hashed += 1
+        return digest
+
+    def output_stat(self, output_relative_path):
+        try:
+            stat = os.stat(self.output_path(output_relative_path))
+        except FileNotFoundError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def remove_output(self, output_relative_path, report):
+        try:
+            os.remove(self.output_path(output_relative_path))
+        except FileNotFoundError:
+            return
+        with self.lock:
+            report.removed += 1
+
+    def run(self):
+        report = AssetReport()
+        relative_paths = list(find_assets(self.content_dir, self.exclude))
+        report.assets = len(relative_paths)
+
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            entries = dict(executor.map(
+                lambda relative_path: self.process(relative_path, report),
+                relative_paths
+            ))
+
+        for relative_path, entry in self.assets.items():
+            if relative_path not in entries:
+                self.remove_output(entry[3], report)
+        self.assets = entries
+        self.save_manifest()
+        return report
+
+    def outputs(self):
+        return [entry[3] for entry in self.assets.values()]
+
+    def urls(self):
+        return {
+            relative_path: entry[3]
+            for relative_path, entry in self.assets.items()
+            if entry[3] != relative_path
+        }
+
+    def rewriter(self):
+        return AssetRewriter(self.content_dir, self.urls())
+
+
+class AssetRewriter:
+    def __init__(self, content_dir, urls):
+        self.content_dir = content_dir
+        self.urls = urls
+        self.digest = hashlib.sha256(
+            json.dumps(urls, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def __repr__(self):
+        return f"AssetRewriter({self.content_dir}, {len(self.urls)} urls)"
+
+    def rewrite_url(self, url, source_path):
+        parts = urlsplit(url)
+        if parts.scheme or parts.netloc or not parts.path:
+            return url
+
+        page_dir = posixpath.dirname(
+            os.path.relpath(source_path, self.content_dir).replace(os.sep, "/")
+        )
+        if parts.path.startswith("/"):
+            relative_path = posixpath.normpath(parts.path.lstrip("/"))
+        else:
+            relative_path = posixpath.normpath(
+                posixpath.join(page_dir, parts.path)
+            )
+        output_relative_path = self.urls.get(relative_path)
+        if output_relative_path is None:
+            return url
+
+        if parts.path.startswith("/"):
+            path = "/" + output_relative_path
+        else:
+            path = posixpath.relpath(output_relative_path, page_dir or ".")
+        suffix = url[len(parts.path):] if url.startswith(parts.path) else ""
+        return path + suffix
+
+    def rewrite_node(self, node, source_path):
+        if isinstance(node, ParentNode):
+            return ParentNode(
+                node.tag,
+                [
+                    self.rewrite_node(child, source_path)
+                    for child in node.children
+                ],
+                node.props
+            )
+        attribute = URL_ATTRIBUTES.get(node.tag)
+        if attribute is not None and node.props and attribute in node.props:
+            props = dict(node.props)
+            props[attribute] = self.rewrite_url(props[attribute], source_path)
+            return LeafNode(node.tag, node.value, props)
+        return node
@@ -0,0 +1,91 @@
+import hashlib
+import os
+import sys
+
+from collections import OrderedDict
+
+from build_manifest import GENERATOR_VERSION
+
+
+class BlockCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (
+            f"BlockCache({len(self.entries)} blocks, {self.size} bytes, "
+            f"hit ratio {self.hit_ratio():.2f})"
+        )
+
+    def __len__(self):
+        return len(self.entries)
+
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, block):
+        html = self.entries.get(block)
+        if html is not None:
+            self.entries.move_to_end(block)
+            self.hits += 1
+            return html
+
+        if self.directory is not None:
+            html = self.load(block)
+            if html is not None:
+                self.remember(block, html)
+                self.hits += 1
+                self.disk_hits += 1
+                return html
+
+        self.misses += 1
+        return None
+
+    def put(self, block, html):
+        self.remember(block, html)
+        if self.directory is not None:
+            self.store(block, html)
+
+    def remember(self, block, html):
+        entry_size = sys.getsizeof(block) + sys.getsizeof(html)
+        if entry_size > self.max_bytes:
+            return
+
+        previous = self.entries.pop(block, None)
+        if previous is not None:
+            self.size -= sys.getsizeof(block) + sys.getsizeof(previous)
+        self.entries[block] = html
+        self.size += entry_size
+
+        while self.size > self.max_bytes:
+            old_block, old_html = self.entries.popitem(last=False)
+            self.size -= sys.getsizeof(old_block) + sys.getsizeof(old_html)
+
+    def path(self, block):
+        digest = hashlib.sha256()
+        digest.update(GENERATOR_VERSION.encode("utf-8") + b"\0")
+        digest.update(block.encode("utf-8"))
+        key = digest.hexdigest()
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def load(self, block):
+        try:
+            with open(self.path(block), encoding="utf-8") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, block, html):
+        path = self.path(block)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(html)
+        os.replace(temp_path, path)
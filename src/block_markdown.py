@@ -1,7 +1,14 @@
+import codecs
+import functools
 import re
 
 from enum import Enum
 
+from inline_markdown import text_to_textnodes
+
+
+HEADER_PATTERN = re.compile(r"(#{1,6})\s(.+)$")
+
 
 class BlockType(Enum):
     HEADER = "header"
@@ -22,37 +29,114 @@ def markdown_to_blocks(markdown):
     return list(filtered_blocks)
 
 
+def extract_title(markdown):
+    for block in markdown_to_blocks(markdown):
+        if (
+            block.startswith("# ")
+            and block_to_block_type(block) is BlockType.HEADER
+        ):
+            title = "".join([
+                text_node.text for text_node in text_to_textnodes(block[2:])
+            ])
+            return title.strip() or None
+    return None
+
+
+def iter_markdown_blocks(stream, chunk_size=1 << 16, encoding="utf-8"):
+    decoder = None
+    pending = []
+    at_start = True
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if not isinstance(chunk, str):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)()
+            chunk = decoder.decode(chunk)
+
+        if at_start:
+            chunk = chunk.lstrip("\n")
+            if not chunk:
+                continue
+            at_start = False
+
+        blocks = []
+        if pending and pending[-1].endswith("\n") and chunk.startswith("\n"):
+            pending[-1] = pending[-1][:-1]
+            chunk = chunk[1:]
+            blocks.append("".join(pending))
+            pending = []
+
+        pieces = chunk.split("\n\n")
+        if len(pieces) > 1:
+            pending.append(pieces[0])
+            blocks.append("".join(pending))
+            blocks.extend(pieces[1:-1])
+            pending = []
+        if pieces[-1]:
+            pending.append(pieces[-1])
+
+        for block in blocks:
+            if block and not block.isspace():
+                yield block
+
+    if decoder is not None:
+        pending.append(decoder.decode(b"", final=True))
+    block = "".join(pending).rstrip("\n")
+    if at_start:
+        block = block.lstrip("\n")
+    if block and not block.isspace():
+        yield block
+
+
+@functools.lru_cache(maxsize=64)
+def ordered_item_prefixes(count):
+    return [f"{number}. " for number in range(1, count + 1)]
+
+
 def block_to_block_type(block):
     if not block:
         raise ValueError("Block cannot be empty.")
-    
-    if re.match(r"^(#{1,6})\s(.+)$", block):
-        return BlockType.HEADER
-    
-    if block[:3] == "```" and block[-3:] == "```":
-        return BlockType.CODE
-    
-    if block.startswith(">"):
+
+    first_character = block[0]
+    if first_character == "#":
+        if HEADER_PATTERN.match(block):
+            return BlockType.HEADER
+        return BlockType.PARAGRAPH
+
+    if first_character == "`":
+        if block.startswith("```") and block.endswith("```"):
+            return BlockType.CODE
+        return BlockType.PARAGRAPH
+
+    if first_character == ">":
         if "\n" in block:
             for line in block.split("\n"):
                 if ">" not in line:
                     return BlockType.PARAGRAPH
         return BlockType.QUOTE
-    
-    if block.startswith("- "):
-        if "\n" in block:
-            for line in block.split("\n"):
-                if not line.startswith("- "):
-                    return BlockType.PARAGRAPH
+
+    if first_character == "-":
+        if not block.startswith("- "):
+            return BlockType.PARAGRAPH
+        if block.count("\n- ") != block.count("\n"):
+            return BlockType.PARAGRAPH
         return BlockType.UNORDERED_LIST
-    
-    if block.startswith("1. "):
+
+    if first_character == "1":
+        if not block.startswith("1. "):
+            return BlockType.PARAGRAPH
         if "\n" in block:
-            item_number = 1
-            for line in block.split("\n"):
-                if not line.startswith(f"{item_number}. "):
-                    return BlockType.PARAGRAPH
-                item_number += 1
+            lines = block.split("\n")
+            prefixes = ordered_item_prefixes(len(lines))
+            if not all(map(str.startswith, lines, prefixes)):
+                return BlockType.PARAGRAPH
         return BlockType.ORDERED_LIST
-    
+
     return BlockType.PARAGRAPH
+
+
+def classify_blocks(blocks):
+    return list(map(block_to_block_type, blocks))
@@ -0,0 +1,638 @@
+import collections
+import contextlib
+import functools
+import itertools
+import os
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html import escape
+
+import parsed_document
+import profiling
+
+from assets import ASSET_EXCLUDE_PATTERNS, AssetPipeline, content_patterns
+from block_cache import BlockCache
+from block_markdown import extract_title
+from build_manifest import BuildManifest, page_cache_key
+from feeds import FeedGenerator, PageEntry
+from front_matter import front_matter_body, split_front_matter
+from link_graph import LinkGraph, page_links
+from markdown_to_html import (
+    parse_markdown_blocks,
+    parsed_title,
+    render_cached_parsed_blocks,
+    render_markdown,
+    render_parsed_blocks
+)
+from metadata_index import TAGS_DIRNAME, MetadataIndex, listing_pages
+from output_writer import OutputWriter
+from parsed_document import (
+    DocumentCache,
+    document_blocks,
+    source_digest
+)
+from search_index import (
+    DEFAULT_MEMORY_BUDGET,
+    SEARCH_DIRNAME,
+    SearchIndexBuilder,
+    TermCache,
+    page_terms
+)
+from template import TemplateLoader
+
+
+MANIFEST_FILENAME = "manifest.json"
+BLOCK_CACHE_DIRNAME = "blocks"
+DOCUMENT_CACHE_DIRNAME = "documents"
+TERM_CACHE_DIRNAME = "terms"
+ASSET_MANIFEST_FILENAME = "assets.json"
+LINK_GRAPH_FILENAME = "links.json"
+FEED_STATE_FILENAME = "feeds.json"
+METADATA_INDEX_FILENAME = "metadata.json"
+MAX_CHUNKSIZE = 64
+CHUNKS_PER_WORKER = 2
+
+worker_block_cache = None
+worker_document_cache = None
+worker_asset_rewriter = None
+worker_template = None
+worker_search_index = False
+worker_check_links = False
+worker_page_metadata = False
+worker_term_cache = None
+
+
+class PageResult:
+    __slots__ = (
+        "key",
+        "rendered",
+        "html",
+        "profile",
+        "block_hits",
+        "block_misses",
+        "document_hits",
+        "document_misses",
+        "title",
+        "terms",
+        "links",
+        "updated"
+    )
+
+    def __init__(
+        self,
+        key,
+        rendered=False,
+        html=None,
+        profile=None,
+        block_hits=0,
+        block_misses=0,
+        document_hits=0,
+        document_misses=0,
+        title=None,
+        terms=None,
+        links=None,
+        updated=None
+    ):
+        self.key = key
+        self.rendered = rendered
+        self.html = html
+        self.profile = profile
+        self.block_hits = block_hits
+        self.block_misses = block_misses
+        self.document_hits = document_hits
+        self.document_misses = document_misses
+        self.title = title
+        self.terms = terms
+        self.links = links
+        self.updated = updated
+
+    def __repr__(self):
+        return (
+            f"PageResult({self.key}, rendered={self.rendered})"
+        )
+
+
+class BuildReport:
+    def __init__(self):
+        self.pages = 0
+        self.hits = 0
+        self.misses = 0
+        self.written = 0
+        self.written_bytes = 0
+        self.skipped = 0
+        self.skipped_bytes = 0
+        self.block_hits = 0
+        self.block_misses = 0
+        self.document_hits = 0
+        self.document_misses = 0
+        self.assets = None
+        self.search = None
+        self.links = None
+        self.feeds = None
+        self.metadata_reads = 0
+        self.listings = 0
+        self.tags = 0
+
+    def __repr__(self):
+        return (
+            f"BuildReport(pages={self.pages}, hits={self.hits}, "
+            f"misses={self.misses}, written={self.written})"
+        )
+
+    def add(self, result):
+        self.pages += 1
+        if result.rendered:
+            self.misses += 1
+        else:
+            self.hits += 1
+        self.block_hits += result.block_hits
+        self.block_misses += result.block_misses
+        self.document_hits += result.document_hits
+        self.document_misses += result.document_misses
+
+    def add_writes(self, writer):
+        self.written += writer.written
+        self.written_bytes += writer.written_bytes
+        self.skipped += writer.skipped
+        self.skipped_bytes += writer.skipped_bytes
+
+    def block_hit_ratio(self):
+        lookups = self.block_hits + self.block_misses
+        return self.block_hits / lookups if lookups else 0.0
+
+
+def render_page(markdown, block_cache=None, asset_url=None):
+    return render_markdown(
+        split_front_matter(markdown)[1], block_cache, asset_url
+    )
+
+
+def page_title(markdown, source_path, parsed_blocks=None):
+    metadata, body = split_front_matter(markdown)
+    title = metadata.get("title")
+    if not title:
+        if parsed_blocks is not None:
+            title = parsed_title(parsed_blocks)
+        else:
+            title = extract_title(body)
+    if not title:
+        title = os.path.splitext(os.path.basename(source_path))[0]
+    return title
+
+
+def apply_template(template, html, title):
+    return template.render({"title": escape(title), "content": html})
+
+
+def find_pages(content_dir):
+    for dirpath, dirnames, filenames in os.walk(content_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith(".md"):
+                yield os.path.join(dirpath, filename)
+
+
+def page_output_path(source_path, content_dir, public_dir):
+    relative_path = os.path.relpath(source_path, content_dir)
+    return os.path.join(
+        public_dir, os.path.splitext(relative_path)[0] + ".html"
+    )
+
+
+def page_url(output_path, public_dir):
+    return os.path.relpath(output_path, public_dir).replace(os.sep, "/")
+
+
+def build_page(source_path, output_path, cached_key=None, cached_title=None):
+    try:
+        return build_source_page(
+            source_path, output_path, cached_key, cached_title
+        )
+    except ValueError as error:
+        raise ValueError(f"{source_path}: {error}") from None
+
+
+def build_source_page(source_path, output_path, cached_key, cached_title):
+    with open(source_path, "rb") as file:
+        source = file.read()
+        updated = None
+        if worker_page_metadata:
+            updated = os.fstat(file.fileno()).st_mtime
+
+    asset_rewriter = worker_asset_rewriter
+    asset_hash = asset_rewriter.digest if asset_rewriter is not None else ""
+    template = worker_template
+    template_hash = template.digest if template is not None else ""
+    key = page_cache_key(source, template_hash, asset_hash)
+    markdown = source.decode("utf-8")
+
+    title = terms = digest = None
+    term_cache = worker_term_cache
+    if worker_search_index and term_cache is not None:
+        digest = source_digest(source)
+        entry = term_cache.get(digest)
+        if entry is not None:
+            title, terms = entry
+
+    cached = key == cached_key and os.path.exists(output_path)
+    if cached and (terms is not None or not worker_search_index):
+        if title is None and worker_page_metadata:
+            title = cached_title
+            if title is None:
+                title = page_title(markdown, source_path)
+        return PageResult(key, title=title, terms=terms, updated=updated)
+
+    block_cache = worker_block_cache
+    if block_cache is not None:
+        hits, misses = block_cache.hits, block_cache.misses
+    document_cache = worker_document_cache
+    if document_cache is not None:
+        loads, parses = document_cache.hits, document_cache.misses
+
+    asset_url = None
+    if asset_rewriter is not None and asset_rewriter.urls:
+        asset_url = functools.partial(
+            asset_rewriter.rewrite_url, source_path=source_path
+        )
+
+    profiler = None if cached else profiling.active_profiler
+    with (
+        contextlib.nullcontext() if profiler is None
+        else profiler.page(source_path)
+    ) as page_profile:
+        document = blocks = parsed_blocks = links = html = None
+        if document_cache is not None:
+            document = document_cache.parse(front_matter_body(source))
+        if (
+            terms is None and worker_search_index
+            or worker_check_links and not cached
+        ):
+            if document is not None:
+                parsed_blocks = document_blocks(document)
+            else:
+                blocks, parsed_blocks = parse_markdown_blocks(
+                    split_front_matter(markdown)[1]
+                )
+        if terms is None and worker_search_index:
+            terms = page_terms(parsed_blocks)
+            title = page_title(markdown, source_path, parsed_blocks)
+            if term_cache is not None:
+                term_cache.put(digest, title, terms)
+        if worker_check_links and not cached:
+            links = page_links(parsed_blocks, asset_url)
+
+        if not cached:
+            if document is not None:
+                html = parsed_document.render_document(document, asset_url)
+            elif parsed_blocks is not None and block_cache is None:
+                html = render_parsed_blocks(parsed_blocks, asset_url)
+            elif parsed_blocks is not None:
+                html = render_cached_parsed_blocks(
+                    blocks, parsed_blocks, block_cache, asset_url
+                )
+            else:
+                html = render_page(markdown, block_cache, asset_url)
+        if title is None and (template is not None or worker_page_metadata):
+            title = page_title(markdown, source_path, parsed_blocks)
+        if html is not None and template is not None:
+            html = apply_template(template, html, title)
+
+    result = PageResult(
+        key,
+        not cached,
+        html.encode("utf-8") if html is not None else None,
+        page_profile,
+        title=title,
+        terms=terms,
+        links=links,
+        updated=updated
+    )
+    if document_cache is not None:
+        result.document_hits = document_cache.hits - loads
+        result.document_misses = document_cache.misses - parses
+    if block_cache is not None:
+        result.block_hits = block_cache.hits - hits
+        result.block_misses = block_cache.misses - misses
+    return result
+
+
+def init_worker(
+    trace=None,
+    block_cache_bytes=0,
+    block_cache_dir=None,
+    document_cache_dir=None,
+    asset_rewriter=None,
+    template=None,
+    search_index=False,
+    check_links=False,
+    page_metadata=False,
+    term_cache_dir=None
+):
+    global worker_block_cache, worker_document_cache, worker_asset_rewriter
+    global worker_template, worker_search_index, worker_check_links
+    global worker_page_metadata, worker_term_cache
+    if trace is not None:
+        profiling.start_worker_profiler(trace)
+    if block_cache_bytes:
+        worker_block_cache = BlockCache(block_cache_bytes, block_cache_dir)
+    if document_cache_dir is not None:
+        worker_document_cache = DocumentCache(document_cache_dir)
+    if term_cache_dir is not None:
+        worker_term_cache = TermCache(term_cache_dir)
+    worker_asset_rewriter = asset_rewriter
+    worker_template = template
+    worker_search_index = search_index
+    worker_check_links = check_links
+    worker_page_metadata = page_metadata
+
+
+def reset_worker():
+    global worker_block_cache, worker_document_cache, worker_asset_rewriter
+    global worker_template, worker_search_index, worker_check_links
+    global worker_page_metadata, worker_term_cache
+    worker_block_cache = None
+    worker_document_cache = None
+    worker_asset_rewriter = None
+    worker_template = None
+    worker_search_index = False
+    worker_check_links = False
+    worker_page_metadata = False
+    worker_term_cache = None
+
+
+def build_site(
+    content_dir,
+    public_dir,
+    workers=None,
+    chunksize=None,
+    cache_dir=None,
+    force=False,
+    profiler=None,
+    block_cache_bytes=0,
+    shared_block_cache=False,
+    parse_cache=False,
+    writer_threads=4,
+    fingerprint_assets=False,
+    asset_threads=4,
+    exclude_assets=(),
+    template_path=None,
+    search_index=False,
+    search_memory_budget=DEFAULT_MEMORY_BUDGET,
+    check_links=False,
+    site_url=None,
+    site_title="",
+    listings=False
+):
+    source_paths = list(find_pages(content_dir))
+    pages = [
+        os.path.relpath(source_path, content_dir)
+        for source_path in source_paths
+    ]
+    output_paths = [
+        page_output_path(source_path, content_dir, public_dir)
+        for source_path in source_paths
+    ]
+
+    manifest = BuildManifest()
+    if cache_dir is not None:
+        manifest = BuildManifest.load(
+            os.path.join(cache_dir, MANIFEST_FILENAME)
+        )
+    cached_keys = [None if force else manifest.get(page) for page in pages]
+    urls = [page_url(output_path, public_dir) for output_path in output_paths]
+
+    link_graph = None
+    if check_links:
+        link_graph = LinkGraph()
+        if cache_dir is not None:
+            link_graph = LinkGraph.load(
+                os.path.join(cache_dir, LINK_GRAPH_FILENAME)
+            )
+        cached_keys = [
+            cached_key if link_graph.get_key(url) == cached_key else None
+            for url, cached_key in zip(urls, cached_keys)
+        ]
+
+    template = None
+    if template_path is not None:
+        template = TemplateLoader().load(template_path)
+
+    asset_manifest_path = None
+    if cache_dir is not None:
+        asset_manifest_path = os.path.join(cache_dir, ASSET_MANIFEST_FILENAME)
+    asset_exclude = ASSET_EXCLUDE_PATTERNS + tuple(exclude_assets)
+    if template is not None:
+        asset_exclude += content_patterns(template.dependencies, content_dir)
+    asset_pipeline = AssetPipeline(
+        content_dir,
+        public_dir,
+        asset_manifest_path,
+        fingerprint_assets,
+        asset_threads,
+        asset_exclude
+    )
+
+    block_cache_dir = None
+    if shared_block_cache and cache_dir is not None:
+        block_cache_dir = os.path.join(cache_dir, BLOCK_CACHE_DIRNAME)
+    document_cache_dir = None
+    if parse_cache and cache_dir is not None:
+        document_cache_dir = os.path.join(cache_dir, DOCUMENT_CACHE_DIRNAME)
+    term_cache_dir = None
+    if search_index and cache_dir is not None:
+        term_cache_dir = os.path.join(cache_dir, TERM_CACHE_DIRNAME)
+
+    search_builder = None
+    if search_index:
+        search_builder = SearchIndexBuilder(
+            os.path.join(public_dir, SEARCH_DIRNAME), search_memory_budget
+        )
+
+    metadata_index = None
+    if listings:
+        metadata_index = MetadataIndex()
+        if cache_dir is not None:
+            metadata_index = MetadataIndex.load(
+                os.path.join(cache_dir, METADATA_INDEX_FILENAME)
+            )
+        metadata_index.update(content_dir, source_paths)
+
+    feed_generator = None
+    page_entries = []
+    listings = []
+    cached_titles = None
+    if site_url is not None:
+        feed_state_path = None
+        if cache_dir is not None:
+            feed_state_path = os.path.join(cache_dir, FEED_STATE_FILENAME)
+        feed_generator = FeedGenerator(
+            public_dir, site_url, site_title, feed_state_path
+        )
+        cached_titles = [
+            feed_generator.title(url, cached_key)
+            for url, cached_key in zip(urls, cached_keys)
+        ]
+
+    report = BuildReport()
+    try:
+        with (
+            ThreadPoolExecutor(max_workers=1) as asset_executor,
+            OutputWriter(writer_threads) as writer
+        ):
+            assets = asset_executor.submit(asset_pipeline.run)
+            asset_rewriter = None
+            if fingerprint_assets:
+                assets.result()
+                asset_rewriter = asset_pipeline.rewriter()
+
+            worker_args = (
+                profiler.trace if profiler is not None else None,
+                block_cache_bytes,
+                block_cache_dir,
+                document_cache_dir,
+                asset_rewriter,
+                template,
+                search_index,
+                check_links,
+                feed_generator is not None,
+                term_cache_dir
+            )
+            if workers == 1:
+                init_worker(*worker_args)
+
+            writer.make_directories(output_paths)
+            results = build_pages(
+                source_paths,
+                output_paths,
+                cached_keys,
+                workers,
+                chunksize,
+                worker_args,
+                cached_titles
+            )
+            for page, url, output_path, result in zip(
+                pages, urls, output_paths, results
+            ):
+                if result.html is not None:
+                    writer.write(output_path, result.html)
+                    result.html = None
+                if search_builder is not None:
+                    search_builder.add_page(
+                        url,
+                        result.title,
+                        result.terms
+                    )
+                    result.terms = None
+                if feed_generator is not None:
+                    page_entries.append(PageEntry(
+                        url, result.title, result.updated, result.key
+                    ))
+                if result.links is not None:
+                    link_graph.set_links(url, result.key, result.links)
+                manifest.set(page, result.key)
+                report.add(result)
+                if result.profile is not None:
+                    profiler.add_page(result.profile)
+            if search_builder is not None:
+                report.search = search_builder.write()
+            if feed_generator is not None:
+                report.feeds = feed_generator.generate(page_entries)
+            if metadata_index is not None:
+                report.metadata_reads = metadata_index.reads
+                report.tags = len(metadata_index.tags())
+                listings = write_listings(
+                    metadata_index, public_dir, set(urls), template, writer
+                )
+                report.listings = len(listings)
+            report.assets = assets.result()
+            if link_graph is not None:
+                link_graph.prune(urls)
+                report.links = link_graph.check(
+                    urls + listings + asset_pipeline.outputs()
+                )
+        report.add_writes(writer)
+    finally:
+        if profiling.active_profiler is not None:
+            profiling.active_profiler.disable()
+        reset_worker()
+        if search_builder is not None:
+            search_builder.cleanup()
+
+    manifest.prune(pages)
+    manifest.save()
+    if link_graph is not None:
+        link_graph.save()
+    if metadata_index is not None:
+        metadata_index.save()
+    return report
+
+
+def write_listings(metadata_index, public_dir, urls, template, writer):
+    listings = {
+        path: listing
+        for path, listing in listing_pages(metadata_index).items()
+        if path not in urls
+    }
+    output_paths = {
+        path: os.path.join(public_dir, *path.split("/")) for path in listings
+    }
+    writer.make_directories(output_paths.values())
+    for path, (title, node) in listings.items():
+        html = node.to_html()
+        if template is not None:
+            html = apply_template(template, html, title)
+        writer.write(output_paths[path], html.encode("utf-8"))
+
+    tags_dir = os.path.join(public_dir, TAGS_DIRNAME)
+    if os.path.isdir(tags_dir):
+        for filename in os.listdir(tags_dir):
+            path = f"{TAGS_DIRNAME}/{filename}"
+            if (
+                filename.endswith(".html")
+                and path not in listings
+                and path not in urls
+            ):
+                os.remove(os.path.join(tags_dir, filename))
+    return list(listings)
+
+
+def build_chunk(pages):
+    return [build_page(*page) for page in pages]
+
+
+def build_pages(
+    source_paths,
+    output_paths,
+    cached_keys,
+    workers=None,
+    chunksize=None,
+    worker_args=(),
+    cached_titles=None
+):
+    if cached_titles is None:
+        cached_titles = [None] * len(source_paths)
+    if workers == 1:
+        yield from map(
+            build_page, source_paths, output_paths, cached_keys, cached_titles
+        )
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(
+            1, min(len(source_paths) // (workers * 4), MAX_CHUNKSIZE)
+        )
+    pages = zip(source_paths, output_paths, cached_keys, cached_titles)
+    chunks = iter(lambda: list(itertools.islice(pages, chunksize)), [])
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=worker_args
+    ) as executor:
+        pending = collections.deque(
+            executor.submit(build_chunk, chunk)
+            for chunk in itertools.islice(chunks, workers * CHUNKS_PER_WORKER)
+        )
+        while pending:
+            results = pending.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(executor.submit(build_chunk, chunk))
+            yield from results
@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+
+
+GENERATOR_VERSION = "1"
+MANIFEST_VERSION = 1
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def page_cache_key(source, template_hash="", asset_hash=""):
+    digest = hashlib.sha256()
+    digest.update(GENERATOR_VERSION.encode("utf-8") + b"\0")
+    digest.update(template_hash.encode("utf-8") + b"\0")
+    digest.update(asset_hash.encode("utf-8") + b"\0")
+    digest.update(source)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    def __init__(self, path=None, pages=None):
+        self.path = path
+        self.pages = pages if pages is not None else {}
+
+    def __repr__(self):
+        return f"BuildManifest({self.path}, {len(self.pages)} pages)"
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+
+        if data.get("version") != MANIFEST_VERSION:
+            return cls(path)
+        return cls(path, data.get("pages", {}))
+
+    def get(self, page):
+        return self.pages.get(page)
+
+    def set(self, page, key):
+        self.pages[page] = key
+
+    def prune(self, pages):
+        pages = set(pages)
+        for page in list(self.pages):
+            if page not in pages:
+                del self.pages[page]
+
+    def save(self):
+        if self.path is None:
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": MANIFEST_VERSION, "pages": self.pages},
+                file,
+                sort_keys=True
+            )
+        os.replace(temp_path, self.path)
@@ -0,0 +1,307 @@
+import hashlib
+import json
+import os
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape, quoteattr
+
+
+FEED_STATE_VERSION = 2
+SITEMAP_URL_LIMIT = 50000
+SITEMAP_FILENAME = "sitemap.xml"
+RSS_FILENAME = "rss.xml"
+ATOM_FILENAME = "atom.xml"
+FEED_ENTRY_LIMIT = 20
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+
+
+class PageEntry:
+    __slots__ = ("url", "title", "updated", "key")
+
+    def __init__(self, url, title, updated, key):
+        self.url = url
+        self.title = title
+        self.updated = updated
+        self.key = key
+
+    def __repr__(self):
+        return f"PageEntry({self.url}, {self.title}, {self.updated})"
+
+
+class XMLWriter:
+    def __init__(self, file):
+        self.file = file
+        self.tags = []
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+
+    def __repr__(self):
+        return f"XMLWriter({'/'.join(self.tags)})"
+
+    def start(self, tag, attributes=None):
+        self.file.write(f"<{tag}{format_attributes(attributes)}>")
+        self.tags.append(tag)
+
+    def end(self):
+        self.file.write(f"</{self.tags.pop()}>")
+
+    def element(self, tag, text="", attributes=None):
+        attributes = format_attributes(attributes)
+        if text:
+            self.file.write(f"<{tag}{attributes}>{escape(text)}</{tag}>")
+        else:
+            self.file.write(f"<{tag}{attributes}/>")
+
+    def close(self):
+        while self.tags:
+            self.end()
+        self.file.write("\n")
+
+
+def format_attributes(attributes):
+    if not attributes:
+        return ""
+    return "".join(
+        f" {name}={quoteattr(value)}" for name, value in attributes.items()
+    )
+
+
+def absolute_url(site_url, url):
+    return f"{site_url.rstrip('/')}/{url}"
+
+
+def timestamp(updated):
+    return datetime.fromtimestamp(updated, timezone.utc)
+
+
+def entries_digest(kind, site_url, site_title, rows):
+    digest = hashlib.sha256()
+    digest.update(f"{kind}\0{site_url}\0{site_title}\0".encode("utf-8"))
+    for row in rows:
+        digest.update("".join([f"{field}\0" for field in row]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def write_xml(path, write):
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        writer = XMLWriter(file)
+        write(writer)
+        writer.close()
+    os.replace(temp_path, path)
+
+
+def sitemap_filename(number):
+    return f"sitemap-{number}.xml"
+
+
+def write_urlset(writer, site_url, entries):
+    writer.start("urlset", {"xmlns": SITEMAP_NAMESPACE})
+    for entry in entries:
+        writer.start("url")
+        writer.element("loc", absolute_url(site_url, entry.url))
+        writer.element(
+            "lastmod", timestamp(entry.updated).isoformat(timespec="seconds")
+        )
+        writer.end()
+    writer.end()
+
+
+def write_sitemap_index(writer, site_url, filenames):
+    writer.start("sitemapindex", {"xmlns": SITEMAP_NAMESPACE})
+    for filename in filenames:
+        writer.start("sitemap")
+        writer.element("loc", absolute_url(site_url, filename))
+        writer.end()
+    writer.end()
+
+
+def write_sitemaps(public_dir, site_url, entries, limit=SITEMAP_URL_LIMIT):
+    chunks = [
+        entries[start:start + limit] for start in range(0, len(entries), limit)
+    ]
+    if len(chunks) <= 1:
+        write_xml(
+            os.path.join(public_dir, SITEMAP_FILENAME),
+            lambda writer: write_urlset(writer, site_url, entries)
+        )
+        filenames = [SITEMAP_FILENAME]
+    else:
+        filenames = []
+        for number, chunk in enumerate(chunks, 1):
+            filename = sitemap_filename(number)
+            write_xml(
+                os.path.join(public_dir, filename),
+                lambda writer: write_urlset(writer, site_url, chunk)
+            )
+            filenames.append(filename)
+        write_xml(
+            os.path.join(public_dir, SITEMAP_FILENAME),
+            lambda writer: write_sitemap_index(writer, site_url, filenames)
+        )
+
+    number = len(chunks) if len(chunks) > 1 else 0
+    while True:
+        number += 1
+        path = os.path.join(public_dir, sitemap_filename(number))
+        if not os.path.exists(path):
+            break
+        os.remove(path)
+    return filenames
+
+
+def write_rss(writer, site_url, site_title, entries):
+    writer.start("rss", {"version": "2.0"})
+    writer.start("channel")
+    writer.element("title", site_title)
+    writer.element("link", absolute_url(site_url, ""))
+    writer.element("description", site_title)
+    for entry in entries:
+        url = absolute_url(site_url, entry.url)
+        writer.start("item")
+        writer.element("title", entry.title)
+        writer.element("link", url)
+        writer.element("guid", url)
+        writer.element("pubDate", format_datetime(timestamp(entry.updated)))
+        writer.end()
+    writer.end()
+    writer.end()
+
+
+def write_atom(writer, site_url, site_title, entries):
+    updated = max((entry.updated for entry in entries), default=0)
+    writer.start("feed", {"xmlns": ATOM_NAMESPACE})
+    writer.element("title", site_title)
+    writer.element("id", absolute_url(site_url, ""))
+    writer.element("link", attributes={"href": absolute_url(site_url, "")})
+    writer.element("link", attributes={
+        "href": absolute_url(site_url, ATOM_FILENAME), "rel": "self"
+    })
+    writer.element("updated", timestamp(updated).isoformat())
+    for entry in entries:
+        url = absolute_url(site_url, entry.url)
+        writer.start("entry")
+        writer.element("title", entry.title)
+        writer.element("id", url)
+        writer.element("link", attributes={"href": url})
+        writer.element("updated", timestamp(entry.updated).isoformat())
+        writer.end()
+    writer.end()
+
+
+class FeedReport:
+    def __init__(self):
+        self.pages = 0
+        self.sitemaps = 0
+        self.written = []
+        self.skipped = []
+
+    def __repr__(self):
+        return (
+            f"FeedReport(pages={self.pages}, written={self.written}, "
+            f"skipped={self.skipped})"
+        )
+
+
+class FeedGenerator:
+    def __init__(
+        self,
+        public_dir,
+        site_url,
+        site_title="",
+        state_path=None,
+        entry_limit=FEED_ENTRY_LIMIT,
+        sitemap_limit=SITEMAP_URL_LIMIT
+    ):
+        self.public_dir = public_dir
+        self.site_url = site_url
+        self.site_title = site_title
+        self.state_path = state_path
+        self.entry_limit = entry_limit
+        self.sitemap_limit = sitemap_limit
+        self.digests, self.pages = self.load_state()
+
+    def __repr__(self):
+        return f"FeedGenerator({self.public_dir}, {self.site_url})"
+
+    def load_state(self):
+        if self.state_path is None:
+            return {}, {}
+        try:
+            with open(self.state_path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}, {}
+        if data.get("version") != FEED_STATE_VERSION:
+            return {}, {}
+        return data.get("digests", {}), data.get("pages", {})
+
+    def save_state(self):
+        if self.state_path is None:
+            return
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        temp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": FEED_STATE_VERSION,
+                    "digests": self.digests,
+                    "pages": self.pages
+                },
+                file,
+                sort_keys=True
+            )
+        os.replace(temp_path, self.state_path)
+
+    def title(self, url, key):
+        entry = self.pages.get(url)
+        return entry[1] if entry is not None and entry[0] == key else None
+
+    def changed(self, filename, rows, report):
+        digest = entries_digest(
+            filename, self.site_url, self.site_title, rows
+        )
+        path = os.path.join(self.public_dir, filename)
+        if self.digests.get(filename) == digest and os.path.exists(path):
+            report.skipped.append(filename)
+            return False
+        self.digests[filename] = digest
+        report.written.append(filename)
+        return True
+
+    def generate(self, entries):
+        report = FeedReport()
+        report.pages = len(entries)
+        os.makedirs(self.public_dir, exist_ok=True)
+        self.pages = {entry.url: [entry.key, entry.title] for entry in entries}
+
+        sitemap_rows = [(entry.url, entry.updated) for entry in entries]
+        if self.changed(SITEMAP_FILENAME, sitemap_rows, report):
+            report.sitemaps = len(write_sitemaps(
+                self.public_dir, self.site_url, entries, self.sitemap_limit
+            ))
+
+        recent = sorted(
+            entries, key=lambda entry: (-entry.updated, entry.url)
+        )[:self.entry_limit]
+        feed_rows = [
+            (entry.url, entry.title, entry.updated) for entry in recent
+        ]
+        if self.changed(RSS_FILENAME, feed_rows, report):
+            write_xml(
+                os.path.join(self.public_dir, RSS_FILENAME),
+                lambda writer: write_rss(
+                    writer, self.site_url, self.site_title, recent
+                )
+            )
+        if self.changed(ATOM_FILENAME, feed_rows, report):
+            write_xml(
+                os.path.join(self.public_dir, ATOM_FILENAME),
+                lambda writer: write_atom(
+                    writer, self.site_url, self.site_title, recent
+                )
+            )
+
+        self.save_state()
+        return report
@@ -0,0 +1,98 @@
+FRONT_MATTER_DELIMITER = "---"
+FRONT_MATTER_LIMIT = 1 << 16
+LIST_KEYS = frozenset(["tags"])
+
+
+def parse_value(key, value):
+    if key not in LIST_KEYS:
+        return value.strip("\"'")
+    if value.startswith("[") and value.endswith("]"):
+        value = value[1:-1]
+    return [
+        item.strip().strip("\"'") for item in value.split(",") if item.strip()
+    ]
+
+
+def parse_front_matter(lines, first_line=1):
+    metadata = {}
+    list_key = None
+    for number, line in enumerate(lines, first_line):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line == "-" or line.startswith("- "):
+            if list_key is None:
+                raise ValueError(
+                    f"Front matter line {number} '{line}' is not in a list."
+                )
+            if list_key not in LIST_KEYS:
+                raise ValueError(
+                    f"Front matter line {number} '{line}' is a list item, "
+                    f"but '{list_key}' takes a single value."
+                )
+            if not isinstance(metadata[list_key], list):
+                metadata[list_key] = []
+            item = line[1:].strip().strip("\"'")
+            if item:
+                metadata[list_key].append(item)
+            continue
+        key, separator, value = line.partition(":")
+        if not separator:
+            raise ValueError(
+                f"Front matter line {number} '{line}' has no key."
+            )
+        key = key.strip().lower()
+        value = value.strip()
+        metadata[key] = parse_value(key, value)
+        list_key = key if not value else None
+    return metadata
+
+
+def split_front_matter(markdown):
+    if not markdown.startswith(FRONT_MATTER_DELIMITER):
+        return {}, markdown
+    start = markdown.find("\n") + 1
+    if not start or markdown[:start].rstrip() != FRONT_MATTER_DELIMITER:
+        return {}, markdown
+
+    position = start
+    while True:
+        end = markdown.find("\n", position)
+        line = markdown[position:] if end == -1 else markdown[position:end]
+        if line.rstrip() == FRONT_MATTER_DELIMITER:
+            metadata = parse_front_matter(
+                markdown[start:position].split("\n"), 2
+            )
+            return metadata, "" if end == -1 else markdown[end + 1:]
+        if end == -1:
+            return {}, markdown
+        position = end + 1
+
+
+def front_matter_body(source):
+    if not source.startswith(FRONT_MATTER_DELIMITER.encode("utf-8")):
+        return source
+    return split_front_matter(source.decode("utf-8"))[1].encode("utf-8")
+
+
+def read_front_matter(path, limit=FRONT_MATTER_LIMIT):
+    delimiter = FRONT_MATTER_DELIMITER.encode("utf-8")
+    with open(path, "rb") as file:
+        if file.readline(limit).rstrip() != delimiter:
+            return {}
+        lines = []
+        remaining = limit
+        while remaining > 0:
+            line = file.readline(remaining)
+            if not line:
+                return {}
+            if line.rstrip() == delimiter:
+                try:
+                    return parse_front_matter(
+                        (line.decode("utf-8") for line in lines), 2
+                    )
+                except ValueError as error:
+                    raise ValueError(f"{path}: {error}") from None
+            lines.append(line)
+            remaining -= len(line)
+    return {}
@@ -1,5 +1,58 @@
+import functools
+import html
+
+
+PROPS_CACHE_SIZE = 4096
+
+
+class Props(dict):
+    __slots__ = ("key",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.key = tuple(self.items())
+
+    def __hash__(self):
+        return hash(frozenset(self.key))
+
+    def __reduce__(self):
+        return (Props, (dict(self),))
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError("Props cannot be modified.")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+
+def format_props(items):
+    return "".join(
+        f' {name}="{html.escape(str(value))}"' for name, value in items
+    )
+
+
+@functools.lru_cache(maxsize=PROPS_CACHE_SIZE)
+def render_props(items):
+    return format_props(items)
+
+
+def props_cache_info():
+    return render_props.cache_info()
+
+
 class HTMLNode:
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
+        if props is not None and not isinstance(props, Props):
+            props = Props(props)
+
         self.tag = tag
         self.value = value
         self.children = children
@@ -10,11 +63,20 @@ class HTMLNode:
 
     def to_html(self):
         raise NotImplementedError
+
+    def iter_html(self):
+        yield self.to_html()
+
+    def write_html(self, stream):
+        for fragment in self.iter_html():
+            stream.write(fragment)
     
     def props_to_html(self):
         if self.props is None:
             return ""
-        
-        prop_to_string = lambda prop: f'{prop[0]}="{prop[1]}"'
-        prop_strings = list(map(prop_to_string, self.props.items()))
-        return f" {' '.join(prop_strings)}"
+        if not isinstance(self.props, Props):
+            self.props = Props(self.props)
+        try:
+            return render_props(self.props.key)
+        except TypeError:
+            return format_props(self.props.key)
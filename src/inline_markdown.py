@@ -3,47 +3,42 @@ import re
 from textnode import TextNode, TextType
 
 
+IMAGE_PATTERN = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
+LINK_PATTERN = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+
 def extract_markdown_images(text):
-    return re.findall(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
+    return IMAGE_PATTERN.findall(text)
 
 
 def extract_markdown_links(text):
-    return re.findall(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
+    return LINK_PATTERN.findall(text)
 
 
 def split_nodes(old_nodes, type):
+    pattern = IMAGE_PATTERN if type == TextType.IMAGE else LINK_PATTERN
     new_nodes = []
     for node in old_nodes:
         if node.text_type is not TextType.TEXT:
             new_nodes.append(node)
             continue
-        
-        extracted_items = None
-        if type == TextType.IMAGE:
-            extracted_items = extract_markdown_images(node.text)
-        if type == TextType.LINK:
-            extracted_items = extract_markdown_links(node.text)
-
-        if len(extracted_items) == 0:
-            if node.text:
-                new_nodes.append(node)
-            continue
 
         node_text = node.text
-        for item in extracted_items:
-            split_text = None
-            if type == TextType.IMAGE:
-                split_text = node_text.split(f"![{item[0]}]({item[1]})", 1)
-            if type == TextType.LINK:
-                split_text = node_text.split(f"[{item[0]}]({item[1]})", 1)
-            
-            if split_text[0] != "":
-                new_nodes.append(TextNode(split_text[0], TextType.TEXT))
-            new_nodes.append(TextNode(item[0], type, item[1]))
-            node_text = split_text[1]
-        
-        if node_text != "":
-            new_nodes.append(TextNode(node_text, TextType.TEXT))
+        text_start = 0
+        for match in pattern.finditer(node_text):
+            match_start, match_end = match.span()
+            if match_start > text_start:
+                new_nodes.append(
+                    TextNode(node_text[text_start:match_start], TextType.TEXT)
+                )
+            new_nodes.append(TextNode(match.group(1), type, match.group(2)))
+            text_start = match_end
+
+        if text_start == 0:
+            if node_text:
+                new_nodes.append(node)
+        elif text_start < len(node_text):
+            new_nodes.append(TextNode(node_text[text_start:], TextType.TEXT))
 
     return new_nodes
 
@@ -79,11 +74,66 @@ def split_nodes_delimiter(old_nodes, delimiter, text_type):
     return new_nodes
 
 
+# Matches every inline delimiter plus whole links and images. Link and image
+# bodies may not contain a delimiter, because the delimiters always split the
+# text before links and images are looked for.
+INLINE_TOKEN_PATTERN = re.compile(
+    r"(?=[*_`!\[])(?:\*\*|_|`"
+    r"|(!?)\[([^\[\]*_`]*(?:\*(?!\*)[^\[\]*_`]*)*)\]"
+    r"\(([^\(\)*_`]*(?:\*(?!\*)[^\(\)*_`]*)*)\))"
+)
+
+
 def text_to_textnodes(text):
-    nodes = [TextNode(text, TextType.TEXT)]
-    nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
-    nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
-    nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
-    nodes = split_nodes_image(nodes)
-    nodes = split_nodes_link(nodes)
+    TEXT, BOLD, ITALIC, CODE = (
+        TextType.TEXT, TextType.BOLD, TextType.ITALIC, TextType.CODE
+    )
+    nodes = []
+    append = nodes.append
+    state = TEXT
+    segment_start = 0
+
+    for match in INLINE_TOKEN_PATTERN.finditer(text):
+        token_start, token_end = match.span()
+        char = text[token_start]
+
+        if char == "*":
+            if state is ITALIC or state is CODE:
+                raise ValueError(
+                    "Invalid Markdown: formatted section was not closed."
+                )
+            if token_start > segment_start:
+                append(TextNode(text[segment_start:token_start], state))
+            state = TEXT if state is BOLD else BOLD
+        elif state is BOLD:
+            continue
+        elif char == "_":
+            if state is CODE:
+                raise ValueError(
+                    "Invalid Markdown: formatted section was not closed."
+                )
+            if token_start > segment_start:
+                append(TextNode(text[segment_start:token_start], state))
+            state = TEXT if state is ITALIC else ITALIC
+        elif state is ITALIC:
+            continue
+        elif char == "`":
+            if token_start > segment_start:
+                append(TextNode(text[segment_start:token_start], state))
+            state = TEXT if state is CODE else CODE
+        elif state is CODE:
+            continue
+        else:
+            if token_start > segment_start:
+                append(TextNode(text[segment_start:token_start], TEXT))
+            bang, alt_text, url = match.groups()
+            type = TextType.IMAGE if bang else TextType.LINK
+            append(TextNode(alt_text, type, url))
+
+        segment_start = token_end
+
+    if state is not TEXT:
+        raise ValueError("Invalid Markdown: formatted section was not closed.")
+    if segment_start < len(text):
+        append(TextNode(text[segment_start:], TEXT))
     return nodes
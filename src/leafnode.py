@@ -1,7 +1,9 @@
-from htmlnode import HTMLNode
+from htmlnode import HTMLNode, Props
 
 
 class LeafNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, value, props=None):
         super().__init__(tag, value, None, props)
 
@@ -24,3 +26,27 @@ class LeafNode(HTMLNode):
             return f"{self.value}"
 
         return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+
+
+_set_tag = HTMLNode.tag.__set__
+_set_value = HTMLNode.value.__set__
+_set_children = HTMLNode.children.__set__
+_set_props = HTMLNode.props.__set__
+
+
+class FrozenLeafNode(LeafNode):
+    __slots__ = ()
+
+    def __init__(self, tag, value, props=None):
+        if props is not None and not isinstance(props, Props):
+            props = Props(props)
+        _set_tag(self, tag)
+        _set_value(self, value)
+        _set_children(self, None)
+        _set_props(self, props)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenLeafNode cannot be modified.")
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenLeafNode cannot be modified.")
@@ -0,0 +1,132 @@
+import json
+import os
+import posixpath
+
+from urllib.parse import unquote, urlsplit
+
+from textnode import TextType
+
+
+LINK_GRAPH_VERSION = 1
+INDEX_FILENAME = "index.html"
+LINK_TEXT_TYPES = (TextType.LINK, TextType.IMAGE)
+
+
+def page_links(parsed_blocks, asset_url=None):
+    links = {}
+    for _, streams in parsed_blocks:
+        for stream in streams:
+            for text_node in stream:
+                if text_node.text_type in LINK_TEXT_TYPES:
+                    url = text_node.url
+                    if asset_url is not None:
+                        url = asset_url(url)
+                    links[url] = None
+    return list(links)
+
+
+def resolve_link(url, page):
+    parts = urlsplit(url)
+    if parts.scheme or parts.netloc or not parts.path:
+        return None
+
+    path = unquote(parts.path)
+    if path.startswith("/"):
+        target = path.lstrip("/")
+    else:
+        target = posixpath.join(posixpath.dirname(page), path)
+    if path.endswith("/") or not target:
+        target = posixpath.join(target, INDEX_FILENAME)
+    return posixpath.normpath(target)
+
+
+def link_candidates(target):
+    if target.endswith(INDEX_FILENAME) or posixpath.splitext(target)[1]:
+        return (target,)
+    return (target, f"{target}.html", f"{target}/{INDEX_FILENAME}")
+
+
+class LinkReport:
+    def __init__(self, pages=0, links=0, broken=None, orphans=None):
+        self.pages = pages
+        self.links = links
+        self.broken = broken if broken is not None else []
+        self.orphans = orphans if orphans is not None else []
+
+    def __repr__(self):
+        return (
+            f"LinkReport(pages={self.pages}, links={self.links}, "
+            f"broken={len(self.broken)}, orphans={len(self.orphans)})"
+        )
+
+
+class LinkGraph:
+    def __init__(self, path=None, pages=None):
+        self.path = path
+        self.pages = pages if pages is not None else {}
+
+    def __repr__(self):
+        return f"LinkGraph({self.path}, {len(self.pages)} pages)"
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+
+        if data.get("version") != LINK_GRAPH_VERSION:
+            return cls(path)
+        return cls(path, data.get("pages", {}))
+
+    def get_key(self, page):
+        entry = self.pages.get(page)
+        return entry[0] if entry is not None else None
+
+    def set_links(self, page, key, urls):
+        self.pages[page] = [key, urls]
+
+    def prune(self, pages):
+        pages = set(pages)
+        for page in list(self.pages):
+            if page not in pages:
+                del self.pages[page]
+
+    def check(self, paths):
+        paths = set(paths)
+        paths.update(self.pages)
+        report = LinkReport(len(self.pages))
+        linked = set()
+        for page, (_, urls) in self.pages.items():
+            for url in urls:
+                target = resolve_link(url, page)
+                if target is None:
+                    continue
+                report.links += 1
+                for candidate in link_candidates(target):
+                    if candidate in paths:
+                        if candidate != page:
+                            linked.add(candidate)
+                        break
+                else:
+                    report.broken.append((page, url))
+        report.orphans = [
+            page for page in self.pages
+            if page not in linked and page != INDEX_FILENAME
+        ]
+        return report
+
+    def save(self):
+        if self.path is None:
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": LINK_GRAPH_VERSION, "pages": self.pages},
+                file,
+                sort_keys=True
+            )
+        os.replace(temp_path, self.path)
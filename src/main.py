@@ -1,9 +1,253 @@
-from textnode import TextNode, TextType
+import argparse
+import functools
+import sys
+import threading
+import time
 
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
-def main():
-    gh_link = TextNode("GitHub", TextType.LINK, "https://github.com/javavick")
-    print(gh_link)
+from build import build_site
+from profiling import Profiler
+from watch import IncrementalBuilder
 
 
-main()
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build", help="render every markdown page in the content directory"
+    )
+    build_parser.add_argument("content_dir", nargs="?", default="content")
+    build_parser.add_argument("public_dir", nargs="?", default="public")
+    build_parser.add_argument(
+        "--workers", type=int, help="number of worker processes"
+    )
+    build_parser.add_argument(
+        "--chunksize", type=int, help="pages handed to a worker at a time"
+    )
+    build_parser.add_argument(
+        "--cache-dir", default=".cache", help="directory for build caches"
+    )
+    build_parser.add_argument(
+        "--force", action="store_true", help="re-render every page"
+    )
+    build_parser.add_argument(
+        "--block-cache-mb",
+        type=float,
+        default=64,
+        help="memory for rendered blocks per worker, 0 to disable"
+    )
+    build_parser.add_argument(
+        "--shared-block-cache",
+        action="store_true",
+        help="also share rendered blocks between workers on disk"
+    )
+    build_parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="reuse parsed documents whose source has not changed"
+    )
+    build_parser.add_argument(
+        "--fingerprint-assets",
+        action="store_true",
+        help="add content hashes to image names and rewrite page URLs"
+    )
+    build_parser.add_argument(
+        "--exclude-assets",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="glob of content files not to copy, may be repeated"
+    )
+    build_parser.add_argument(
+        "--template", help="layout that wraps each rendered page"
+    )
+    build_parser.add_argument(
+        "--search-index",
+        action="store_true",
+        help="write a sharded search index of every page"
+    )
+    build_parser.add_argument(
+        "--search-memory-mb",
+        type=float,
+        default=64,
+        help="memory for search postings before they spill to disk"
+    )
+    build_parser.add_argument(
+        "--check-links",
+        action="store_true",
+        help="report broken internal links and pages nothing links to"
+    )
+    build_parser.add_argument(
+        "--site-url",
+        help="public URL of the site, enables the sitemap and feeds"
+    )
+    build_parser.add_argument(
+        "--site-title", default="", help="title used for the feeds"
+    )
+    build_parser.add_argument(
+        "--listings",
+        action="store_true",
+        help="write tag and archive pages from each page's front matter"
+    )
+    build_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="report the slowest pages and pipeline stages"
+    )
+    build_parser.add_argument(
+        "--trace", help="write a Chrome trace-event JSON file of the build"
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="build the site and serve the public directory"
+    )
+    serve_parser.add_argument("content_dir", nargs="?", default="content")
+    serve_parser.add_argument("public_dir", nargs="?", default="public")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8888)
+    serve_parser.add_argument(
+        "--template", help="layout that wraps each rendered page"
+    )
+    serve_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="rebuild pages affected by changes to the content directory"
+    )
+    serve_parser.add_argument(
+        "--interval", type=float, default=0.1, help="seconds between polls"
+    )
+
+    if argv is None:
+        argv = sys.argv[1:] or ["build"]
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        run_build(args)
+    elif args.command == "serve":
+        run_serve(args)
+
+
+def run_build(args):
+    profiler = None
+    if args.profile or args.trace:
+        profiler = Profiler(trace=args.trace is not None)
+
+    start = time.perf_counter()
+    try:
+        report = build_site(
+            args.content_dir,
+            args.public_dir,
+            args.workers,
+            args.chunksize,
+            args.cache_dir,
+            args.force,
+            profiler,
+            int(args.block_cache_mb * 1024 * 1024),
+            args.shared_block_cache,
+            args.parse_cache,
+            fingerprint_assets=args.fingerprint_assets,
+            exclude_assets=args.exclude_assets,
+            template_path=args.template,
+            search_index=args.search_index,
+            search_memory_budget=int(args.search_memory_mb * 1024 * 1024),
+            check_links=args.check_links,
+            site_url=args.site_url,
+            site_title=args.site_title,
+            listings=args.listings
+        )
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Built {report.pages} pages in {elapsed:.2f}s "
+        f"({report.hits} cache hits, {report.misses} misses, "
+        f"{report.written} written)"
+    )
+    print(
+        f"Wrote {report.written_bytes / 1024:.1f} KB, skipped "
+        f"{report.skipped} unchanged pages "
+        f"({report.skipped_bytes / 1024:.1f} KB)"
+    )
+    if report.assets.assets:
+        print(
+            f"Copied {report.assets.copied} of {report.assets.assets} assets "
+            f"({report.assets.copied_bytes / 1024:.1f} KB, "
+            f"{report.assets.hashed} hashed)"
+        )
+    if report.block_hits or report.block_misses:
+        print(f"Block cache hit ratio: {report.block_hit_ratio():.1%}")
+    if report.document_hits or report.document_misses:
+        print(
+            f"Loaded {report.document_hits} parsed pages from the parse "
+            f"cache, parsed {report.document_misses}"
+        )
+
+    if report.search is not None:
+        print(
+            f"Indexed {report.search['terms']} terms in "
+            f"{len(report.search['shards'])} search shards"
+        )
+    if report.feeds is not None:
+        print(
+            f"Wrote {', '.join(report.feeds.written) or 'no feeds'}, "
+            f"{len(report.feeds.skipped)} unchanged"
+        )
+    if args.listings:
+        print(
+            f"Wrote {report.listings} listing pages for {report.tags} tags, "
+            f"read front matter of {report.metadata_reads} changed pages"
+        )
+    if report.links is not None:
+        print(
+            f"Checked {report.links.links} internal links: "
+            f"{len(report.links.broken)} broken, "
+            f"{len(report.links.orphans)} orphan pages"
+        )
+        for page, url in report.links.broken:
+            print(f"  broken: {page} -> {url}")
+        for page in report.links.orphans:
+            print(f"  orphan: {page}")
+
+    if profiler is not None:
+        print(profiler.report())
+        if args.trace:
+            profiler.write_trace(args.trace)
+
+
+def run_serve(args):
+    builder = IncrementalBuilder(
+        args.content_dir, args.public_dir, template_path=args.template
+    )
+    start = time.perf_counter()
+    pages = builder.build_all()
+    print(f"Built {pages} pages in {time.perf_counter() - start:.2f}s")
+    print_errors(builder.errors)
+
+    handler = functools.partial(
+        SimpleHTTPRequestHandler, directory=args.public_dir
+    )
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"Serving {args.public_dir} at http://{args.host}:{args.port}/")
+    if not args.watch:
+        server.serve_forever()
+        return
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    builder.watch(args.interval, print_rebuild)
+
+
+def print_rebuild(rebuilt, elapsed, errors):
+    print(f"Rebuilt {len(rebuilt)} pages in {elapsed * 1000:.1f}ms")
+    print_errors(errors)
+
+
+def print_errors(errors):
+    for source_path, message in sorted(errors.items()):
+        print(f"  error: {source_path}: {message}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
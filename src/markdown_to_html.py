@@ -0,0 +1,180 @@
+import itertools
+
+from block_markdown import (
+    BlockType,
+    block_to_block_type,
+    markdown_to_blocks,
+    ordered_item_prefixes
+)
+from inline_markdown import text_to_textnodes
+from leafnode import LeafNode
+from parentnode import ParentNode
+from textnode import (
+    TextNode,
+    TextType,
+    text_nodes_to_html,
+    text_nodes_to_html_nodes
+)
+
+
+HEADER_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+LIST_TAGS = ("ul", "ol")
+
+
+def list_item_streams(lines, prefixes):
+    return [
+        text_to_textnodes(line[len(prefix):])
+        for line, prefix in zip(lines, prefixes)
+    ]
+
+
+def parse_block(block):
+    block_type = block_to_block_type(block)
+    if block_type is BlockType.PARAGRAPH:
+        return "p", [text_to_textnodes(block.replace("\n", " "))]
+
+    if block_type is BlockType.HEADER:
+        level = len(block) - len(block.lstrip("#"))
+        return HEADER_TAGS[level - 1], [text_to_textnodes(block[level + 1:])]
+
+    if block_type is BlockType.CODE:
+        code = block[3:-3]
+        if code.startswith("\n"):
+            code = code[1:]
+        return "pre", [[TextNode(code, TextType.CODE)]]
+
+    lines = block.split("\n")
+    if block_type is BlockType.QUOTE:
+        text = " ".join([line.lstrip(">").strip() for line in lines])
+        return "blockquote", [text_to_textnodes(text)]
+    if block_type is BlockType.UNORDERED_LIST:
+        return "ul", list_item_streams(lines, itertools.repeat("- "))
+    return "ol", list_item_streams(lines, ordered_item_prefixes(len(lines)))
+
+
+def block_to_html_node(block):
+    tag, streams = parse_block(block)
+    if tag in LIST_TAGS:
+        return ParentNode(tag, [
+            ParentNode("li", text_nodes_to_html_nodes(stream))
+            for stream in streams
+        ])
+    return ParentNode(tag, text_nodes_to_html_nodes(streams[0]))
+
+
+def rewrite_asset_urls(streams, asset_url):
+    return [
+        [
+            TextNode(node.text, node.text_type, asset_url(node.url))
+            if node.url is not None else node
+            for node in stream
+        ]
+        for stream in streams
+    ]
+
+
+def block_to_html(block, asset_url=None):
+    tag, streams = parse_block(block)
+    if asset_url is not None:
+        streams = rewrite_asset_urls(streams, asset_url)
+    return parsed_block_to_html(tag, streams)
+
+
+def parsed_block_to_html(tag, streams):
+    if tag in LIST_TAGS:
+        items = "".join([
+            f"<li>{text_nodes_to_html(stream)}</li>" for stream in streams
+        ])
+        return f"<{tag}>{items}</{tag}>"
+    return f"<{tag}>{text_nodes_to_html(streams[0])}</{tag}>"
+
+
+def cached_block_to_html(block, block_cache, asset_url=None):
+    if asset_url is not None and "](" in block:
+        return block_to_html(block, asset_url)
+    html = block_cache.get(block)
+    if html is None:
+        html = block_to_html(block)
+        block_cache.put(block, html)
+    return html
+
+
+def cached_block_to_html_node(block, block_cache):
+    return LeafNode(None, cached_block_to_html(block, block_cache))
+
+
+def markdown_to_html_node(markdown, block_cache=None):
+    blocks = markdown_to_blocks(markdown)
+    if block_cache is None:
+        children = [block_to_html_node(block) for block in blocks]
+    else:
+        children = [
+            cached_block_to_html_node(block, block_cache) for block in blocks
+        ]
+    return ParentNode("div", children)
+
+
+def render_markdown(markdown, block_cache=None, asset_url=None):
+    blocks = markdown_to_blocks(markdown)
+    if block_cache is None:
+        html = "".join([block_to_html(block, asset_url) for block in blocks])
+    else:
+        html = "".join([
+            cached_block_to_html(block, block_cache, asset_url)
+            for block in blocks
+        ])
+    return f"<div>{html}</div>"
+
+
+def parse_markdown(markdown):
+    return parse_markdown_blocks(markdown)[1]
+
+
+def parse_markdown_blocks(markdown):
+    blocks = markdown_to_blocks(markdown)
+    return blocks, [parse_block(block) for block in blocks]
+
+
+def render_parsed_blocks(parsed_blocks, asset_url=None):
+    if asset_url is not None:
+        parsed_blocks = [
+            (tag, rewrite_asset_urls(streams, asset_url))
+            for tag, streams in parsed_blocks
+        ]
+    html = "".join([
+        parsed_block_to_html(tag, streams) for tag, streams in parsed_blocks
+    ])
+    return f"<div>{html}</div>"
+
+
+def cached_parsed_block_to_html(
+    block, parsed_block, block_cache, asset_url=None
+):
+    tag, streams = parsed_block
+    if asset_url is not None and "](" in block:
+        return parsed_block_to_html(
+            tag, rewrite_asset_urls(streams, asset_url)
+        )
+    html = block_cache.get(block)
+    if html is None:
+        html = parsed_block_to_html(tag, streams)
+        block_cache.put(block, html)
+    return html
+
+
+def render_cached_parsed_blocks(
+    blocks, parsed_blocks, block_cache, asset_url=None
+):
+    html = "".join([
+        cached_parsed_block_to_html(block, parsed, block_cache, asset_url)
+        for block, parsed in zip(blocks, parsed_blocks)
+    ])
+    return f"<div>{html}</div>"
+
+
+def parsed_title(parsed_blocks):
+    for tag, streams in parsed_blocks:
+        if tag == "h1":
+            title = "".join([text_node.text for text_node in streams[0]])
+            return title.strip() or None
+    return None
@@ -0,0 +1,158 @@
+import json
+import os
+import posixpath
+import re
+
+from html import escape
+
+from front_matter import read_front_matter
+from leafnode import LeafNode
+from parentnode import ParentNode
+
+
+METADATA_INDEX_VERSION = 1
+TAGS_DIRNAME = "tags"
+ARCHIVE_FILENAME = "archive.html"
+SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def tag_slug(tag):
+    return SLUG_PATTERN.sub("-", tag.lower()).strip("-") or "tag"
+
+
+def tag_slugs(tags):
+    slugs = {}
+    used = set()
+    for tag in sorted(tags):
+        base = slug = tag_slug(tag)
+        number = 1
+        while slug in used:
+            number += 1
+            slug = f"{base}-{number}"
+        used.add(slug)
+        slugs[tag] = slug
+    return slugs
+
+
+def listing_url(page):
+    return "/" + posixpath.splitext(page)[0] + ".html"
+
+
+class MetadataIndex:
+    def __init__(self, path=None, pages=None):
+        self.path = path
+        self.pages = pages if pages is not None else {}
+        self.reads = 0
+
+    def __repr__(self):
+        return f"MetadataIndex({self.path}, {len(self.pages)} pages)"
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+
+        if data.get("version") != METADATA_INDEX_VERSION:
+            return cls(path)
+        return cls(path, data.get("pages", {}))
+
+    def update(self, content_dir, source_paths):
+        pages = {}
+        for source_path in source_paths:
+            page = os.path.relpath(source_path, content_dir).replace(
+                os.sep, "/"
+            )
+            stat = os.stat(source_path)
+            entry = self.pages.get(page)
+            if (
+                entry is None
+                or entry[0] != stat.st_mtime_ns
+                or entry[1] != stat.st_size
+            ):
+                entry = [
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    read_front_matter(source_path)
+                ]
+                self.reads += 1
+            pages[page] = entry
+        self.pages = pages
+
+    def metadata(self, page):
+        entry = self.pages.get(page)
+        return entry[2] if entry is not None else None
+
+    def title(self, page):
+        title = self.metadata(page).get("title")
+        return title or posixpath.splitext(posixpath.basename(page))[0]
+
+    def by_date(self, pages=None):
+        pages = self.pages if pages is None else pages
+        return sorted(
+            sorted(pages),
+            key=lambda page: self.pages[page][2].get("date", ""),
+            reverse=True
+        )
+
+    def tags(self):
+        tags = {}
+        for page, (_, _, metadata) in self.pages.items():
+            for tag in metadata.get("tags", []):
+                tags.setdefault(tag, []).append(page)
+        return {tag: self.by_date(pages) for tag, pages in tags.items()}
+
+    def archive(self):
+        years = {}
+        for page in self.by_date():
+            year = self.pages[page][2].get("date", "")[:4] or "Undated"
+            years.setdefault(year, []).append(page)
+        return years
+
+    def save(self):
+        if self.path is None:
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": METADATA_INDEX_VERSION, "pages": self.pages},
+                file,
+                sort_keys=True
+            )
+        os.replace(temp_path, self.path)
+
+
+def listing_items(index, pages):
+    items = []
+    for page in pages:
+        children = [LeafNode(
+            "a", escape(index.title(page)), {"href": listing_url(page)}
+        )]
+        date = index.metadata(page).get("date")
+        if date:
+            children.append(LeafNode(None, escape(f" ({date})")))
+        items.append(ParentNode("li", children))
+    return ParentNode("ul", items)
+
+
+def listing_pages(index):
+    listings = {}
+    tags = index.tags()
+    slugs = tag_slugs(tags)
+    for tag, pages in sorted(tags.items()):
+        path = posixpath.join(TAGS_DIRNAME, f"{slugs[tag]}.html")
+        title = f"Tagged {tag}"
+        listings[path] = (title, ParentNode("div", [
+            LeafNode("h1", escape(title)), listing_items(index, pages)
+        ]))
+
+    children = [LeafNode("h1", "Archive")]
+    for year, pages in index.archive().items():
+        children.append(LeafNode("h2", escape(year)))
+        children.append(listing_items(index, pages))
+    listings[ARCHIVE_FILENAME] = ("Archive", ParentNode("div", children))
+    return listings
@@ -0,0 +1,92 @@
+import hashlib
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class OutputWriter:
+    def __init__(self, threads=4):
+        self.executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="output-writer"
+        )
+        self.lock = threading.Lock()
+        self.directories = set()
+        self.pending = []
+        self.written = 0
+        self.written_bytes = 0
+        self.skipped = 0
+        self.skipped_bytes = 0
+
+    def __repr__(self):
+        return (
+            f"OutputWriter(written={self.written} files/"
+            f"{self.written_bytes} bytes, skipped={self.skipped} files/"
+            f"{self.skipped_bytes} bytes)"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def make_directories(self, paths):
+        directories = {os.path.dirname(path) for path in paths}
+        with self.lock:
+            directories.difference_update(self.directories)
+        for directory in sorted(directories):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        with self.lock:
+            self.directories.update(directories)
+
+    def write(self, path, data):
+        self.pending.append(self.executor.submit(self.write_file, path, data))
+
+    def write_file(self, path, data):
+        if self.unchanged(path, data):
+            with self.lock:
+                self.skipped += 1
+                self.skipped_bytes += len(data)
+            return False
+
+        directory = os.path.dirname(path)
+        if directory not in self.directories:
+            self.make_directories([path])
+
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self.lock:
+            self.written += 1
+            self.written_bytes += len(data)
+        return True
+
+    def unchanged(self, path, data):
+        try:
+            if os.stat(path).st_size != len(data):
+                return False
+            with open(path, "rb") as file:
+                digest = hashlib.file_digest(file, "sha256").digest()
+        except FileNotFoundError:
+            return False
+        return digest == hashlib.sha256(data).digest()
+
+    def flush(self):
+        pending, self.pending = self.pending, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.executor.shutdown(wait=True)
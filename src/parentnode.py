@@ -2,6 +2,8 @@ from htmlnode import HTMLNode
 
 
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, children, props=None):
         super().__init__(tag, None, children, props)
     
@@ -9,13 +11,22 @@ class ParentNode(HTMLNode):
         return f"ParentNode({self.tag}, {self.children}, {self.props})"
     
     def to_html(self):
-        if self.tag is None:
-            raise ValueError("Tag cannot be None.")
-        if self.children is None:
-            raise ValueError("Children cannot be None.")
-        
-        children_html = ""
-        for child in self.children:
-            children_html += child.to_html()
-        
-        return f"<{self.tag}{self.props_to_html()}>{children_html}</{self.tag}>"
+        return "".join(self.iter_html())
+
+    def iter_html(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                yield node
+            elif isinstance(node, ParentNode):
+                if node.tag is None:
+                    raise ValueError("Tag cannot be None.")
+                if node.children is None:
+                    raise ValueError("Children cannot be None.")
+
+                yield f"<{node.tag}{node.props_to_html()}>"
+                stack.append(f"</{node.tag}>")
+                stack.extend(reversed(node.children))
+            else:
+                yield from node.iter_html()
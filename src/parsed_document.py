@@ -0,0 +1,173 @@
+import hashlib
+import marshal
+import os
+import struct
+
+from build_manifest import GENERATOR_VERSION
+from block_markdown import markdown_to_blocks
+from leafnode import LeafNode
+from markdown_to_html import LIST_TAGS, parse_block
+from parentnode import ParentNode
+from textnode import (
+    INTERN_TEXT_LENGTH,
+    TextNode,
+    TextType,
+    interned_leaf_node,
+    text_node_to_html_node
+)
+
+
+DOCUMENT_MAGIC = b"SSGD"
+DOCUMENT_VERSION = 1
+DOCUMENT_HEADER = struct.Struct("<4sHH32s")
+
+TEXT_TYPES = tuple(TextType)
+TEXT_TYPE_CODES = {
+    text_type: code for code, text_type in enumerate(TEXT_TYPES)
+}
+TEXT = TEXT_TYPE_CODES[TextType.TEXT]
+
+
+def source_digest(source):
+    digest = hashlib.sha256()
+    digest.update(GENERATOR_VERSION.encode("utf-8") + b"\0")
+    digest.update(source)
+    return digest.digest()
+
+
+def text_nodes_to_records(text_nodes):
+    codes = TEXT_TYPE_CODES
+    return tuple([
+        (codes[node.text_type], node.text, node.url) for node in text_nodes
+    ])
+
+
+def records_to_text_nodes(records):
+    return [
+        TextNode(text, TEXT_TYPES[code], url) for code, text, url in records
+    ]
+
+
+def document_blocks(document):
+    return [
+        (tag, [records_to_text_nodes(stream) for stream in streams])
+        for tag, streams in document
+    ]
+
+
+def parse_document(markdown):
+    document = []
+    for block in markdown_to_blocks(markdown):
+        tag, streams = parse_block(block)
+        document.append(
+            (tag, tuple([text_nodes_to_records(stream) for stream in streams]))
+        )
+    return tuple(document)
+
+
+def records_to_html_nodes(records, asset_url=None):
+    text_types = TEXT_TYPES
+    leaf_node = interned_leaf_node
+    html_nodes = []
+    append = html_nodes.append
+    for code, text, url in records:
+        if code == TEXT:
+            append(LeafNode(None, text))
+            continue
+        if url is not None and asset_url is not None:
+            url = asset_url(url)
+        text_type = text_types[code]
+        if len(text) > INTERN_TEXT_LENGTH:
+            append(text_node_to_html_node(TextNode(text, text_type, url)))
+        else:
+            append(leaf_node(text_type, text, url))
+    return html_nodes
+
+
+def document_to_html_node(document, asset_url=None):
+    children = []
+    for tag, streams in document:
+        if tag in LIST_TAGS:
+            children.append(ParentNode(tag, [
+                ParentNode("li", records_to_html_nodes(stream, asset_url))
+                for stream in streams
+            ]))
+        else:
+            children.append(
+                ParentNode(tag, records_to_html_nodes(streams[0], asset_url))
+            )
+    return ParentNode("div", children)
+
+
+def render_document(document, asset_url=None):
+    return document_to_html_node(document, asset_url).to_html()
+
+
+def dump_document(document, digest):
+    header = DOCUMENT_HEADER.pack(
+        DOCUMENT_MAGIC, DOCUMENT_VERSION, marshal.version, digest
+    )
+    return header + marshal.dumps(document)
+
+
+def load_document(data, digest):
+    if len(data) < DOCUMENT_HEADER.size:
+        return None
+    magic, version, marshal_version, stored_digest = (
+        DOCUMENT_HEADER.unpack_from(data)
+    )
+    if (
+        magic != DOCUMENT_MAGIC or
+        version != DOCUMENT_VERSION or
+        marshal_version != marshal.version or
+        stored_digest != digest
+    ):
+        return None
+    try:
+        return marshal.loads(memoryview(data)[DOCUMENT_HEADER.size:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+class DocumentCache:
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (
+            f"DocumentCache({self.directory}, hits={self.hits}, "
+            f"misses={self.misses})"
+        )
+
+    def path(self, digest):
+        key = digest.hex()
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def load(self, digest):
+        try:
+            with open(self.path(digest), "rb") as file:
+                return load_document(file.read(), digest)
+        except FileNotFoundError:
+            return None
+
+    def store(self, digest, document):
+        path = self.path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(dump_document(document, digest))
+        os.replace(temp_path, path)
+
+    def parse(self, source):
+        digest = source_digest(source)
+        document = self.load(digest)
+        if document is not None:
+            self.hits += 1
+            return document
+
+        self.misses += 1
+        document = parse_document(source.decode("utf-8"))
+        self.store(digest, document)
+        return document
@@ -0,0 +1,194 @@
+import contextlib
+import json
+import os
+import time
+
+import markdown_to_html
+import parsed_document
+
+
+STAGES = [
+    (markdown_to_html, "markdown_to_blocks", "markdown_to_blocks"),
+    (markdown_to_html, "block_to_html", "block_to_html"),
+    (markdown_to_html, "text_to_textnodes", "text_to_textnodes"),
+    (markdown_to_html, "text_nodes_to_html", "text_nodes_to_html"),
+    (parsed_document, "load_document", "load_document"),
+    (parsed_document, "parse_document", "parse_document"),
+    (parsed_document, "render_document", "render_document"),
+]
+
+active_profiler = None
+
+
+class PageProfile:
+    __slots__ = ("page", "pid", "start", "seconds", "stages", "events")
+
+    def __init__(self, page):
+        self.page = page
+        self.pid = os.getpid()
+        self.start = time.time()
+        self.seconds = 0.0
+        self.stages = {}
+        self.events = []
+
+    def __repr__(self):
+        return f"PageProfile({self.page}, {self.seconds:.6f}s)"
+
+    def record(self, stage, start, seconds, result):
+        if isinstance(result, str):
+            nodes, size = 0, len(result.encode("utf-8"))
+        elif isinstance(result, list):
+            nodes, size = len(result), 0
+        else:
+            nodes, size = 1, 0
+
+        totals = self.stages.setdefault(stage, [0.0, 0, 0, 0])
+        totals[0] += seconds
+        totals[1] += 1
+        totals[2] += nodes
+        totals[3] += size
+        if self.events is not None:
+            self.events.append((stage, start, seconds))
+
+
+class Profiler:
+    def __init__(self, trace=False):
+        self.trace = trace
+        self.pages = []
+        self.current = None
+        self.originals = []
+
+    def __repr__(self):
+        return f"Profiler({len(self.pages)} pages, trace={self.trace})"
+
+    def wrap(self, stage, function):
+        def timed(*args, **kwargs):
+            page_profile = self.current
+            if page_profile is None:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            seconds = time.perf_counter() - start
+            page_profile.record(stage, start, seconds, result)
+            return result
+
+        return timed
+
+    def enable(self):
+        global active_profiler
+        if self.originals:
+            return
+
+        for owner, name, stage in STAGES:
+            function = getattr(owner, name)
+            self.originals.append((owner, name, function))
+            setattr(owner, name, self.wrap(stage, function))
+        active_profiler = self
+
+    def disable(self):
+        global active_profiler
+        for owner, name, function in reversed(self.originals):
+            setattr(owner, name, function)
+        self.originals = []
+        if active_profiler is self:
+            active_profiler = None
+
+    @contextlib.contextmanager
+    def page(self, page):
+        page_profile = PageProfile(page)
+        if not self.trace:
+            page_profile.events = None
+
+        self.current = page_profile
+        start = time.perf_counter()
+        try:
+            yield page_profile
+        finally:
+            page_profile.seconds = time.perf_counter() - start
+            if page_profile.events is not None:
+                page_profile.events = [
+                    (stage, event_start - start, seconds)
+                    for stage, event_start, seconds in page_profile.events
+                ]
+            self.current = None
+
+    def add_page(self, page_profile):
+        self.pages.append(page_profile)
+
+    def stage_totals(self):
+        totals = {}
+        for page_profile in self.pages:
+            for stage, values in page_profile.stages.items():
+                stage_totals = totals.setdefault(stage, [0.0, 0, 0, 0])
+                for i, value in enumerate(values):
+                    stage_totals[i] += value
+        return totals
+
+    def report(self, limit=10):
+        lines = [f"Slowest pages ({len(self.pages)} profiled):"]
+        slowest_pages = sorted(
+            self.pages, key=lambda page_profile: page_profile.seconds,
+            reverse=True
+        )
+        for page_profile in slowest_pages[:limit]:
+            slowest_stage = max(
+                page_profile.stages.items(),
+                key=lambda item: item[1][0],
+                default=("-", [0.0])
+            )
+            lines.append(
+                f"  {page_profile.seconds * 1000:>9.2f}ms  {page_profile.page}"
+                f"  (slowest stage: {slowest_stage[0]}"
+                f" {slowest_stage[1][0] * 1000:.2f}ms)"
+            )
+
+        lines.append("Slowest stages:")
+        lines.append(
+            f"  {'stage':<24}{'total':>12}{'calls':>10}"
+            f"{'nodes':>10}{'bytes':>12}"
+        )
+        stage_totals = sorted(
+            self.stage_totals().items(),
+            key=lambda item: item[1][0],
+            reverse=True
+        )
+        for stage, (seconds, calls, nodes, size) in stage_totals:
+            lines.append(
+                f"  {stage:<24}{seconds * 1000:>10.2f}ms{calls:>10}"
+                f"{nodes:>10}{size:>12}"
+            )
+        return "\n".join(lines)
+
+    def trace_events(self):
+        events = []
+        for page_profile in self.pages:
+            page_start = page_profile.start * 1e6
+            events.append({
+                "name": page_profile.page,
+                "cat": "page",
+                "ph": "X",
+                "ts": page_start,
+                "dur": page_profile.seconds * 1e6,
+                "pid": page_profile.pid,
+                "tid": 0,
+            })
+            for stage, offset, seconds in page_profile.events or []:
+                events.append({
+                    "name": stage,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": page_start + offset * 1e6,
+                    "dur": seconds * 1e6,
+                    "pid": page_profile.pid,
+                    "tid": 0,
+                })
+        return events
+
+    def write_trace(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": self.trace_events()}, file)
+
+
+def start_worker_profiler(trace=False):
+    Profiler(trace).enable()
@@ -0,0 +1,312 @@
+import heapq
+import json
+import marshal
+import os
+import re
+import shutil
+import struct
+import tempfile
+
+from array import array
+
+from textnode import TextType
+
+
+SEARCH_INDEX_VERSION = 1
+TERM_CACHE_VERSION = 1
+SEARCH_DIRNAME = "search"
+SEARCH_MANIFEST_FILENAME = "index.json"
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+TERM_OVERHEAD = 128
+TOKEN_PATTERN = re.compile(r"\w{2,}")
+SHARD_CHARACTERS = frozenset("0123456789abcdefghijklmnopqrstuvwxyz")
+OTHER_SHARD = "_"
+RUN_HEADER = struct.Struct("<III")
+
+BLOCK_WEIGHTS = {
+    "h1": 8,
+    "h2": 6,
+    "h3": 4,
+    "h4": 3,
+    "h5": 2,
+    "h6": 2,
+}
+TEXT_TYPE_WEIGHTS = {
+    TextType.TEXT: 1,
+    TextType.BOLD: 2,
+    TextType.ITALIC: 2,
+    TextType.CODE: 1,
+    TextType.LINK: 1,
+    TextType.IMAGE: 1,
+}
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def page_terms(parsed_blocks):
+    terms = {}
+    position = 0
+    for tag, streams in parsed_blocks:
+        block_weight = BLOCK_WEIGHTS.get(tag, 1)
+        for stream in streams:
+            for text_node in stream:
+                weight = block_weight * TEXT_TYPE_WEIGHTS[text_node.text_type]
+                for term in tokenize(text_node.text):
+                    entry = terms.get(term)
+                    if entry is None:
+                        terms[term] = entry = [0, array("I")]
+                    entry[0] += weight
+                    entry[1].append(position)
+                    position += 1
+    return terms
+
+
+def shard_key(term):
+    return term[0] if term[0] in SHARD_CHARACTERS else OTHER_SHARD
+
+
+class Postings:
+    __slots__ = ("documents", "weights", "offsets", "positions")
+
+    def __init__(self):
+        self.documents = array("I")
+        self.weights = array("I")
+        self.offsets = array("I")
+        self.positions = array("I")
+
+    def __repr__(self):
+        return f"Postings({len(self.documents)} documents)"
+
+    def add(self, document, weight, positions):
+        self.documents.append(document)
+        self.weights.append(weight)
+        self.offsets.append(len(self.positions))
+        self.positions.extend(positions)
+
+    def extend(self, other):
+        base = len(self.positions)
+        self.documents.extend(other.documents)
+        self.weights.extend(other.weights)
+        self.offsets.extend(offset + base for offset in other.offsets)
+        self.positions.extend(other.positions)
+
+    def entries(self):
+        offsets = self.offsets.tolist()
+        offsets.append(len(self.positions))
+        positions = self.positions
+        return [
+            [document, weight, positions[offsets[i]:offsets[i + 1]].tolist()]
+            for i, (document, weight) in enumerate(
+                zip(self.documents, self.weights)
+            )
+        ]
+
+
+def write_run(path, postings):
+    with open(path, "wb") as file:
+        for term in sorted(postings):
+            entry = postings[term]
+            encoded = term.encode("utf-8")
+            file.write(RUN_HEADER.pack(
+                len(encoded),
+                len(entry.documents),
+                len(entry.positions)
+            ))
+            file.write(encoded)
+            entry.documents.tofile(file)
+            entry.weights.tofile(file)
+            entry.offsets.tofile(file)
+            entry.positions.tofile(file)
+
+
+def read_run(path):
+    with open(path, "rb") as file:
+        while header := file.read(RUN_HEADER.size):
+            term_length, documents, positions = RUN_HEADER.unpack(header)
+            term = file.read(term_length).decode("utf-8")
+            entry = Postings()
+            entry.documents.fromfile(file, documents)
+            entry.weights.fromfile(file, documents)
+            entry.offsets.fromfile(file, documents)
+            entry.positions.fromfile(file, positions)
+            yield term, entry
+
+
+class SearchIndexBuilder:
+    def __init__(self, output_dir, memory_budget=DEFAULT_MEMORY_BUDGET):
+        self.output_dir = output_dir
+        self.memory_budget = memory_budget
+        self.documents = []
+        self.postings = {}
+        self.size = 0
+        self.spill_dir = None
+        self.runs = []
+        self.spills = 0
+
+    def __repr__(self):
+        return (
+            f"SearchIndexBuilder({self.output_dir}, "
+            f"documents={len(self.documents)}, spills={self.spills})"
+        )
+
+    def add_page(self, url, title, terms):
+        document = len(self.documents)
+        self.documents.append({"url": url, "title": title})
+        postings = self.postings
+        size = self.size
+        for term, (weight, positions) in terms.items():
+            entry = postings.get(term)
+            if entry is None:
+                postings[term] = entry = Postings()
+                size += TERM_OVERHEAD + len(term)
+            entry.add(document, weight, positions)
+            size += 12 + 4 * len(positions)
+        self.size = size
+        if size > self.memory_budget:
+            self.spill()
+        return document
+
+    def spill(self):
+        if not self.postings:
+            return
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="search-")
+        path = os.path.join(self.spill_dir, f"{len(self.runs)}.run")
+        write_run(path, self.postings)
+        self.runs.append(path)
+        self.spills += 1
+        self.postings = {}
+        self.size = 0
+
+    def merged_terms(self):
+        runs = [read_run(path) for path in self.runs]
+        runs.append(
+            (term, self.postings[term]) for term in sorted(self.postings)
+        )
+        merged = heapq.merge(*runs, key=lambda item: item[0])
+        current_term, current = None, None
+        for term, entry in merged:
+            if term == current_term:
+                current.extend(entry)
+                continue
+            if current is not None:
+                yield current_term, current
+            current_term, current = term, entry
+        if current is not None:
+            yield current_term, current
+
+    def write(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        shards = {}
+        terms = 0
+        try:
+            for term, entry in self.merged_terms():
+                key = shard_key(term)
+                file = shards.get(key)
+                if file is None:
+                    shards[key] = file = self.open_shard(key)
+                else:
+                    file.write(",")
+                file.write(
+                    f"{json.dumps(term)}:"
+                    f"{json.dumps(entry.entries(), separators=(',', ':'))}"
+                )
+                terms += 1
+            for key, file in shards.items():
+                self.close_shard(file, key)
+        finally:
+            for file in shards.values():
+                file.close()
+            self.cleanup()
+
+        manifest = {
+            "version": SEARCH_INDEX_VERSION,
+            "documents": self.documents,
+            "shards": {key: f"{key}.json" for key in sorted(shards)},
+            "terms": terms,
+        }
+        path = os.path.join(self.output_dir, SEARCH_MANIFEST_FILENAME)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, separators=(",", ":"))
+        os.replace(temporary_path, path)
+        self.remove_stale_shards(shards)
+        return manifest
+
+    def remove_stale_shards(self, shards):
+        for key in sorted(SHARD_CHARACTERS | {OTHER_SHARD}):
+            if key not in shards:
+                try:
+                    os.remove(self.shard_path(key))
+                except FileNotFoundError:
+                    pass
+
+    def shard_path(self, key):
+        return os.path.join(self.output_dir, f"{key}.json")
+
+    def open_shard(self, key):
+        path = self.shard_path(key)
+        file = open(f"{path}.{os.getpid()}.tmp", "w", encoding="utf-8")
+        file.write("{")
+        return file
+
+    def close_shard(self, file, key):
+        file.write("}")
+        file.close()
+        path = self.shard_path(key)
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+
+    def cleanup(self):
+        if self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+            self.spill_dir = None
+        self.runs = []
+        self.postings = {}
+        self.size = 0
+
+
+class TermCache:
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return (
+            f"TermCache({self.directory}, hits={self.hits}, "
+            f"misses={self.misses})"
+        )
+
+    def path(self, digest):
+        key = digest.hex()
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def get(self, digest):
+        try:
+            with open(self.path(digest), "rb") as file:
+                version, title, entries = marshal.load(file)
+        except (FileNotFoundError, EOFError, ValueError, TypeError):
+            version = None
+        if version != TERM_CACHE_VERSION:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return title, {
+            term: [weight, array("I", positions)]
+            for term, (weight, positions) in entries.items()
+        }
+
+    def put(self, digest, title, terms):
+        entries = {
+            term: (weight, positions.tobytes())
+            for term, (weight, positions) in terms.items()
+        }
+        path = self.path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            marshal.dump((TERM_CACHE_VERSION, title, entries), file)
+        os.replace(temp_path, path)
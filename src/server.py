@@ -0,0 +1,252 @@
+import argparse
+import hashlib
+import os
+import posixpath
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import unquote, urlsplit
+
+from assets import ASSET_EXCLUDE_PATTERNS, content_patterns, is_excluded
+from build import apply_template, page_title, render_page
+from template import TemplateLoader
+
+
+SOURCE_EXTENSION = ".md"
+
+
+def file_stats(paths):
+    stats = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            stats.append(None)
+        else:
+            stats.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stats)
+
+
+class RenderedPage:
+    __slots__ = ("stat", "body", "etag")
+
+    def __init__(self, stat, body):
+        self.stat = stat
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+    def __repr__(self):
+        return f"RenderedPage({self.etag}, {len(self.body)} bytes)"
+
+
+class PageCache:
+    def __init__(self, template_path=None):
+        self.template_path = template_path
+        self.templates = TemplateLoader()
+        self.template_stats = None
+        self.pages = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"PageCache({len(self.pages)} pages)"
+
+    def template(self):
+        if self.template_path is None:
+            return None
+        with self.lock:
+            template = self.templates.templates.get(
+                os.path.normpath(self.template_path)
+            )
+            if (
+                template is not None
+                and file_stats(template.dependencies) != self.template_stats
+            ):
+                self.templates.invalidate(template.dependencies)
+            template = self.templates.load(self.template_path)
+            self.template_stats = file_stats(template.dependencies)
+            return template
+
+    def get(self, source_path):
+        template = self.template()
+        stat = os.stat(source_path)
+        stat_key = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            template.digest if template is not None else ""
+        )
+        with self.lock:
+            page = self.pages.get(source_path)
+            if page is not None and page.stat == stat_key:
+                self.hits += 1
+                return page
+            self.misses += 1
+
+        with open(source_path, encoding="utf-8") as file:
+            markdown = file.read()
+        html = render_page(markdown)
+        if template is not None:
+            html = apply_template(
+                template, html, page_title(markdown, source_path)
+            )
+        page = RenderedPage(stat_key, html.encode("utf-8"))
+        with self.lock:
+            self.pages[source_path] = page
+        return page
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    page_cache = None
+
+    def request_path(self):
+        return posixpath.normpath(unquote(urlsplit(self.path).path))
+
+    def page_source(self):
+        relative_path = self.request_path().lstrip("/")
+        if relative_path in ("", "."):
+            relative_path = "index"
+        elif self.path.split("?", 1)[0].endswith("/"):
+            relative_path = posixpath.join(relative_path, "index")
+        elif relative_path.endswith(".html"):
+            relative_path = relative_path[:-len(".html")]
+
+        if relative_path == ".." or relative_path.startswith("../"):
+            return None
+        for candidate in (relative_path, posixpath.join(relative_path, "index")):
+            source_path = os.path.join(
+                self.directory, candidate + SOURCE_EXTENSION
+            )
+            if os.path.isfile(source_path):
+                return source_path
+        return None
+
+    def send_page(self, include_body):
+        source_path = self.page_source()
+        if source_path is None:
+            return False
+
+        try:
+            page = self.page_cache.get(source_path)
+        except (ValueError, OSError) as error:
+            self.send_error(500, "Page failed to render", str(error))
+            return True
+        if self.headers.get("If-None-Match") == page.etag:
+            self.send_response(304)
+            self.send_header("ETag", page.etag)
+            self.end_headers()
+            return True
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(page.body)))
+        self.send_header("ETag", page.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if include_body:
+            self.wfile.write(page.body)
+        return True
+
+    def excluded_patterns(self):
+        template_path = self.page_cache.template_path
+        if template_path is None:
+            return ASSET_EXCLUDE_PATTERNS
+        try:
+            paths = self.page_cache.template().dependencies
+        except (ValueError, OSError):
+            paths = [template_path]
+        return ASSET_EXCLUDE_PATTERNS + content_patterns(
+            paths, self.directory
+        )
+
+    def send_not_published(self):
+        relative_path = self.request_path().lstrip("/")
+        parts = relative_path.split("/")
+        patterns = self.excluded_patterns()
+        if relative_path.endswith(SOURCE_EXTENSION) or any(
+            is_excluded("/".join(parts[:end]), patterns)
+            for end in range(1, len(parts) + 1)
+        ):
+            self.send_error(404, "File not found")
+            return True
+        return False
+
+    def do_GET(self):
+        if self.send_not_published():
+            return
+        if not self.send_page(include_body=True):
+            super().do_GET()
+
+    def do_HEAD(self):
+        if self.send_not_published():
+            return
+        if not self.send_page(include_body=False):
+            super().do_HEAD()
+
+
+class ThreadPoolHTTPServer(HTTPServer):
+    def __init__(self, server_address, handler_class, threads=8):
+        super().__init__(server_address, handler_class)
+        self.executor = ThreadPoolExecutor(max_workers=threads)
+
+    def process_request(self, request, client_address):
+        self.executor.submit(
+            self.process_request_thread, request, client_address
+        )
+
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def create_server(
+    content_dir, host="127.0.0.1", port=8888, threads=8, template_path=None
+):
+    handler_class = type(
+        "ContentRequestHandler",
+        (DevRequestHandler,),
+        {"page_cache": PageCache(template_path)}
+    )
+
+    def handler(*args, **kwargs):
+        return handler_class(*args, directory=content_dir, **kwargs)
+
+    return ThreadPoolHTTPServer((host, port), handler, threads)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve markdown pages rendered on demand."
+    )
+    parser.add_argument("content_dir", nargs="?", default="content")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument(
+        "--template", help="layout that wraps each rendered page"
+    )
+    args = parser.parse_args()
+
+    server = create_server(
+        args.content_dir, args.host, args.port, args.threads, args.template
+    )
+    print(f"Serving {args.content_dir} at http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
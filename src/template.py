@@ -0,0 +1,127 @@
+import hashlib
+import os
+import re
+
+
+TAG_PATTERN = re.compile(
+    r"\{\{\s*(>)?\s*([\w./-]+)\s*\}\}"
+    r"|\{%\s*include\s+\"([^\"]+)\"\s*%\}"
+)
+PARTIALS_DIRNAME = "partials"
+PARTIAL_EXTENSION = ".html"
+
+
+class CompiledTemplate:
+    __slots__ = ("path", "parts", "slots", "dependencies", "digest")
+
+    def __init__(self, path, parts, slots, dependencies, digest):
+        self.path = path
+        self.parts = parts
+        self.slots = slots
+        self.dependencies = dependencies
+        self.digest = digest
+
+    def __repr__(self):
+        return (
+            f"CompiledTemplate({self.path}, {len(self.parts)} parts, "
+            f"{len(self.slots)} slots)"
+        )
+
+    def render(self, values):
+        parts = self.parts.copy()
+        try:
+            for index, name in self.slots:
+                parts[index] = values[name]
+        except KeyError as error:
+            raise ValueError(
+                f"Template variable '{error.args[0]}' has no value."
+            ) from None
+        return "".join(parts)
+
+
+def read_template(path):
+    with open(path, encoding="utf-8") as file:
+        return file.read()
+
+
+def partial_path(template_path, name):
+    return os.path.join(
+        os.path.dirname(template_path), PARTIALS_DIRNAME,
+        name + PARTIAL_EXTENSION
+    )
+
+
+def compile_template(path):
+    parts = []
+    slots = []
+    dependencies = []
+    digest = hashlib.sha256()
+
+    def add_literal(text):
+        if not text:
+            return
+        if parts and parts[-1] is not None:
+            parts[-1] += text
+        else:
+            parts.append(text)
+
+    def expand(path, root_path, stack):
+        path = os.path.normpath(path)
+        if path in stack:
+            cycle = " -> ".join(stack + [path])
+            raise ValueError(f"Template include cycle: {cycle}")
+        source = read_template(path)
+        if path not in dependencies:
+            dependencies.append(path)
+        digest.update(path.encode("utf-8") + b"\0")
+        digest.update(source.encode("utf-8") + b"\0")
+
+        position = 0
+        for match in TAG_PATTERN.finditer(source):
+            add_literal(source[position:match.start()])
+            position = match.end()
+            partial, name, include = match.groups()
+            if include is not None:
+                include_path = os.path.join(os.path.dirname(path), include)
+                expand(include_path, root_path, stack + [path])
+            elif partial:
+                expand(
+                    partial_path(root_path, name), root_path, stack + [path]
+                )
+            else:
+                slots.append((len(parts), name))
+                parts.append(None)
+        add_literal(source[position:])
+
+    expand(path, path, [])
+    return CompiledTemplate(
+        os.path.normpath(path),
+        parts,
+        tuple(slots),
+        tuple(dependencies),
+        digest.hexdigest()
+    )
+
+
+class TemplateLoader:
+    def __init__(self):
+        self.templates = {}
+        self.compiles = 0
+
+    def __repr__(self):
+        return f"TemplateLoader({len(self.templates)} templates)"
+
+    def load(self, path):
+        path = os.path.normpath(path)
+        template = self.templates.get(path)
+        if template is None:
+            template = compile_template(path)
+            self.templates[path] = template
+            self.compiles += 1
+        return template
+
+    def invalidate(self, paths):
+        paths = {os.path.normpath(path) for path in paths}
+        for path, template in list(self.templates.items()):
+            if paths.intersection(template.dependencies):
+                del self.templates[path]
@@ -0,0 +1,230 @@
+import os
+import tempfile
+import unittest
+
+from assets import (
+    ASSET_EXCLUDE_PATTERNS,
+    AssetPipeline,
+    AssetRewriter,
+    content_patterns,
+    copy_file,
+    file_digest,
+    find_assets,
+    fingerprint_path
+)
+from leafnode import LeafNode
+from parentnode import ParentNode
+
+
+class TestAssetPipeline(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.content_dir = os.path.join(self.directory.name, "content")
+        self.public_dir = os.path.join(self.directory.name, "public")
+        self.manifest_path = os.path.join(self.directory.name, "assets.json")
+        self.write("img/logo.png", b"logo")
+        self.write("index.md", b"# Home")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, relative_path, data):
+        path = os.path.join(self.content_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(data)
+        return path
+
+    def read_output(self, relative_path):
+        with open(os.path.join(self.public_dir, relative_path), "rb") as file:
+            return file.read()
+
+    def pipeline(self, fingerprint=False):
+        return AssetPipeline(
+            self.content_dir,
+            self.public_dir,
+            self.manifest_path,
+            fingerprint,
+            threads=2
+        )
+
+    def test_find_assets(self):
+        """
+        Test that every file except markdown pages and hidden or underscored
+        files is an asset.
+        """
+        self.write(".env", b"secret")
+        self.write("_partials/header.html", b"<header>")
+        self.write("img/_draft.png", b"draft")
+
+        self.assertEqual(list(find_assets(self.content_dir)), ["img/logo.png"])
+
+    def test_find_assets_exclude(self):
+        """
+        Test that exclude patterns match either a file's name or its path
+        relative to the content directory.
+        """
+        self.write("layout.html", b"<html>")
+        self.write("partials/footer.html", b"<footer>")
+        self.write("img/logo.psd", b"layers")
+        exclude = ASSET_EXCLUDE_PATTERNS + ("*.psd", "partials/*")
+
+        self.assertEqual(
+            list(find_assets(self.content_dir, exclude)),
+            ["layout.html", "img/logo.png"]
+        )
+
+    def test_content_patterns(self):
+        """
+        Test that only paths inside the content directory become exclude
+        patterns, with glob characters escaped.
+        """
+        paths = [
+            os.path.join(self.content_dir, "layout[1].html"),
+            os.path.join(self.content_dir, "partials", "nav.html"),
+            os.path.join(self.directory.name, "base.html"),
+        ]
+
+        self.assertEqual(
+            content_patterns(paths, self.content_dir),
+            ("layout[[]1].html", "partials/nav.html")
+        )
+
+    def test_copy_file(self):
+        """
+        Test that a file larger than one copy chunk is copied exactly and
+        keeps its modification time.
+        """
+        data = os.urandom(3 * 1024 * 1024 + 5)
+        source_path = self.write("video.bin", data)
+        output_path = os.path.join(self.directory.name, "video.bin")
+
+        self.assertEqual(copy_file(source_path, output_path), len(data))
+        with open(output_path, "rb") as file:
+            self.assertEqual(file.read(), data)
+        self.assertEqual(
+            os.stat(output_path).st_mtime_ns, os.stat(source_path).st_mtime_ns
+        )
+
+    def test_copy_only_changed(self):
+        """
+        Test that unchanged assets are neither hashed nor copied, touched
+        ones are hashed but not copied, and edited ones are copied.
+        """
+        first = self.pipeline().run()
+        second = self.pipeline().run()
+
+        path = os.path.join(self.content_dir, "img", "logo.png")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        touched = self.pipeline().run()
+
+        self.write("img/logo.png", b"LOGO")
+        edited = self.pipeline().run()
+
+        self.assertEqual((first.copied, first.copied_bytes), (1, 4))
+        self.assertEqual((second.hashed, second.copied), (0, 0))
+        self.assertEqual((touched.hashed, touched.copied), (2, 0))
+        self.assertEqual(edited.copied, 1)
+        self.assertEqual(self.read_output("img/logo.png"), b"LOGO")
+
+    def test_removed_asset(self):
+        """Test that the output of a deleted asset is removed."""
+        self.pipeline().run()
+        os.remove(os.path.join(self.content_dir, "img", "logo.png"))
+        report = self.pipeline().run()
+
+        self.assertEqual(report.removed, 1)
+        self.assertFalse(
+            os.path.exists(os.path.join(self.public_dir, "img", "logo.png"))
+        )
+
+    def test_fingerprint(self):
+        """
+        Test that fingerprinted assets are named by their content hash and
+        the previous copy is removed when the content changes.
+        """
+        pipeline = self.pipeline(fingerprint=True)
+        pipeline.run()
+        old_path = fingerprint_path(
+            "img/logo.png",
+            file_digest(os.path.join(self.content_dir, "img", "logo.png"))
+        )
+
+        self.assertEqual(pipeline.urls(), {"img/logo.png": old_path})
+        self.assertEqual(self.read_output(old_path), b"logo")
+
+        self.write("img/logo.png", b"LOGO")
+        pipeline = self.pipeline(fingerprint=True)
+        report = pipeline.run()
+        new_path = pipeline.urls()["img/logo.png"]
+
+        self.assertNotEqual(new_path, old_path)
+        self.assertEqual(report.removed, 1)
+        self.assertEqual(os.listdir(os.path.join(self.public_dir, "img")), [
+            os.path.basename(new_path)
+        ])
+
+    def test_fingerprint_images_only(self):
+        """
+        Test that only images are fingerprinted while other assets keep
+        their names, since only image and link URLs in pages are rewritten.
+        """
+        self.write("style.css", b"body {}")
+        self.write("robots.txt", b"User-agent: *")
+        pipeline = self.pipeline(fingerprint=True)
+        pipeline.run()
+
+        self.assertEqual(list(pipeline.urls()), ["img/logo.png"])
+        self.assertEqual(self.read_output("style.css"), b"body {}")
+        self.assertEqual(
+            sorted(pipeline.outputs()),
+            ["img/logo.3598ce6f.png", "robots.txt", "style.css"]
+        )
+
+
+class TestAssetRewriter(unittest.TestCase):
+    def setUp(self):
+        self.content_dir = os.path.join("site", "content")
+        self.rewriter = AssetRewriter(
+            self.content_dir, {"img/logo.png": "img/logo.0123abcd.png"}
+        )
+        self.page = os.path.join(self.content_dir, "blog", "post.md")
+
+    def test_rewrite_url(self):
+        """
+        Test that relative and absolute asset URLs are rewritten while
+        external and unknown URLs are kept.
+        """
+        cases = [
+            ("../img/logo.png", "../img/logo.0123abcd.png"),
+            ("/img/logo.png?v=1#top", "/img/logo.0123abcd.png?v=1#top"),
+            ("https://example.com/img/logo.png", None),
+            ("img/logo.png", None),
+        ]
+        for url, expected in cases:
+            self.assertEqual(
+                self.rewriter.rewrite_url(url, self.page), expected or url
+            )
+
+    def test_rewrite_node(self):
+        """
+        Test that image and link LeafNodes in a tree get rewritten props
+        without modifying the original nodes.
+        """
+        image = LeafNode("img", "", {"src": "/img/logo.png", "alt": "x"})
+        link = LeafNode("a", "full", {"href": "../img/logo.png"})
+        node = ParentNode("p", [LeafNode(None, "text"), image, link])
+
+        rewritten = self.rewriter.rewrite_node(node, self.page)
+
+        self.assertEqual(
+            rewritten.to_html(),
+            '<p>text<img src="/img/logo.0123abcd.png" alt="x"></img>'
+            '<a href="../img/logo.0123abcd.png">full</a></p>'
+        )
+        self.assertEqual(image.props["src"], "/img/logo.png")
+
+
+if __name__ == "__main__":
+    unittest.main()
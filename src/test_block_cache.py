@@ -0,0 +1,70 @@
+import sys
+import tempfile
+import unittest
+
+from block_cache import BlockCache
+from markdown_to_html import markdown_to_html_node
+
+
+class TestBlockCache(unittest.TestCase):
+    def test_miss_then_hit(self):
+        """Test that a block is a miss until its HTML has been stored."""
+        cache = BlockCache()
+
+        self.assertIsNone(cache.get("# Title"))
+        cache.put("# Title", "<h1>Title</h1>")
+        self.assertEqual(cache.get("# Title"), "<h1>Title</h1>")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_ratio(), 0.5)
+
+    def test_evicts_least_recently_used(self):
+        """
+        Test that the least recently used block is evicted once the cache
+        is over its size cap.
+        """
+        entry_size = sys.getsizeof("a") + sys.getsizeof("<p>a</p>")
+        cache = BlockCache(max_bytes=entry_size * 2)
+        cache.put("a", "<p>a</p>")
+        cache.put("b", "<p>b</p>")
+        cache.get("a")
+        cache.put("c", "<p>c</p>")
+
+        self.assertEqual(list(cache.entries), ["a", "c"])
+        self.assertLessEqual(cache.size, cache.max_bytes)
+
+    def test_skips_oversized_entries(self):
+        """Test that a block larger than the whole cache is not stored."""
+        cache = BlockCache(max_bytes=10)
+        cache.put("a" * 100, "<p>large</p>")
+
+        self.assertEqual(len(cache), 0)
+
+    def test_disk_store_is_shared(self):
+        """
+        Test that a block stored by one cache is found on disk by another
+        cache using the same directory.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            BlockCache(directory=directory).put("# Title", "<h1>Title</h1>")
+            cache = BlockCache(directory=directory)
+
+            self.assertEqual(cache.get("# Title"), "<h1>Title</h1>")
+            self.assertEqual(cache.disk_hits, 1)
+
+
+class TestCachedMarkdownToHTMLNode(unittest.TestCase):
+    def test_matches_uncached(self):
+        """
+        Test that a document rendered through the block cache matches the
+        uncached rendering, and repeated blocks are cache hits.
+        """
+        markdown = "# Title\n\nShared **footer**.\n\n- item\n\nShared **footer**."
+        cache = BlockCache()
+        html = markdown_to_html_node(markdown, cache).to_html()
+
+        self.assertEqual(html, markdown_to_html_node(markdown).to_html())
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,14 @@
+import io
+import mmap
+import tempfile
 import unittest
 
 from block_markdown import (
     BlockType,
     block_to_block_type,
+    classify_blocks,
+    extract_title,
+    iter_markdown_blocks,
     markdown_to_blocks
 )
 
@@ -59,6 +65,61 @@ This is a paragraph.
         self.assertEqual(blocks, expected)
 
 
+class TestIterMarkdownBlocks(unittest.TestCase):
+    markdown = (
+        "\n\n# This is a heading\n\n\n"
+        "This is a **paragraph** of _text_ caf\u00e9.\n\n \n\n"
+        "- This is a list\n- with items\n\n\n\n"
+    )
+
+    def test_matches_markdown_to_blocks(self):
+        """
+        Test that blocks read from a text stream match `markdown_to_blocks()`
+        for every chunk size.
+        """
+        expected = markdown_to_blocks(self.markdown)
+        for chunk_size in range(1, len(self.markdown) + 1):
+            stream = io.StringIO(self.markdown)
+            blocks = list(iter_markdown_blocks(stream, chunk_size))
+
+            self.assertEqual(blocks, expected)
+
+    def test_binary_stream(self):
+        """
+        Test that multi-byte characters split across chunks of a binary
+        stream are decoded correctly.
+        """
+        expected = markdown_to_blocks(self.markdown)
+        for chunk_size in range(1, 8):
+            stream = io.BytesIO(self.markdown.encode("utf-8"))
+            blocks = list(iter_markdown_blocks(stream, chunk_size))
+
+            self.assertEqual(blocks, expected)
+
+    def test_mmap(self):
+        """Test that blocks can be read from a memory-mapped file."""
+        with tempfile.TemporaryFile() as file:
+            file.write(self.markdown.encode("utf-8"))
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                blocks = list(iter_markdown_blocks(mm, 5))
+
+        self.assertEqual(blocks, markdown_to_blocks(self.markdown))
+
+    def test_lazy(self):
+        """Test that blocks are yielded before the stream is exhausted."""
+        stream = io.StringIO("# Heading\n\nParagraph\n\n" + "x" * 100)
+        blocks = iter_markdown_blocks(stream, 4)
+
+        self.assertEqual(next(blocks), "# Heading")
+        self.assertLess(stream.tell(), 20)
+
+    def test_empty_stream(self):
+        """Test that an empty or blank stream yields no blocks."""
+        self.assertEqual(list(iter_markdown_blocks(io.StringIO(""))), [])
+        self.assertEqual(list(iter_markdown_blocks(io.StringIO("\n \n"))), [])
+
+
 class TestBlockToBlockType(unittest.TestCase):
     def test_empty_block(self):
         """Test that an empty block raises a ValueError."""
@@ -223,3 +284,84 @@ class TestBlockToBlockType(unittest.TestCase):
         block_type = block_to_block_type(block)
 
         self.assertEqual(block_type, BlockType.PARAGRAPH)
+
+    def test_ordered_list_block_many_items(self):
+        """
+        Test that an ordered list block with multi-digit item numbers is
+        correctly identified.
+        """
+        block = "\n".join(f"{number}. item" for number in range(1, 13))
+        block_type = block_to_block_type(block)
+
+        self.assertEqual(block_type, BlockType.ORDERED_LIST)
+
+    def test_ordered_list_block_out_of_order(self):
+        """
+        Test that an ordered list block with out of order item numbers is
+        identified as a paragraph.
+        """
+        block = "1. This is an ordered list\n3. with a skipped item"
+        block_type = block_to_block_type(block)
+
+        self.assertEqual(block_type, BlockType.PARAGRAPH)
+
+    def test_unordered_list_block_trailing_newline(self):
+        """
+        Test that an unordered list block ending in an empty line is
+        identified as a paragraph.
+        """
+        block = "- This is an unordered list\n"
+        block_type = block_to_block_type(block)
+
+        self.assertEqual(block_type, BlockType.PARAGRAPH)
+
+    def test_quote_block_invalid_line(self):
+        """
+        Test that a quote block with a line that is not quoted is
+        identified as a paragraph.
+        """
+        block = "> This is a quote\nThis is not"
+        block_type = block_to_block_type(block)
+
+        self.assertEqual(block_type, BlockType.PARAGRAPH)
+
+
+class TestClassifyBlocks(unittest.TestCase):
+    def test_classify_blocks(self):
+        """Test that every block in a list is classified in order."""
+        blocks = [
+            "# Heading",
+            "```\ncode\n```",
+            "> quote",
+            "- item",
+            "1. item",
+            "paragraph",
+        ]
+        expected = [
+            BlockType.HEADER,
+            BlockType.CODE,
+            BlockType.QUOTE,
+            BlockType.UNORDERED_LIST,
+            BlockType.ORDERED_LIST,
+            BlockType.PARAGRAPH,
+        ]
+
+        self.assertListEqual(classify_blocks(blocks), expected)
+
+
+class TestExtractTitle(unittest.TestCase):
+    def test_first_h1(self):
+        """Test that the title is the plain text of the first h1 block."""
+        markdown = "Intro\n\n## Section\n\n# The `code` **bold** title"
+
+        self.assertEqual(extract_title(markdown), "The code bold title")
+
+    def test_ignores_code_blocks(self):
+        """Test that a comment line inside fenced code is not a title."""
+        markdown = "```\n# comment\n```\n\n# Real"
+
+        self.assertEqual(extract_title(markdown), "Real")
+
+    def test_no_title(self):
+        """Test that a document without an h1 block has no title."""
+        self.assertIsNone(extract_title("```\n# comment\n```"))
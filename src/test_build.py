@@ -0,0 +1,681 @@
+import json
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import build
+import markdown_to_html
+
+from build import (
+    build_site,
+    find_pages,
+    page_output_path,
+    render_page
+)
+
+
+class TestBuild(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.content_dir = os.path.join(self.directory.name, "content")
+        self.public_dir = os.path.join(self.directory.name, "public")
+        self.pages = {
+            "index.md": "# Home\n\nWelcome **home**.",
+            "blog/post.md": "# Post\n\n- one\n- two",
+            "blog/notes.txt": "Not a page.",
+        }
+        for relative_path, markdown in self.pages.items():
+            path = os.path.join(self.content_dir, relative_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(markdown)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_output(self, relative_path):
+        path = os.path.join(self.public_dir, relative_path)
+        with open(path, encoding="utf-8") as file:
+            return file.read()
+
+    def test_find_pages(self):
+        """
+        Test that only markdown files are found, with each directory's files
+        listed before its subdirectories.
+        """
+        expected = [
+            os.path.join(self.content_dir, "index.md"),
+            os.path.join(self.content_dir, "blog", "post.md"),
+        ]
+        self.assertListEqual(list(find_pages(self.content_dir)), expected)
+
+    def test_page_output_path(self):
+        """
+        Test that a source path is mapped to an HTML file at the same
+        relative path in the public directory.
+        """
+        source_path = os.path.join(self.content_dir, "blog", "post.md")
+        output_path = page_output_path(
+            source_path, self.content_dir, self.public_dir
+        )
+        expected = os.path.join(self.public_dir, "blog", "post.html")
+
+        self.assertEqual(output_path, expected)
+
+    def test_build_site_single_worker(self):
+        """Test that every page is rendered in-process with one worker."""
+        report = build_site(self.content_dir, self.public_dir, workers=1)
+
+        self.assertEqual(report.pages, 2)
+        self.assertEqual(
+            self.read_output("index.html"),
+            render_page(self.pages["index.md"])
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(self.public_dir, "blog", "notes.html"))
+        )
+
+    def test_build_site_cache(self):
+        """
+        Test that a rebuild with a cache directory only re-renders pages
+        whose source changed.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        first = build_site(
+            self.content_dir, self.public_dir, workers=1, cache_dir=cache_dir
+        )
+        self.assertEqual(
+            (first.hits, first.misses, first.written),
+            (0, 2, 2)
+        )
+
+        path = os.path.join(self.content_dir, "index.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# Home\n\nChanged.")
+        second = build_site(
+            self.content_dir, self.public_dir, workers=1, cache_dir=cache_dir
+        )
+
+        self.assertEqual(
+            (second.hits, second.misses, second.written),
+            (1, 1, 1)
+        )
+        self.assertEqual(
+            self.read_output("index.html"),
+            render_page("# Home\n\nChanged.")
+        )
+
+    def test_build_site_force(self):
+        """
+        Test that a forced rebuild re-renders every page but does not
+        rewrite outputs whose contents are unchanged.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        build_site(
+            self.content_dir, self.public_dir, workers=1, cache_dir=cache_dir
+        )
+        report = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            force=True
+        )
+
+        self.assertEqual(
+            (report.hits, report.misses, report.written),
+            (0, 2, 0)
+        )
+        self.assertEqual(report.skipped, 2)
+        self.assertEqual(
+            report.skipped_bytes,
+            sum(
+                len(render_page(self.pages[page]).encode("utf-8"))
+                for page in ["index.md", "blog/post.md"]
+            )
+        )
+
+    def test_build_site_missing_output(self):
+        """Test that a cached page is re-rendered if its output was deleted."""
+        cache_dir = os.path.join(self.directory.name, "cache")
+        build_site(
+            self.content_dir, self.public_dir, workers=1, cache_dir=cache_dir
+        )
+        os.remove(os.path.join(self.public_dir, "index.html"))
+        report = build_site(
+            self.content_dir, self.public_dir, workers=1, cache_dir=cache_dir
+        )
+
+        self.assertEqual(
+            (report.hits, report.misses, report.written),
+            (1, 1, 1)
+        )
+
+    def test_build_site_block_cache(self):
+        """
+        Test that repeated blocks are served from the block cache and the
+        pages still match uncached rendering.
+        """
+        path = os.path.join(self.content_dir, "blog", "footer.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# Footer\n\nWelcome **home**.")
+        report = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            block_cache_bytes=1024 * 1024
+        )
+
+        self.assertEqual((report.block_hits, report.block_misses), (1, 5))
+        self.assertEqual(
+            self.read_output("index.html"),
+            render_page(self.pages["index.md"])
+        )
+
+    def test_build_site_block_cache_parses_once(self):
+        """
+        Test that pages parsed for search terms are rendered from those
+        parsed blocks and still fill the block cache.
+        """
+        with mock.patch(
+            "markdown_to_html.parse_block",
+            side_effect=markdown_to_html.parse_block
+        ) as parse_block:
+            report = build_site(
+                self.content_dir,
+                self.public_dir,
+                workers=1,
+                block_cache_bytes=1024 * 1024,
+                search_index=True,
+                check_links=True
+            )
+
+        self.assertEqual(parse_block.call_count, 4)
+        self.assertEqual((report.block_hits, report.block_misses), (0, 4))
+        self.assertEqual(
+            self.read_output("index.html"),
+            render_page(self.pages["index.md"])
+        )
+
+    def test_build_site_parse_cache(self):
+        """
+        Test that a forced rebuild loads parsed documents from the parse
+        cache and renders the same pages.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        first = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            parse_cache=True
+        )
+        second = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            force=True,
+            parse_cache=True
+        )
+
+        self.assertEqual(
+            (first.misses, first.document_hits, first.document_misses),
+            (2, 0, 2)
+        )
+        self.assertEqual(
+            (second.misses, second.document_hits, second.document_misses),
+            (2, 2, 0)
+        )
+        self.assertEqual(
+            self.read_output("blog/post.html"),
+            render_page(self.pages["blog/post.md"])
+        )
+
+    def test_build_site_assets(self):
+        """Test that assets are copied next to the rendered pages."""
+        report = build_site(self.content_dir, self.public_dir, workers=1)
+
+        self.assertEqual((report.assets.assets, report.assets.copied), (1, 1))
+        self.assertEqual(
+            self.read_output("blog/notes.txt"), self.pages["blog/notes.txt"]
+        )
+
+    def test_build_site_fingerprint_assets(self):
+        """
+        Test that fingerprinting assets rewrites image sources and renders
+        pages again when an asset changes.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        image_path = os.path.join(self.content_dir, "logo.png")
+        with open(image_path, "wb") as file:
+            file.write(b"logo")
+        with open(os.path.join(self.content_dir, "index.md"), "w") as file:
+            file.write('![logo](logo.png)\n\n```\n<img src="logo.png">\n```')
+
+        build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            fingerprint_assets=True
+        )
+        first = self.read_output("index.html")
+        with open(image_path, "wb") as file:
+            file.write(b"LOGO")
+        report = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            fingerprint_assets=True
+        )
+        second = self.read_output("index.html")
+
+        self.assertRegex(first, r'<img src="logo\.[0-9a-f]{8}\.png"')
+        self.assertIn('<code><img src="logo.png">', first)
+        self.assertNotEqual(second, first)
+        self.assertEqual(report.misses, 2)
+        self.assertTrue(os.path.exists(os.path.join(
+            self.public_dir, second.split('"')[1]
+        )))
+
+    def test_build_site_fingerprint_check_links(self):
+        """
+        Test that only images are fingerprinted, links to them are
+        rewritten, and links are checked against the output names.
+        """
+        for name, data in [("logo.png", b"logo"), ("guide.pdf", b"pdf")]:
+            with open(os.path.join(self.content_dir, name), "wb") as file:
+                file.write(data)
+        path = os.path.join(self.content_dir, "index.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(
+                "[Guide](guide.pdf) [Logo](logo.png) [Post](blog/post.html) "
+                "[Gone](gone.pdf)"
+            )
+
+        report = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            fingerprint_assets=True,
+            check_links=True
+        )
+
+        html = self.read_output("index.html")
+        self.assertIn('<a href="guide.pdf">', html)
+        self.assertRegex(html, r'<a href="logo\.[0-9a-f]{8}\.png">')
+        self.assertEqual(
+            self.read_output(os.path.join("blog", "notes.txt")),
+            self.pages["blog/notes.txt"]
+        )
+        self.assertEqual(report.links.broken, [("index.html", "gone.pdf")])
+
+    def test_build_site_template(self):
+        """
+        Test that pages are wrapped in the template and rendered again
+        when the template changes.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        template_path = os.path.join(self.directory.name, "base.html")
+        with open(template_path, "w", encoding="utf-8") as file:
+            file.write("<title>{{ title }}</title>{{ content }}")
+
+        first = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            template_path=template_path
+        )
+        with open(template_path, "w", encoding="utf-8") as file:
+            file.write("<h1>{{ title }}</h1>{{ content }}")
+        second = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            template_path=template_path
+        )
+
+        self.assertEqual((first.misses, second.misses), (2, 2))
+        self.assertEqual(
+            self.read_output("index.html"),
+            "<h1>Home</h1>" + render_page(self.pages["index.md"])
+        )
+
+    def test_build_site_template_not_copied(self):
+        """
+        Test that a template and its partials inside the content directory
+        are not copied as assets.
+        """
+        template_path = os.path.join(self.content_dir, "layout.html")
+        partials_dir = os.path.join(self.content_dir, "partials")
+        os.makedirs(partials_dir)
+        with open(template_path, "w", encoding="utf-8") as file:
+            file.write("{{> nav }}{{ content }}")
+        with open(os.path.join(partials_dir, "nav.html"), "w") as file:
+            file.write("<nav></nav>")
+
+        report = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            template_path=template_path
+        )
+
+        self.assertEqual(report.assets.assets, 1)
+        self.assertFalse(
+            os.path.exists(os.path.join(self.public_dir, "layout.html"))
+        )
+        self.assertFalse(
+            os.path.exists(os.path.join(self.public_dir, "partials"))
+        )
+
+    def test_build_site_search_index(self):
+        """
+        Test that cached pages stay in the search index and rendering from
+        the parsed blocks matches the plain renderer.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        build_site(
+            self.content_dir, self.public_dir, workers=1, cache_dir=cache_dir
+        )
+        report = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            search_index=True
+        )
+        path = os.path.join(self.public_dir, "search", "h.json")
+        with open(path, encoding="utf-8") as file:
+            shard = json.load(file)
+
+        self.assertEqual(report.hits, 2)
+        self.assertEqual(
+            [document["url"] for document in report.search["documents"]],
+            ["index.html", "blog/post.html"]
+        )
+        self.assertEqual(shard["home"], [[0, 10, [0, 2]]])
+
+        build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            force=True,
+            search_index=True
+        )
+        self.assertEqual(
+            self.read_output("index.html"), render_page(self.pages["index.md"])
+        )
+
+    def test_build_site_search_index_caches(self):
+        """
+        Test that unchanged pages take their terms from the term cache and
+        that rendered pages go through the parse cache.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            search_index=True
+        )
+        with mock.patch(
+            "build.parse_markdown_blocks", side_effect=AssertionError
+        ):
+            cached = build_site(
+                self.content_dir,
+                self.public_dir,
+                workers=1,
+                cache_dir=cache_dir,
+                search_index=True
+            )
+        rendered = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            force=True,
+            parse_cache=True,
+            search_index=True
+        )
+
+        self.assertEqual(cached.hits, 2)
+        self.assertEqual(
+            cached.search["documents"], rendered.search["documents"]
+        )
+        self.assertEqual(
+            (rendered.misses, rendered.document_misses), (2, 2)
+        )
+        self.assertEqual(
+            self.read_output("index.html"), render_page(self.pages["index.md"])
+        )
+
+    def test_build_site_check_links(self):
+        """
+        Test that broken links and orphans are reported and that only
+        edited pages have their links extracted again.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        path = os.path.join(self.content_dir, "index.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# Home\n\n[post](/blog/post) [gone](gone.html)")
+
+        first = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            check_links=True
+        )
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# Home\n\n![notes](blog/notes.txt)")
+        second = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            check_links=True
+        )
+
+        self.assertEqual(first.links.broken, [("index.html", "gone.html")])
+        self.assertEqual(first.links.orphans, [])
+        self.assertEqual((second.hits, second.misses), (1, 1))
+        self.assertEqual(second.links.broken, [])
+        self.assertEqual(second.links.orphans, ["blog/post.html"])
+        self.assertFalse(build.worker_check_links)
+
+    def test_build_site_check_links_parse_cache(self):
+        """
+        Test that links of rendered pages are taken from the parse cache
+        instead of parsing the markdown again.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        path = os.path.join(self.content_dir, "index.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# Home\n\n[post](/blog/post)")
+        build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            parse_cache=True
+        )
+
+        with mock.patch(
+            "build.parse_markdown_blocks", side_effect=AssertionError
+        ):
+            report = build_site(
+                self.content_dir,
+                self.public_dir,
+                workers=1,
+                cache_dir=cache_dir,
+                force=True,
+                parse_cache=True,
+                check_links=True
+            )
+
+        self.assertEqual((report.misses, report.document_hits), (2, 2))
+        self.assertEqual((report.links.links, report.links.orphans), (1, []))
+
+    def test_build_site_feeds(self):
+        """
+        Test that the sitemap covers cached pages too and that unchanged
+        pages leave the feeds alone and reuse their stored titles.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        build_site(
+            self.content_dir, self.public_dir, workers=1, cache_dir=cache_dir
+        )
+        first = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            site_url="https://example.com"
+        )
+        with mock.patch("build.extract_title", side_effect=AssertionError):
+            second = build_site(
+                self.content_dir,
+                self.public_dir,
+                workers=1,
+                cache_dir=cache_dir,
+                site_url="https://example.com"
+            )
+
+        self.assertEqual(first.hits, 2)
+        self.assertEqual(
+            first.feeds.written, ["sitemap.xml", "rss.xml", "atom.xml"]
+        )
+        self.assertEqual(second.feeds.written, [])
+        self.assertIn(
+            "<loc>https://example.com/blog/post.html</loc>",
+            self.read_output("sitemap.xml")
+        )
+        self.assertIn("<title>Post</title>", self.read_output("rss.xml"))
+
+    def test_build_site_listings(self):
+        """
+        Test that front matter is left out of rendered pages and feeds the
+        tag listings, re-reading only the headers of changed pages.
+        """
+        cache_dir = os.path.join(self.directory.name, "cache")
+        path = os.path.join(self.content_dir, "blog", "post.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("---\ntitle: Post\ntags: news\n---\n# Post")
+
+        first = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            listings=True
+        )
+        second = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            cache_dir=cache_dir,
+            listings=True
+        )
+
+        self.assertEqual(
+            self.read_output(os.path.join("blog", "post.html")),
+            render_page("# Post")
+        )
+        self.assertEqual(
+            self.read_output(os.path.join("tags", "news.html")),
+            render_page("# Tagged news\n\n- [Post](/blog/post.html)")
+        )
+        self.assertEqual(
+            (first.listings, first.tags, first.metadata_reads), (2, 1, 2)
+        )
+        self.assertEqual((second.listings, second.metadata_reads), (2, 0))
+
+    def test_build_site_check_links_listings(self):
+        """Test that links to listing pages are not reported broken."""
+        path = os.path.join(self.content_dir, "blog", "post.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("---\ntags: news\n---\n# Post")
+        path = os.path.join(self.content_dir, "index.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("[archive](/archive.html) [news](/tags/news.html)")
+
+        report = build_site(
+            self.content_dir,
+            self.public_dir,
+            workers=1,
+            check_links=True,
+            listings=True
+        )
+
+        self.assertEqual(report.links.broken, [])
+
+    def test_build_site_front_matter_error(self):
+        """
+        Test that a page whose title is a list fails the build with a
+        ValueError naming the page.
+        """
+        path = os.path.join(self.content_dir, "blog", "list.md")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("---\ntitle:\n  - a\n---\n# List")
+
+        with self.assertRaises(ValueError) as context:
+            build_site(self.content_dir, self.public_dir, workers=1)
+
+        self.assertIn(f"{path}: Front matter line 3", str(context.exception))
+
+    def test_build_site_process_pool(self):
+        """
+        Test that pages rendered by a process pool match pages rendered
+        in-process.
+        """
+        build_site(self.content_dir, self.public_dir, workers=2, chunksize=1)
+
+        self.assertEqual(
+            self.read_output(os.path.join("blog", "post.html")),
+            render_page(self.pages["blog/post.md"])
+        )
+
+    def test_build_pages_in_window(self):
+        """
+        Test that pages submitted to the process pool a window at a time
+        come back in source order.
+        """
+        source_paths = []
+        for number in range(7):
+            path = os.path.join(self.content_dir, f"page{number}.md")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(f"# Page {number}")
+            source_paths.append(path)
+        output_paths = [
+            page_output_path(path, self.content_dir, self.public_dir)
+            for path in source_paths
+        ]
+
+        with mock.patch.object(build, "CHUNKS_PER_WORKER", 1):
+            results = list(build.build_pages(
+                source_paths,
+                output_paths,
+                [None] * len(source_paths),
+                workers=2,
+                chunksize=2
+            ))
+
+        self.assertEqual(
+            [result.html for result in results],
+            [
+                render_page(f"# Page {number}").encode("utf-8")
+                for number in range(7)
+            ]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from build_manifest import BuildManifest, page_cache_key
+
+
+class TestPageCacheKey(unittest.TestCase):
+    def test_same_source(self):
+        """Test that the same source and template give the same key."""
+        self.assertEqual(
+            page_cache_key(b"# Title"), page_cache_key(b"# Title")
+        )
+
+    def test_different_source(self):
+        """Test that different sources give different keys."""
+        self.assertNotEqual(page_cache_key(b"# One"), page_cache_key(b"# Two"))
+
+    def test_different_template(self):
+        """Test that a different template hash gives a different key."""
+        self.assertNotEqual(
+            page_cache_key(b"# Title", "a"), page_cache_key(b"# Title", "b")
+        )
+
+
+class TestBuildManifest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "manifest.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_load_missing(self):
+        """Test that loading a missing manifest gives an empty manifest."""
+        manifest = BuildManifest.load(self.path)
+        self.assertEqual(manifest.pages, {})
+
+    def test_load_corrupt(self):
+        """Test that loading a corrupt manifest gives an empty manifest."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("{not json")
+        manifest = BuildManifest.load(self.path)
+
+        self.assertEqual(manifest.pages, {})
+
+    def test_save_and_load(self):
+        """Test that saved page keys are loaded back."""
+        manifest = BuildManifest.load(self.path)
+        manifest.set("index.md", "abc")
+        manifest.save()
+
+        self.assertEqual(BuildManifest.load(self.path).get("index.md"), "abc")
+
+    def test_prune(self):
+        """Test that pages which no longer exist are removed."""
+        manifest = BuildManifest(pages={"index.md": "abc", "old.md": "def"})
+        manifest.prune(["index.md"])
+
+        self.assertEqual(manifest.pages, {"index.md": "abc"})
+
+
+if __name__ == "__main__":
+    unittest.main()
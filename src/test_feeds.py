@@ -0,0 +1,148 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+
+from feeds import (
+    ATOM_NAMESPACE,
+    SITEMAP_NAMESPACE,
+    FeedGenerator,
+    PageEntry,
+    write_sitemaps
+)
+
+
+class TestFeeds(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.public_dir = self.directory.name
+        self.entries = [
+            PageEntry(f"page{i}.html", f"Page {i} & more", 1e9 + i, f"k{i}")
+            for i in range(5)
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def parse(self, filename):
+        return ElementTree.parse(os.path.join(self.public_dir, filename))
+
+    def locations(self, filename):
+        return [
+            element.text
+            for element in self.parse(filename).iter(
+                f"{{{SITEMAP_NAMESPACE}}}loc"
+            )
+        ]
+
+    # --- write_sitemaps() ---
+
+    def test_single_sitemap(self):
+        """Test that a site under the limit gets one sitemap of its URLs."""
+        filenames = write_sitemaps(
+            self.public_dir, "https://example.com/", self.entries
+        )
+
+        self.assertEqual(filenames, ["sitemap.xml"])
+        self.assertEqual(
+            self.locations("sitemap.xml")[0], "https://example.com/page0.html"
+        )
+
+    def test_split_sitemaps(self):
+        """
+        Test that sitemaps past the URL limit are split behind an index and
+        that leftover split files are removed once the site shrinks.
+        """
+        filenames = write_sitemaps(
+            self.public_dir, "https://example.com", self.entries, limit=2
+        )
+
+        self.assertEqual(
+            filenames, ["sitemap-1.xml", "sitemap-2.xml", "sitemap-3.xml"]
+        )
+        self.assertEqual(
+            self.locations("sitemap.xml")[2],
+            "https://example.com/sitemap-3.xml"
+        )
+        self.assertEqual(
+            self.locations("sitemap-3.xml"), ["https://example.com/page4.html"]
+        )
+
+        write_sitemaps(self.public_dir, "https://example.com", self.entries)
+        self.assertFalse(
+            os.path.exists(os.path.join(self.public_dir, "sitemap-1.xml"))
+        )
+
+    # --- FeedGenerator ---
+
+    def test_feeds_newest_first(self):
+        """
+        Test that the feeds list the newest pages first with their titles
+        escaped.
+        """
+        generator = FeedGenerator(
+            self.public_dir, "https://example.com", "Site", entry_limit=3
+        )
+        generator.generate(self.entries)
+
+        titles = [
+            element.text
+            for element in self.parse("rss.xml").iter("title")
+        ]
+        self.assertEqual(titles, [
+            "Site", "Page 4 & more", "Page 3 & more", "Page 2 & more"
+        ])
+        entries = self.parse("atom.xml").findall(
+            f"{{{ATOM_NAMESPACE}}}entry"
+        )
+        self.assertEqual(len(entries), 3)
+
+    def test_regenerate_only_changed_feeds(self):
+        """
+        Test that feeds are skipped while their pages are unchanged and
+        only the sitemap is written when an old page changes.
+        """
+        state_path = os.path.join(self.public_dir, "cache", "feeds.json")
+
+        def generate(entries):
+            return FeedGenerator(
+                self.public_dir,
+                "https://example.com",
+                "Site",
+                state_path,
+                entry_limit=2
+            ).generate(entries)
+
+        first = generate(self.entries)
+        self.entries[4].key = "changed"
+        second = generate(self.entries)
+        self.entries[0].updated += 1
+        third = generate(self.entries)
+        self.entries[4].title = "Renamed"
+        fourth = generate(self.entries)
+
+        self.assertEqual(first.written, ["sitemap.xml", "rss.xml", "atom.xml"])
+        self.assertEqual(second.written, [])
+        self.assertEqual(third.written, ["sitemap.xml"])
+        self.assertEqual(fourth.written, ["rss.xml", "atom.xml"])
+
+    def test_cached_titles(self):
+        """
+        Test that a page's title is kept in the state only for the cache
+        key it was generated with.
+        """
+        state_path = os.path.join(self.public_dir, "cache", "feeds.json")
+        FeedGenerator(
+            self.public_dir, "https://example.com", "Site", state_path
+        ).generate(self.entries)
+        generator = FeedGenerator(
+            self.public_dir, "https://example.com", "Site", state_path
+        )
+
+        self.assertEqual(generator.title("page1.html", "k1"), "Page 1 & more")
+        self.assertIsNone(generator.title("page1.html", "k2"))
+        self.assertIsNone(generator.title("missing.html", "k1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
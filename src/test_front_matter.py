@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+
+from front_matter import (
+    front_matter_body,
+    read_front_matter,
+    split_front_matter
+)
+
+
+class TestFrontMatter(unittest.TestCase):
+    # --- split_front_matter() ---
+
+    def test_split_front_matter(self):
+        """
+        Test that the header is parsed into metadata, tags become a list
+        and the body follows the closing delimiter.
+        """
+        markdown = (
+            "---\ntitle: \"Post: one\"\ndate: 2024-01-02\ntags: a, b\n---\n"
+            "# Body"
+        )
+
+        metadata, body = split_front_matter(markdown)
+
+        self.assertEqual(metadata, {
+            "title": "Post: one", "date": "2024-01-02", "tags": ["a", "b"]
+        })
+        self.assertEqual(body, "# Body")
+
+    def test_no_front_matter(self):
+        """
+        Test that documents without a closed header are returned whole.
+        """
+        for markdown in ["# Title", "---\ntitle: open", "----\n---\n"]:
+            self.assertEqual(split_front_matter(markdown), ({}, markdown))
+
+    def test_block_lists(self):
+        """Test that YAML block list items extend the key above them."""
+        markdown = (
+            "---\ntags:\n  - python\n  - \"web dev\"\n"
+            "title: Post\n---\n"
+        )
+
+        self.assertEqual(split_front_matter(markdown)[0], {
+            "tags": ["python", "web dev"],
+            "title": "Post",
+        })
+
+    def test_lists_only_for_list_keys(self):
+        """
+        Test that bracketed values stay text for keys that take a single
+        value and that list items under those keys raise a ValueError.
+        """
+        markdown = "---\ntitle: [WIP] Post\ndate: [2024]\n---\n"
+
+        self.assertEqual(split_front_matter(markdown)[0], {
+            "title": "[WIP] Post", "date": "[2024]"
+        })
+        for key in ["title", "date"]:
+            with self.assertRaisesRegex(ValueError, f"'{key}' takes a single"):
+                split_front_matter(f"---\n{key}:\n  - a\n---\n")
+
+    def test_invalid_line(self):
+        """
+        Test that a header line without a key, or a list item outside a
+        list, raises a ValueError naming the line.
+        """
+        cases = [
+            ("---\ntitle: a\nnot a pair\n---\n", "line 3"),
+            ("---\ntitle: a\n- item\n---\n", "line 3"),
+        ]
+        for markdown, line in cases:
+            with self.assertRaisesRegex(ValueError, line):
+                split_front_matter(markdown)
+
+    # --- front_matter_body() ---
+
+    def test_front_matter_body(self):
+        """Test that only the body bytes are kept."""
+        self.assertEqual(front_matter_body(b"---\na: 1\n---\nbody"), b"body")
+        self.assertEqual(front_matter_body(b"body"), b"body")
+
+    # --- read_front_matter() ---
+
+    def test_read_front_matter_stops_at_header(self):
+        """
+        Test that reading the header leaves the body unread and that an
+        unclosed header within the limit yields no metadata.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "page.md")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("---\ntags: [x, y]\n---\n" + "body\n" * 1000)
+            metadata = read_front_matter(path)
+            unclosed = os.path.join(directory, "unclosed.md")
+            with open(unclosed, "w", encoding="utf-8") as file:
+                file.write("---\n" + "title: long\n" * 100)
+
+            self.assertEqual(metadata, {"tags": ["x", "y"]})
+            self.assertEqual(read_front_matter(unclosed, limit=64), {})
+
+    def test_read_front_matter_error(self):
+        """Test that a header error names the file and the line."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "page.md")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("---\ntags:\n  - a\n  oops\n---\n")
+
+            with self.assertRaises(ValueError) as context:
+                read_front_matter(path)
+
+        self.assertIn(f"{path}: Front matter line 4", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
+import pickle
 import unittest
 
-from htmlnode import HTMLNode
+from htmlnode import HTMLNode, Props, props_cache_info
+from leafnode import LeafNode
+from parentnode import ParentNode
 
 
 class TestHTMLNode(unittest.TestCase):
@@ -30,6 +33,19 @@ class TestHTMLNode(unittest.TestCase):
         self.assertIsNone(node.children)
         self.assertIsNone(node.props)
 
+    def test_no_instance_dict(self):
+        """
+        Test that HTMLNode and its subclasses store their fields in slots
+        rather than an instance dictionary.
+        """
+        nodes = [
+            HTMLNode("p", "Test"),
+            LeafNode("b", "Test"),
+            ParentNode("div", [LeafNode("b", "Test")]),
+        ]
+        for node in nodes:
+            self.assertFalse(hasattr(node, "__dict__"))
+
     # --- __repr__() ---
     def test_representation(self):
         """Test that `__repr__()` returns the correct string representation."""
@@ -47,6 +63,12 @@ class TestHTMLNode(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             node.to_html()
 
+    def test_iter_html(self):
+        """Test that `iter_html()` raises a NotImplementedError."""
+        node = HTMLNode("p", "Test")
+        with self.assertRaises(NotImplementedError):
+            list(node.iter_html())
+
     # --- props_to_html() ---
     def test_props_to_html_with_props(self):
         """
@@ -69,3 +91,80 @@ class TestHTMLNode(unittest.TestCase):
         """
         node = HTMLNode("p", "Test")
         self.assertEqual(node.props_to_html(), "")
+
+    def test_props_to_html_escapes_values(self):
+        """
+        Test that `props_to_html()` escapes characters that are special in
+        HTML attribute values.
+        """
+        node = HTMLNode("a", "Test", props={"href": '/search?q="a"&b=<c>'})
+        expected = ' href="/search?q=&quot;a&quot;&amp;b=&lt;c&gt;"'
+
+        self.assertEqual(node.props_to_html(), expected)
+
+    def test_props_to_html_cache_hits(self):
+        """
+        Test that rendering identical props a second time is served from
+        the cache.
+        """
+        props = {"href": "https://example.com/cache-hit"}
+        HTMLNode("a", "Test", props=props).props_to_html()
+        hits = props_cache_info().hits
+        HTMLNode("a", "Other", props=dict(props)).props_to_html()
+
+        self.assertEqual(props_cache_info().hits, hits + 1)
+
+    def test_props_to_html_unhashable_values(self):
+        """
+        Test that props with unhashable values render without the cache.
+        """
+        node = LeafNode("a", "x", {"data-x": ["a", "b"]})
+
+        self.assertEqual(
+            node.to_html(),
+            '<a data-x="[&#x27;a&#x27;, &#x27;b&#x27;]">x</a>'
+        )
+
+    def test_props_to_html_after_reassignment(self):
+        """
+        Test that `props_to_html()` renders props assigned as a plain dict
+        after initialization.
+        """
+        node = HTMLNode("div", "Test")
+        node.props = {"class": "container"}
+
+        self.assertEqual(node.props_to_html(), ' class="container"')
+
+
+class TestProps(unittest.TestCase):
+    def test_props_are_normalized(self):
+        """Test that an HTMLNode's props are converted to Props."""
+        node = HTMLNode("div", "Test", props={"class": "container"})
+        self.assertIsInstance(node.props, Props)
+        self.assertEqual(node.props, {"class": "container"})
+
+    def test_props_are_immutable(self):
+        """Test that Props cannot be modified."""
+        props = Props({"class": "container"})
+        with self.assertRaises(TypeError):
+            props["id"] = "main"
+        with self.assertRaises(TypeError):
+            props.update({"id": "main"})
+        with self.assertRaises(TypeError):
+            del props["class"]
+
+    def test_props_are_hashable(self):
+        """Test that equal Props have equal hashes."""
+        props1 = Props({"id": "main", "class": "container"})
+        props2 = Props({"class": "container", "id": "main"})
+
+        self.assertEqual(props1, props2)
+        self.assertEqual(hash(props1), hash(props2))
+
+    def test_props_pickle(self):
+        """Test that Props survive a pickle round trip."""
+        props = Props({"href": "https://example.com"})
+        unpickled = pickle.loads(pickle.dumps(props))
+
+        self.assertIsInstance(unpickled, Props)
+        self.assertEqual(unpickled, props)
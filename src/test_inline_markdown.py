@@ -324,6 +324,41 @@ class TestSplitNodesLink(unittest.TestCase):
 
         self.assertListEqual(new_nodes, expected)
 
+    def test_repeated_links(self):
+        """
+        Test that a TextNode with the same link repeated is split at
+        each occurrence.
+        """
+        node = TextNode(
+            "[link](https://example.org) and [link](https://example.org)",
+            TextType.TEXT
+        )
+        new_nodes = split_nodes_link([node])
+        expected = [
+            TextNode("link", TextType.LINK, "https://example.org"),
+            TextNode(" and ", TextType.TEXT),
+            TextNode("link", TextType.LINK, "https://example.org")
+        ]
+
+        self.assertListEqual(new_nodes, expected)
+
+    def test_image_with_same_markup(self):
+        """
+        Test that a link is not split out of an image with the same
+        text and URL that precedes it.
+        """
+        node = TextNode(
+            "![link](https://example.org) [link](https://example.org)",
+            TextType.TEXT
+        )
+        new_nodes = split_nodes_link([node])
+        expected = [
+            TextNode("![link](https://example.org) ", TextType.TEXT),
+            TextNode("link", TextType.LINK, "https://example.org")
+        ]
+
+        self.assertListEqual(new_nodes, expected)
+
 
 class TestSplitNodesDelimiter(unittest.TestCase):
     def test_bold(self):
@@ -535,3 +570,71 @@ class TestTextToTextnodes(unittest.TestCase):
         ]
 
         self.assertListEqual(nodes, expected)
+
+    def test_empty_text(self):
+        """Test that an empty string is converted to no TextNodes."""
+        self.assertListEqual(text_to_textnodes(""), [])
+
+    def test_unclosed_delimiter(self):
+        """
+        Test that a ValueError is raised when a formatted section
+        is not closed.
+        """
+        for text in ["This is **bold", "This is _italic", "This is `code"]:
+            with self.assertRaises(ValueError):
+                text_to_textnodes(text)
+
+    def test_delimiters_inside_bold(self):
+        """
+        Test that italic, code, and link markup inside a bolded section
+        is kept as bolded text.
+        """
+        text = "A **_bold_ `code` [link](https://example.com)** word"
+        nodes = text_to_textnodes(text)
+        expected = [
+            TextNode("A ", TextType.TEXT),
+            TextNode(
+                "_bold_ `code` [link](https://example.com)", TextType.BOLD
+            ),
+            TextNode(" word", TextType.TEXT)
+        ]
+
+        self.assertListEqual(nodes, expected)
+
+    def test_underscore_in_url(self):
+        """
+        Test that underscores in a link's URL are still treated as italic
+        delimiters, since they are split before links are extracted.
+        """
+        text = "A [link](https://example.com/a_b_c) here"
+        nodes = text_to_textnodes(text)
+        expected = [
+            TextNode("A [link](https://example.com/a", TextType.TEXT),
+            TextNode("b", TextType.ITALIC),
+            TextNode("c) here", TextType.TEXT)
+        ]
+
+        self.assertListEqual(nodes, expected)
+
+    def test_matches_chained_splits(self):
+        """
+        Test that text_to_textnodes() produces the same TextNodes as
+        chaining the individual split functions.
+        """
+        texts = [
+            "**a****b**",
+            "***a**",
+            "x![a](b)[c](d)![e](f)y",
+            "!![a](b) and ![c]![d](e)",
+            "[a*](b*) and [a**](b)** c",
+            "_a_`b`**c**_d_",
+        ]
+        for text in texts:
+            nodes = [TextNode(text, TextType.TEXT)]
+            nodes = split_nodes_delimiter(nodes, "**", TextType.BOLD)
+            nodes = split_nodes_delimiter(nodes, "_", TextType.ITALIC)
+            nodes = split_nodes_delimiter(nodes, "`", TextType.CODE)
+            nodes = split_nodes_image(nodes)
+            nodes = split_nodes_link(nodes)
+
+            self.assertListEqual(text_to_textnodes(text), nodes)
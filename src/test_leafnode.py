@@ -1,6 +1,6 @@
 import unittest
 
-from leafnode import LeafNode
+from leafnode import FrozenLeafNode, LeafNode
 
 
 class TestLeafNode(unittest.TestCase):
@@ -107,3 +107,26 @@ class TestLeafNode(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             LeafNode("h2", None).to_html()
         self.assertEqual(str(context.exception), "Value cannot be None.")
+
+    # --- iter_html() ---
+    def test_iter_html(self):
+        """Test that `iter_html()` yields the node's HTML as one fragment."""
+        node = LeafNode("a", "Test", {"href": "example.html"})
+        self.assertListEqual(list(node.iter_html()), [node.to_html()])
+
+
+class TestFrozenLeafNode(unittest.TestCase):
+    # --- __setattr__() ---
+    def test_read_only(self):
+        """
+        Test that a FrozenLeafNode renders like a LeafNode but rejects
+        changes to its fields.
+        """
+        node = FrozenLeafNode("a", "Test", {"href": "example.html"})
+        self.assertEqual(node, LeafNode("a", "Test", {"href": "example.html"}))
+        for name in ["tag", "value", "children", "props"]:
+            with self.assertRaises(AttributeError):
+                setattr(node, name, None)
+        with self.assertRaises(AttributeError):
+            del node.value
+        self.assertEqual(node.to_html(), '<a href="example.html">Test</a>')
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+from link_graph import LinkGraph, page_links, resolve_link
+from markdown_to_html import parse_markdown
+
+
+class TestLinkGraph(unittest.TestCase):
+    # --- page_links() ---
+
+    def test_page_links(self):
+        """
+        Test that link and image targets are collected once each, in the
+        order they first appear, after any asset URL rewriting.
+        """
+        parsed_blocks = parse_markdown(
+            "[a](/a) and ![logo](logo.png)\n\n- [again](/a)\n- `[no](/code)`"
+        )
+
+        self.assertEqual(page_links(parsed_blocks), ["/a", "logo.png"])
+        self.assertEqual(
+            page_links(parsed_blocks, lambda url: url.replace(".", ".1.")),
+            ["/a", "logo.1.png"]
+        )
+
+    # --- resolve_link() ---
+
+    def test_resolve_link(self):
+        """
+        Test that internal links resolve relative to the linking page and
+        external or fragment-only links are skipped.
+        """
+        page = "blog/post.html"
+
+        self.assertEqual(
+            resolve_link("other.html#top", page), "blog/other.html"
+        )
+        self.assertEqual(resolve_link("../img/a%20b.png", page), "img/a b.png")
+        self.assertEqual(resolve_link("/", page), "index.html")
+        self.assertEqual(resolve_link("/docs/", page), "docs/index.html")
+        self.assertIsNone(resolve_link("https://example.com/", page))
+        self.assertIsNone(resolve_link("mailto:me@example.com", page))
+        self.assertIsNone(resolve_link("#section", page))
+
+    # --- LinkGraph ---
+
+    def test_check_broken_links_and_orphans(self):
+        """
+        Test that targets missing from the path index are broken and pages
+        only linked from themselves are orphans.
+        """
+        graph = LinkGraph()
+        graph.set_links("index.html", "k", ["/blog/post", "missing.html"])
+        graph.set_links("blog/post.html", "k", ["../logo.png", "post.html"])
+        graph.set_links("blog/draft.html", "k", ["draft.html", "/docs/"])
+
+        report = graph.check(["logo.png"])
+
+        self.assertEqual(report.links, 6)
+        self.assertEqual(report.broken, [
+            ("index.html", "missing.html"), ("blog/draft.html", "/docs/")
+        ])
+        self.assertEqual(report.orphans, ["blog/draft.html"])
+
+    def test_save_and_load(self):
+        """
+        Test that a saved graph loads with each page's key and links and
+        that pruned pages are dropped.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "links.json")
+            graph = LinkGraph(path)
+            graph.set_links("a.html", "key-a", ["b.html"])
+            graph.set_links("b.html", "key-b", [])
+            graph.prune(["a.html"])
+            graph.save()
+
+            loaded = LinkGraph.load(path)
+
+        self.assertEqual(loaded.get_key("a.html"), "key-a")
+        self.assertIsNone(loaded.get_key("b.html"))
+        self.assertEqual(loaded.pages["a.html"][1], ["b.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+import unittest
+
+from block_cache import BlockCache
+from block_markdown import BlockType, block_to_block_type
+from markdown_to_html import (
+    block_to_html,
+    block_to_html_node,
+    markdown_to_html_node,
+    parse_block,
+    parse_markdown,
+    parsed_title,
+    render_markdown
+)
+
+
+class TestBlockToHTMLNode(unittest.TestCase):
+    def test_header(self):
+        """Test that a header block is converted to the matching h tag."""
+        node = block_to_html_node("### This is a **heading**")
+        self.assertEqual(node.to_html(), "<h3>This is a <b>heading</b></h3>")
+
+    def test_code(self):
+        """
+        Test that a code block is converted to a pre tag without parsing
+        inline markdown.
+        """
+        node = block_to_html_node("```\nThis is _not_ italic\n```")
+        expected = "<pre><code>This is _not_ italic\n</code></pre>"
+
+        self.assertEqual(node.to_html(), expected)
+
+    def test_quote(self):
+        """Test that a quote block is converted to a blockquote tag."""
+        node = block_to_html_node("> This is a\n> _quote_")
+        expected = "<blockquote>This is a <i>quote</i></blockquote>"
+
+        self.assertEqual(node.to_html(), expected)
+
+    def test_unordered_list(self):
+        """Test that an unordered list block is converted to a ul tag."""
+        node = block_to_html_node("- first\n- `second`")
+        expected = "<ul><li>first</li><li><code>second</code></li></ul>"
+
+        self.assertEqual(node.to_html(), expected)
+
+    def test_ordered_list(self):
+        """Test that an ordered list block is converted to an ol tag."""
+        node = block_to_html_node("1. first\n2. second")
+        expected = "<ol><li>first</li><li>second</li></ol>"
+
+        self.assertEqual(node.to_html(), expected)
+
+    def test_paragraph(self):
+        """
+        Test that a paragraph block is converted to a p tag with its
+        lines joined by spaces.
+        """
+        node = block_to_html_node("This is a\n[link](https://example.com)")
+        expected = '<p>This is a <a href="https://example.com">link</a></p>'
+
+        self.assertEqual(node.to_html(), expected)
+
+    def test_malformed_blocks_fall_back_to_paragraph(self):
+        """
+        Test that blocks which only look like another type are converted
+        to paragraphs.
+        """
+        cases = [
+            ("####### seven", "<p>####### seven</p>"),
+            ("> quoted\nplain", "<p>> quoted plain</p>"),
+            ("- item\nplain", "<p>- item plain</p>"),
+            ("1. first\n3. third", "<p>1. first 3. third</p>"),
+        ]
+        for block, expected in cases:
+            self.assertEqual(block_to_html_node(block).to_html(), expected)
+
+    def test_empty_block(self):
+        """Test that converting an empty block raises a ValueError."""
+        with self.assertRaises(ValueError):
+            block_to_html_node("")
+
+
+class TestParseBlock(unittest.TestCase):
+    def test_tags_follow_block_type(self):
+        """
+        Test that every block gets the tag of the type block_to_block_type
+        gives it, including blocks that only look like another type.
+        """
+        tags = {
+            BlockType.HEADER: ("h1", "h2", "h3", "h4", "h5", "h6"),
+            BlockType.CODE: ("pre",),
+            BlockType.QUOTE: ("blockquote",),
+            BlockType.UNORDERED_LIST: ("ul",),
+            BlockType.ORDERED_LIST: ("ol",),
+            BlockType.PARAGRAPH: ("p",),
+        }
+        blocks = [
+            "# one", "###### six", "####### seven", "#no space",
+            "```\ncode\n```", "> a\n> b", "> a\nb", ">a",
+            "- a\n- b", "- a\nb", "-a", "1. a\n2. b", "1. a\n3. b",
+            "2. a", "plain\ntext",
+        ]
+        for block in blocks:
+            tag, _ = parse_block(block)
+            self.assertIn(tag, tags[block_to_block_type(block)], block)
+
+
+class TestBlockToHTML(unittest.TestCase):
+    def test_matches_html_node(self):
+        """
+        Test that rendering a block directly matches the HTML of its node
+        tree for every block type.
+        """
+        blocks = [
+            "### This is a **heading**",
+            "```\nThis is _not_ italic\n```",
+            "> This is a\n> _quote_",
+            "- first\n- `second`",
+            "1. first\n2. [second](https://example.com?a=1&b=2)",
+            "This is a\n![image](https://example.com/a.png)",
+            "- item\nplain",
+        ]
+        for block in blocks:
+            self.assertEqual(
+                block_to_html(block), block_to_html_node(block).to_html()
+            )
+
+
+class TestMarkdownToHTMLNode(unittest.TestCase):
+    def test_document(self):
+        """
+        Test that a markdown document is converted to a div containing
+        one node per block.
+        """
+        markdown = """
+# Title
+
+This is a paragraph with an ![image](https://example.com/a.png).
+
+- item
+"""
+        expected = (
+            "<div><h1>Title</h1>"
+            '<p>This is a paragraph with an '
+            '<img src="https://example.com/a.png" alt="image"></img>.</p>'
+            "<ul><li>item</li></ul></div>"
+        )
+
+        self.assertEqual(markdown_to_html_node(markdown).to_html(), expected)
+
+    def test_empty_document(self):
+        """Test that an empty document is converted to an empty div."""
+        self.assertEqual(markdown_to_html_node("").to_html(), "<div></div>")
+
+
+class TestRenderMarkdown(unittest.TestCase):
+    def test_matches_html_node(self):
+        """
+        Test that rendering a document directly matches the HTML of its
+        node tree.
+        """
+        markdown = "# Title\n\nSome **bold** text.\n\n- one\n- two"
+
+        self.assertEqual(
+            render_markdown(markdown), markdown_to_html_node(markdown).to_html()
+        )
+
+    def test_empty_document(self):
+        """Test that an empty document renders to an empty div."""
+        self.assertEqual(render_markdown(""), "<div></div>")
+
+    def test_asset_url(self):
+        """
+        Test that image and link URLs are rewritten with and without a
+        block cache while image tags inside code samples are kept as
+        written.
+        """
+        markdown = (
+            '![logo](logo.png) [full](logo.png)\n\n'
+            '```\n<img src="logo.png">```'
+        )
+        expected = (
+            '<div><p><img src="logo.1234.png" alt="logo"></img> '
+            '<a href="logo.1234.png">full</a></p>'
+            '<pre><code><img src="logo.png"></code></pre></div>'
+        )
+
+        def asset_url(url):
+            return url.replace(".png", ".1234.png")
+
+        block_cache = BlockCache(1024)
+        self.assertEqual(
+            render_markdown(markdown, asset_url=asset_url), expected
+        )
+        self.assertEqual(
+            render_markdown(markdown, block_cache, asset_url), expected
+        )
+        self.assertNotIn("1234", render_markdown(markdown, block_cache))
+
+
+
+class TestParsedTitle(unittest.TestCase):
+    def test_first_h1(self):
+        """
+        Test that the title is the plain text of the first h1 block and
+        that code blocks are skipped.
+        """
+        parsed_blocks = parse_markdown(
+            "```\n# comment\n```\n\n## Intro\n\n# The **bold** title"
+        )
+
+        self.assertEqual(parsed_title(parsed_blocks), "The bold title")
+        self.assertIsNone(parsed_title(parse_markdown("text")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+
+from build import render_page
+from metadata_index import MetadataIndex, listing_pages, tag_slug, tag_slugs
+
+
+class TestMetadataIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.content_dir = os.path.join(self.directory.name, "content")
+        self.index_path = os.path.join(self.directory.name, "metadata.json")
+        self.paths = [
+            self.write("a.md", "---\ndate: 2023-05-01\ntags: python\n---\n"),
+            self.write(
+                "blog/b.md",
+                "---\ntitle: B\ndate: 2024-02-03\ntags: [python, C++]\n---\n"
+            ),
+            self.write("c.md", "# No front matter"),
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, markdown):
+        path = os.path.join(self.content_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(markdown)
+        return path
+
+    def test_tags_and_archive(self):
+        """
+        Test that pages are grouped by tag and year, newest first, with
+        undated pages last.
+        """
+        index = MetadataIndex()
+        index.update(self.content_dir, self.paths)
+
+        self.assertEqual(index.tags(), {
+            "python": ["blog/b.md", "a.md"], "C++": ["blog/b.md"]
+        })
+        self.assertEqual(index.archive(), {
+            "2024": ["blog/b.md"], "2023": ["a.md"], "Undated": ["c.md"]
+        })
+        self.assertEqual(index.title("a.md"), "a")
+
+    def test_incremental_update(self):
+        """
+        Test that a reloaded index reads only the headers of changed pages
+        and drops removed pages.
+        """
+        index = MetadataIndex(self.index_path)
+        index.update(self.content_dir, self.paths)
+        index.save()
+
+        self.write("a.md", "---\ndate: 2023-05-01\ntags: rust\n---\nlonger")
+        reloaded = MetadataIndex.load(self.index_path)
+        reloaded.update(self.content_dir, self.paths[:2])
+
+        self.assertEqual(reloaded.reads, 1)
+        self.assertEqual(reloaded.metadata("a.md")["tags"], ["rust"])
+        self.assertIsNone(reloaded.metadata("c.md"))
+
+    def test_listing_pages(self):
+        """
+        Test that each tag gets a listing page and the archive links every
+        page.
+        """
+        index = MetadataIndex()
+        index.update(self.content_dir, self.paths)
+
+        listings = listing_pages(index)
+
+        self.assertEqual(
+            sorted(listings),
+            ["archive.html", "tags/c.html", "tags/python.html"]
+        )
+        title, node = listings["tags/python.html"]
+        self.assertEqual(title, "Tagged python")
+        self.assertEqual(node.to_html(), render_page(
+            "# Tagged python\n\n- [B](/blog/b.html) (2024-02-03)\n"
+            "- [a](/a.html) (2023-05-01)"
+        ))
+        self.assertIn(
+            '<h2>Undated</h2><ul><li><a href="/c.html">c</a></li></ul>',
+            listings["archive.html"][1].to_html()
+        )
+        self.assertEqual(tag_slug("C++"), "c")
+
+    def test_listing_titles_escaped(self):
+        """
+        Test that titles and tags are escaped instead of being read as
+        markdown or HTML.
+        """
+        path = self.write(
+            "d.md", "---\ntitle: my_var **x `y <b>\ntags: <i>\n---\n"
+        )
+        index = MetadataIndex()
+        index.update(self.content_dir, [path])
+
+        listings = listing_pages(index)
+
+        self.assertEqual(
+            listings["tags/i.html"][1].to_html(),
+            "<div><h1>Tagged &lt;i&gt;</h1><ul><li><a href=\"/d.html\">"
+            "my_var **x `y &lt;b&gt;</a></li></ul></div>"
+        )
+
+    def test_tag_slug_collisions(self):
+        """
+        Test that tags with the same slug get numbered suffixes in sorted
+        tag order.
+        """
+        self.assertEqual(
+            tag_slugs(["C++", "C#", "c", "Python"]),
+            {"C#": "c", "C++": "c-2", "Python": "python", "c": "c-3"}
+        )
+
+        path = self.write("d.md", "---\ntags: C#\n---\n")
+        index = MetadataIndex()
+        index.update(self.content_dir, self.paths + [path])
+
+        self.assertEqual(sorted(listing_pages(index)), [
+            "archive.html", "tags/c-2.html", "tags/c.html", "tags/python.html"
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
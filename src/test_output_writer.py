@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+from output_writer import OutputWriter
+
+
+class TestOutputWriter(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "blog", "post.html")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read(self, path):
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_write_then_skip_unchanged(self):
+        """
+        Test that a file is written once and skipped while its content
+        stays the same.
+        """
+        with OutputWriter(threads=2) as writer:
+            writer.write(self.path, b"<p>one</p>")
+            writer.flush()
+            writer.write(self.path, b"<p>one</p>")
+
+        self.assertEqual(self.read(self.path), b"<p>one</p>")
+        self.assertEqual((writer.written, writer.written_bytes), (1, 10))
+        self.assertEqual((writer.skipped, writer.skipped_bytes), (1, 10))
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["post.html"])
+
+    def test_rewrite_same_size_change(self):
+        """
+        Test that content of the same size but a different hash is
+        written.
+        """
+        with OutputWriter() as writer:
+            writer.write(self.path, b"<p>one</p>")
+            writer.flush()
+            writer.write(self.path, b"<p>two</p>")
+
+        self.assertEqual(self.read(self.path), b"<p>two</p>")
+        self.assertEqual((writer.written, writer.skipped), (2, 0))
+
+    def test_make_directories(self):
+        """Test that every parent directory is created up front."""
+        paths = [
+            os.path.join(self.directory.name, "a", "b", "one.html"),
+            os.path.join(self.directory.name, "a", "b", "two.html"),
+            os.path.join(self.directory.name, "c", "three.html"),
+        ]
+        with OutputWriter() as writer:
+            writer.make_directories(paths)
+
+        for path in paths:
+            self.assertTrue(os.path.isdir(os.path.dirname(path)))
+
+    def test_errors_surface_on_flush(self):
+        """
+        Test that a failed background write is raised by flush and leaves
+        no temporary file behind.
+        """
+        os.makedirs(self.path)
+        writer = OutputWriter()
+        try:
+            writer.write(self.path, b"<p>one</p>")
+            with self.assertRaises(OSError):
+                writer.flush()
+        finally:
+            writer.close()
+
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["post.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from leafnode import LeafNode
@@ -147,3 +148,57 @@ class TestParentNode(unittest.TestCase):
         )
 
         self.assertEqual(parent.to_html(), expected)
+
+    # --- iter_html() ---
+    def test_iter_html_fragments(self):
+        """
+        Test that `iter_html()` yields the opening tag, children, and closing
+        tag as separate fragments.
+        """
+        child = ParentNode("p", [LeafNode("b", "Test"), LeafNode(None, "word")])
+        parent = ParentNode("div", [child], {"class": "container"})
+        expected = [
+            '<div class="container">',
+            "<p>",
+            "<b>Test</b>",
+            "word",
+            "</p>",
+            "</div>",
+        ]
+
+        self.assertListEqual(list(parent.iter_html()), expected)
+
+    def test_iter_html_deep_tree(self):
+        """
+        Test that `iter_html()` renders trees deeper than the recursion limit.
+        """
+        node = LeafNode("b", "Test")
+        for _ in range(5000):
+            node = ParentNode("span", [node])
+        html = node.to_html()
+
+        self.assertTrue(html.startswith("<span>" * 5000 + "<b>Test</b>"))
+        self.assertTrue(html.endswith("</span>" * 5000))
+
+    def test_iter_html_without_tag_in_child(self):
+        """
+        Test that `iter_html()` raises a ValueError when a nested ParentNode
+        has no `tag`.
+        """
+        parent = ParentNode("div", [ParentNode(None, [LeafNode("b", "Test")])])
+        with self.assertRaises(ValueError) as context:
+            list(parent.iter_html())
+        self.assertEqual(str(context.exception), "Tag cannot be None.")
+
+    # --- write_html() ---
+    def test_write_html(self):
+        """
+        Test that `write_html()` writes the same HTML as `to_html()` returns
+        to the stream.
+        """
+        child = ParentNode("p", [LeafNode("b", "Test"), LeafNode("i", "word")])
+        parent = ParentNode("div", [child])
+        stream = io.StringIO()
+        parent.write_html(stream)
+
+        self.assertEqual(stream.getvalue(), parent.to_html())
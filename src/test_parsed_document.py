@@ -0,0 +1,121 @@
+import tempfile
+import unittest
+
+from inline_markdown import text_to_textnodes
+from markdown_to_html import markdown_to_html_node
+from parsed_document import (
+    DocumentCache,
+    document_to_html_node,
+    dump_document,
+    load_document,
+    parse_document,
+    records_to_text_nodes,
+    source_digest
+)
+
+
+MARKDOWN = """# Title
+
+A paragraph with **bold**, `code` and a [link](https://example.com?a=1&b=2).
+
+```
+code <kept> as is
+```
+
+> a quote
+> with _italic_
+
+- an ![image](https://example.com/a.png "x")
+- item
+
+1. first
+2. second
+"""
+
+
+class TestParsedDocument(unittest.TestCase):
+    def test_render_matches_markdown(self):
+        """
+        Test that a parsed document renders exactly like the markdown it
+        was parsed from.
+        """
+        document = parse_document(MARKDOWN)
+
+        self.assertEqual(
+            document_to_html_node(document).to_html(),
+            markdown_to_html_node(MARKDOWN).to_html()
+        )
+
+    def test_asset_url(self):
+        """
+        Test that image and link URLs are rewritten while rendering a
+        document.
+        """
+        document = parse_document(MARKDOWN)
+
+        def asset_url(url):
+            return url.replace("example.com", "cdn.example.com")
+
+        self.assertEqual(
+            document_to_html_node(document, asset_url).to_html(),
+            markdown_to_html_node(MARKDOWN).to_html().replace(
+                "example.com", "cdn.example.com"
+            )
+        )
+
+    def test_records_round_trip(self):
+        """Test that records convert back to the original TextNodes."""
+        text = "Some **bold** and a [link](https://example.com)"
+        document = parse_document(text)
+        _, streams = document[0]
+
+        self.assertEqual(
+            records_to_text_nodes(streams[0]), text_to_textnodes(text)
+        )
+
+    # --- dump_document() / load_document() ---
+
+    def test_dump_and_load(self):
+        """Test that a dumped document loads back unchanged."""
+        document = parse_document(MARKDOWN)
+        digest = source_digest(MARKDOWN.encode("utf-8"))
+
+        data = dump_document(document, digest)
+
+        self.assertEqual(load_document(data, digest), document)
+
+    def test_load_rejects_stale_or_corrupt_data(self):
+        """
+        Test that data for another source, with a bad header, or
+        truncated is not loaded.
+        """
+        document = parse_document(MARKDOWN)
+        digest = source_digest(MARKDOWN.encode("utf-8"))
+        data = dump_document(document, digest)
+
+        self.assertIsNone(load_document(data, source_digest(b"other")))
+        self.assertIsNone(load_document(b"XXXX" + data[4:], digest))
+        self.assertIsNone(load_document(data[:10], digest))
+        self.assertIsNone(load_document(data[:-3], digest))
+
+
+class TestDocumentCache(unittest.TestCase):
+    def test_parse_then_load(self):
+        """
+        Test that a source is parsed once and loaded from disk after that,
+        including by a fresh cache.
+        """
+        source = MARKDOWN.encode("utf-8")
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DocumentCache(directory)
+            first = cache.parse(source)
+            second = DocumentCache(directory).parse(source)
+
+            self.assertEqual(second, first)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            self.assertEqual(cache.parse(source), first)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import json
+import os
+import tempfile
+import unittest
+
+import markdown_to_html
+import profiling
+
+from build import build_site, render_page
+from profiling import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    markdown = "# Title\n\nSome **bold** text.\n\n- one\n- two"
+
+    def test_enable_and_disable(self):
+        """
+        Test that enabling a profiler wraps the stage functions and
+        disabling it restores the originals.
+        """
+        original_block_to_html = markdown_to_html.block_to_html
+        original_blocks = markdown_to_html.markdown_to_blocks
+        profiler = Profiler()
+        profiler.enable()
+        try:
+            self.assertIs(profiling.active_profiler, profiler)
+            self.assertIsNot(
+                markdown_to_html.block_to_html, original_block_to_html
+            )
+        finally:
+            profiler.disable()
+
+        self.assertIsNone(profiling.active_profiler)
+        self.assertIs(markdown_to_html.block_to_html, original_block_to_html)
+        self.assertIs(markdown_to_html.markdown_to_blocks, original_blocks)
+
+    def test_page_records_stages(self):
+        """
+        Test that every stage run while profiling a page is recorded with
+        its call and node counts.
+        """
+        profiler = Profiler()
+        profiler.enable()
+        try:
+            with profiler.page("index.md") as page_profile:
+                html = render_page(self.markdown)
+        finally:
+            profiler.disable()
+
+        self.assertEqual(html, render_page(self.markdown))
+        self.assertEqual(
+            set(page_profile.stages),
+            {
+                stage for owner, _, stage in profiling.STAGES
+                if owner is markdown_to_html
+            }
+        )
+        self.assertEqual(page_profile.stages["markdown_to_blocks"][1], 1)
+        self.assertEqual(page_profile.stages["markdown_to_blocks"][2], 3)
+        self.assertEqual(page_profile.stages["block_to_html"][1], 3)
+        self.assertEqual(
+            page_profile.stages["block_to_html"][3],
+            len(html.encode("utf-8")) - len("<div></div>")
+        )
+        self.assertIsNone(page_profile.events)
+
+    def test_calls_outside_page_are_not_recorded(self):
+        """Test that stages run outside of a profiled page are ignored."""
+        profiler = Profiler()
+        profiler.enable()
+        try:
+            render_page(self.markdown)
+        finally:
+            profiler.disable()
+
+        self.assertEqual(profiler.stage_totals(), {})
+
+    def test_report(self):
+        """Test that the report lists profiled pages and stages."""
+        profiler = Profiler()
+        profiler.enable()
+        try:
+            for page in ["a.md", "b.md"]:
+                with profiler.page(page) as page_profile:
+                    render_page(self.markdown)
+                profiler.add_page(page_profile)
+        finally:
+            profiler.disable()
+        report = profiler.report()
+
+        self.assertIn("Slowest pages (2 profiled):", report)
+        self.assertIn("a.md", report)
+        self.assertIn("text_to_textnodes", report)
+
+    def test_write_trace(self):
+        """
+        Test that a Chrome trace file contains one event per page and one
+        per stage call.
+        """
+        profiler = Profiler(trace=True)
+        profiler.enable()
+        try:
+            with profiler.page("index.md") as page_profile:
+                render_page(self.markdown)
+            profiler.add_page(page_profile)
+        finally:
+            profiler.disable()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            profiler.write_trace(path)
+            with open(path, encoding="utf-8") as file:
+                events = json.load(file)["traceEvents"]
+
+        calls = sum(values[1] for values in page_profile.stages.values())
+        self.assertEqual(len(events), calls + 1)
+        self.assertEqual(events[0]["name"], "index.md")
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+
+
+class TestBuildProfiling(unittest.TestCase):
+    def test_build_site_profiles_pages(self):
+        """Test that a profiled build records every rendered page."""
+        with tempfile.TemporaryDirectory() as directory:
+            content_dir = os.path.join(directory, "content")
+            os.makedirs(content_dir)
+            for name in ["a.md", "b.md"]:
+                with open(os.path.join(content_dir, name), "w") as file:
+                    file.write("# Title\n\nText.")
+
+            profiler = Profiler()
+            build_site(
+                content_dir,
+                os.path.join(directory, "public"),
+                workers=1,
+                profiler=profiler
+            )
+
+        self.assertEqual(len(profiler.pages), 2)
+        self.assertIsNone(profiling.active_profiler)
+
+    def test_build_site_profiles_parse_cache(self):
+        """
+        Test that pages rendered from the parse cache record the parsed
+        document stages.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            content_dir = os.path.join(directory, "content")
+            os.makedirs(content_dir)
+            with open(os.path.join(content_dir, "a.md"), "w") as file:
+                file.write("# Title\n\nSome **bold** text.")
+
+            profiler = Profiler()
+            build_site(
+                content_dir,
+                os.path.join(directory, "public"),
+                workers=1,
+                cache_dir=os.path.join(directory, "cache"),
+                profiler=profiler,
+                parse_cache=True
+            )
+
+        stages = profiler.pages[0].stages
+        self.assertEqual(stages["parse_document"][1], 1)
+        self.assertEqual(stages["render_document"][1], 1)
+        self.assertGreater(stages["render_document"][3], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
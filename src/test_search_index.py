@@ -0,0 +1,134 @@
+import json
+import os
+import tempfile
+import unittest
+
+from markdown_to_html import parse_markdown
+from search_index import (
+    SearchIndexBuilder,
+    TermCache,
+    page_terms,
+    shard_key
+)
+
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output_dir = os.path.join(self.directory.name, "search")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_shard(self, key):
+        path = os.path.join(self.output_dir, f"{key}.json")
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def build(self, pages, memory_budget):
+        builder = SearchIndexBuilder(self.output_dir, memory_budget)
+        for url, markdown in pages:
+            terms = page_terms(parse_markdown(markdown))
+            builder.add_page(url, url, terms)
+        return builder, builder.write()
+
+    # --- page_terms() ---
+
+    def test_page_terms_positions_and_weights(self):
+        """
+        Test that terms are lowercased with their word positions and that
+        headings and bold text weigh more than plain text.
+        """
+        terms = page_terms(parse_markdown(
+            "# Search Index\n\nThe **index** is an index of `code`."
+        ))
+
+        self.assertEqual(terms["search"][0], 8)
+        self.assertEqual(terms["index"][0], 8 + 2 + 1)
+        self.assertEqual(list(terms["index"][1]), [1, 3, 6])
+        self.assertEqual(list(terms["code"][1]), [8])
+        self.assertNotIn("a", terms)
+
+    # --- SearchIndexBuilder ---
+
+    def test_write_shards(self):
+        """
+        Test that postings are written to shards keyed by each term's
+        first character and listed in the manifest.
+        """
+        _, manifest = self.build(
+            [("a.html", "alpha beta alpha"), ("b.html", "beta 42")],
+            1024 * 1024
+        )
+
+        self.assertEqual(
+            manifest["shards"],
+            {"4": "4.json", "a": "a.json", "b": "b.json"}
+        )
+        self.assertEqual(manifest["documents"][1]["url"], "b.html")
+        self.assertEqual(self.read_shard("a"), {"alpha": [[0, 2, [0, 2]]]})
+        self.assertEqual(
+            self.read_shard("b"), {"beta": [[0, 1, [1]], [1, 1, [0]]]}
+        )
+
+    def test_spill_matches_in_memory(self):
+        """
+        Test that postings spilled to disk past the memory budget merge to
+        the same shards as an index built entirely in memory.
+        """
+        pages = [
+            (f"{i}.html", f"term{i % 7} shared word{i % 3} shared")
+            for i in range(50)
+        ]
+        self.build(pages, 1024 * 1024)
+        expected = {key: self.read_shard(key) for key in ["s", "t", "w"]}
+
+        builder, _ = self.build(pages, 1024)
+
+        self.assertGreater(builder.spills, 1)
+        for key, shard in expected.items():
+            self.assertEqual(self.read_shard(key), shard)
+        self.assertIsNone(builder.spill_dir)
+
+    def test_remove_stale_shards(self):
+        """
+        Test that shards without any terms left are removed while other
+        files in the search directory are kept.
+        """
+        self.build([("a.html", "alpha")], 1024)
+        config_path = os.path.join(self.output_dir, "config.json")
+        with open(config_path, "w", encoding="utf-8") as file:
+            file.write("{}")
+        self.build([("b.html", "beta")], 1024)
+
+        self.assertFalse(
+            os.path.exists(os.path.join(self.output_dir, "a.json"))
+        )
+        self.assertTrue(os.path.exists(config_path))
+        self.assertEqual(shard_key("élan"), "_")
+
+
+
+class TestTermCache(unittest.TestCase):
+    def test_put_then_get(self):
+        """
+        Test that cached terms round-trip and that unknown or corrupt
+        entries are misses.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            cache = TermCache(directory)
+            terms = page_terms(parse_markdown("# Home\n\nhome **page**"))
+            digest = bytes(32)
+
+            self.assertIsNone(cache.get(digest))
+            cache.put(digest, "Home", terms)
+            self.assertEqual(cache.get(digest), ("Home", terms))
+
+            with open(cache.path(digest), "wb") as file:
+                file.write(b"corrupt")
+            self.assertIsNone(cache.get(digest))
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from http.client import HTTPConnection
+from unittest import mock
+
+from build import render_page
+from server import DevRequestHandler, PageCache, create_server
+
+
+class TestPageCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "page.md")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, markdown):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(markdown)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+    def test_reuse_until_source_changes(self):
+        """
+        Test that a page is rendered once and rendered again only after
+        its source changes.
+        """
+        cache = PageCache()
+        self.write("# One")
+        first = cache.get(self.path)
+
+        self.assertIs(cache.get(self.path), first)
+        self.assertEqual(first.body, render_page("# One").encode("utf-8"))
+
+        self.write("# Two")
+        second = cache.get(self.path)
+
+        self.assertEqual(second.body, render_page("# Two").encode("utf-8"))
+        self.assertNotEqual(second.etag, first.etag)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_template(self):
+        """
+        Test that pages are wrapped in the template with an escaped title
+        and rendered again when the template changes.
+        """
+        template_path = os.path.join(self.directory.name, "base.html")
+        with open(template_path, "w", encoding="utf-8") as file:
+            file.write("<title>{{ title }}</title>{{ content }}")
+        cache = PageCache(template_path)
+        self.write("# A <b> & C")
+
+        self.assertEqual(
+            cache.get(self.path).body.decode("utf-8"),
+            "<title>A &lt;b&gt; &amp; C</title>"
+            + render_page("# A <b> & C")
+        )
+
+        with open(template_path, "w", encoding="utf-8") as file:
+            file.write("<main>{{ content }}</main>")
+        stat = os.stat(template_path)
+        os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        self.assertEqual(
+            cache.get(self.path).body.decode("utf-8"),
+            f"<main>{render_page('# A <b> & C')}</main>"
+        )
+
+
+class TestDevServer(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.content_dir = self.directory.name
+        os.makedirs(os.path.join(self.content_dir, "blog"))
+        self.write("index.md", "# Home")
+        self.write(os.path.join("blog", "post.md"), "Some *post*")
+        self.write("image.txt", "not a page")
+        self.write("v1.2-notes.md", "Release *notes*")
+        self.write("broken.md", "broken **bold")
+
+        quiet = mock.patch.object(DevRequestHandler, "log_message")
+        quiet.start()
+        self.addCleanup(quiet.stop)
+        self.server = create_server(self.content_dir, port=0, threads=2)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.directory.cleanup()
+
+    def write(self, name, text):
+        with open(os.path.join(self.content_dir, name), "w") as file:
+            file.write(text)
+
+    def request(self, path, headers=None, server=None):
+        server = server or self.server
+        connection = HTTPConnection(*server.server_address)
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        body = response.read()
+        connection.close()
+        return response, body
+
+    def test_render_on_demand(self):
+        """Test that page URLs are rendered from their markdown source."""
+        for path in ["/", "/index.html"]:
+            response, body = self.request(path)
+            self.assertEqual(response.status, 200)
+            self.assertEqual(body.decode("utf-8"), render_page("# Home"))
+
+        for path in ["/blog/post", "/blog/post.html"]:
+            response, body = self.request(path)
+            self.assertEqual(response.status, 200)
+            self.assertEqual(body.decode("utf-8"), render_page("Some *post*"))
+
+    def test_not_modified(self):
+        """Test that a matching If-None-Match header gets a 304."""
+        response, _ = self.request("/")
+        etag = response.getheader("ETag")
+
+        response, body = self.request("/", {"If-None-Match": etag})
+
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+
+    def test_static_files_and_missing_pages(self):
+        """
+        Test that non-page files are served as-is and unknown pages 404.
+        """
+        response, body = self.request("/image.txt")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, b"not a page")
+
+        response, _ = self.request("/missing.html")
+        self.assertEqual(response.status, 404)
+
+    def test_page_names_with_dots(self):
+        """Test that pages whose names contain dots are rendered."""
+        for path in ["/v1.2-notes", "/v1.2-notes.html"]:
+            response, body = self.request(path)
+            self.assertEqual(response.status, 200)
+            self.assertEqual(
+                body.decode("utf-8"), render_page("Release *notes*")
+            )
+
+    def test_render_error(self):
+        """Test that a page that fails to render gets a 500 with the error."""
+        response, body = self.request("/broken.html")
+
+        self.assertEqual(response.status, 500)
+        self.assertIn(b"Invalid Markdown", body)
+
+    def test_sources_not_served(self):
+        """Test that markdown sources are not served as static files."""
+        response, _ = self.request("/index.md")
+        self.assertEqual(response.status, 404)
+
+    def test_unpublished_files_not_served(self):
+        """
+        Test that hidden and underscored files and the template with its
+        partials are not served, matching what the build publishes.
+        """
+        os.makedirs(os.path.join(self.content_dir, "_drafts"))
+        os.makedirs(os.path.join(self.content_dir, "partials"))
+        self.write(".env", "SECRET=1")
+        self.write(os.path.join("_drafts", "draft.txt"), "draft")
+        self.write("layout.html", "{{> nav }}{{ content }}")
+        self.write(os.path.join("partials", "nav.html"), "<nav></nav>")
+        server = create_server(
+            self.content_dir,
+            port=0,
+            threads=2,
+            template_path=os.path.join(self.content_dir, "layout.html")
+        )
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            for path in [
+                "/.env",
+                "/_drafts/draft.txt",
+                "/layout.html",
+                "/partials/nav.html",
+            ]:
+                response, _ = self.request(path, server=server)
+                self.assertEqual(response.status, 404, path)
+            response, body = self.request("/image.txt", server=server)
+            self.assertEqual((response.status, body), (200, b"not a page"))
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
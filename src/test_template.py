@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+
+from template import TemplateLoader, compile_template
+
+
+class TestTemplate(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.write(
+            "base.html",
+            "<title>{{ title }}</title>{% include \"head.html\" %}"
+            "{{> nav }}<main>{{content}}</main>"
+        )
+        self.write("head.html", "<meta charset=\"utf-8\">")
+        self.write("partials/nav.html", "<nav>{{ title }}</nav>")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write(self, name, text):
+        os.makedirs(os.path.dirname(self.path(name)), exist_ok=True)
+        with open(self.path(name), "w", encoding="utf-8") as file:
+            file.write(text)
+
+    # --- compile_template() ---
+
+    def test_compile_to_parts_and_slots(self):
+        """
+        Test that includes and partials are inlined at compile time and
+        adjacent literals are merged around the slots.
+        """
+        template = compile_template(self.path("base.html"))
+
+        self.assertEqual(template.parts, [
+            "<title>",
+            None,
+            "</title><meta charset=\"utf-8\"><nav>",
+            None,
+            "</nav><main>",
+            None,
+            "</main>",
+        ])
+        self.assertEqual(
+            template.slots, ((1, "title"), (3, "title"), (5, "content"))
+        )
+        self.assertEqual(template.dependencies, (
+            self.path("base.html"),
+            self.path("head.html"),
+            self.path(os.path.join("partials", "nav.html")),
+        ))
+
+    def test_render(self):
+        """Test that rendering fills every slot with its value."""
+        template = compile_template(self.path("base.html"))
+
+        self.assertEqual(
+            template.render({"title": "Home", "content": "<p>Hi</p>"}),
+            "<title>Home</title><meta charset=\"utf-8\"><nav>Home</nav>"
+            "<main><p>Hi</p></main>"
+        )
+
+    def test_render_missing_value(self):
+        """Test that rendering without a slot's value raises a ValueError."""
+        template = compile_template(self.path("base.html"))
+
+        with self.assertRaises(ValueError) as context:
+            template.render({"title": "Home"})
+        self.assertEqual(
+            str(context.exception), "Template variable 'content' has no value."
+        )
+
+    def test_include_cycle(self):
+        """Test that a template including itself raises a ValueError."""
+        self.write("loop.html", "{% include \"loop.html\" %}")
+
+        with self.assertRaises(ValueError):
+            compile_template(self.path("loop.html"))
+
+    def test_digest_follows_dependencies(self):
+        """Test that changing an included file changes the digest."""
+        first = compile_template(self.path("base.html"))
+        self.write("partials/nav.html", "<nav></nav>")
+        second = compile_template(self.path("base.html"))
+
+        self.assertNotEqual(first.digest, second.digest)
+
+    # --- TemplateLoader ---
+
+    def test_loader_caches_until_invalidated(self):
+        """
+        Test that a template is compiled once and compiled again only
+        after one of its dependencies is invalidated.
+        """
+        loader = TemplateLoader()
+        first = loader.load(self.path("base.html"))
+
+        self.assertIs(loader.load(self.path("base.html")), first)
+        loader.invalidate([self.path("other.html")])
+        self.assertIs(loader.load(self.path("base.html")), first)
+
+        loader.invalidate([self.path("head.html")])
+        self.assertIsNot(loader.load(self.path("base.html")), first)
+        self.assertEqual(loader.compiles, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,9 +2,12 @@ import unittest
 
 from leafnode import LeafNode
 from textnode import (
+    INTERN_TEXT_LENGTH,
     TextNode,
     TextType,
-    text_node_to_html_node
+    text_node_to_html_node,
+    text_nodes_to_html,
+    text_nodes_to_html_nodes
 )
  
 
@@ -23,6 +26,16 @@ class TestTextNode(unittest.TestCase):
         self.assertEqual(node.text_type, TextType.LINK)
         self.assertEqual(node.url, "https://example.com")
 
+    def test_no_instance_dict(self):
+        """
+        Test that a TextNode stores its fields in slots rather than
+        an instance dictionary.
+        """
+        node = TextNode("Test", TextType.TEXT)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.extra = "value"
+
     # --- __eq__() ---
     def test_equality_true(self):
         """Test that __eq__() returns True for equal TextNodes."""
@@ -157,6 +170,7 @@ class TestTextNodeToHTMLNode(unittest.TestCase):
 
         self.assertTrue(isinstance(html_node, LeafNode))
         self.assertEqual(html_node.tag, "img")
+        self.assertEqual(html_node.value, "")
         self.assertEqual(html_node.props, {
             "src": "https://example.com",
             "alt": "Test"
@@ -183,5 +197,108 @@ class TestTextNodeToHTMLNode(unittest.TestCase):
         self.assertEqual(str(context.exception), "Invalid TextType.")
 
 
+class TestTextNodesToHTMLNodes(unittest.TestCase):
+    def test_matches_single_conversion(self):
+        """
+        Test that converting a batch gives the same nodes as converting
+        each TextNode on its own.
+        """
+        text_nodes = [
+            TextNode("Some ", TextType.TEXT),
+            TextNode("bold", TextType.BOLD),
+            TextNode("italic", TextType.ITALIC),
+            TextNode("code", TextType.CODE),
+            TextNode("link", TextType.LINK, "https://example.com?a=1&b=2"),
+            TextNode("image", TextType.IMAGE, "https://example.com/a.png"),
+            TextNode("x" * (INTERN_TEXT_LENGTH + 1), TextType.TEXT),
+            TextNode("x" * (INTERN_TEXT_LENGTH + 1), TextType.BOLD),
+        ]
+
+        self.assertEqual(
+            text_nodes_to_html_nodes(text_nodes),
+            [text_node_to_html_node(node) for node in text_nodes]
+        )
+
+    def test_identical_nodes_are_shared(self):
+        """
+        Test that identical short formatted nodes share one LeafNode while
+        plain text and long formatted spans get their own.
+        """
+        long_text = "x" * (INTERN_TEXT_LENGTH + 1)
+        html_nodes = text_nodes_to_html_nodes([
+            TextNode("code", TextType.CODE),
+            TextNode("code", TextType.CODE),
+            TextNode("code", TextType.BOLD),
+            TextNode("word", TextType.TEXT),
+            TextNode("word", TextType.TEXT),
+            TextNode(long_text, TextType.BOLD),
+            TextNode(long_text, TextType.BOLD),
+        ])
+
+        self.assertIs(html_nodes[0], html_nodes[1])
+        self.assertIsNot(html_nodes[0], html_nodes[2])
+        self.assertIsNot(html_nodes[3], html_nodes[4])
+        self.assertIsNot(html_nodes[5], html_nodes[6])
+
+    def test_shared_nodes_are_read_only(self):
+        """
+        Test that shared LeafNodes cannot be modified in place, since every
+        page using them would change too.
+        """
+        node = text_nodes_to_html_nodes([TextNode("code", TextType.CODE)])[0]
+
+        with self.assertRaises(AttributeError):
+            node.value = "changed"
+        with self.assertRaises(AttributeError):
+            node.props = {"class": "x"}
+        self.assertEqual(node.to_html(), "<code>code</code>")
+
+    def test_invalid_type(self):
+        """
+        Test that an Exception is raised when a TextNode in the batch has
+        an invalid type.
+        """
+        with self.assertRaises(Exception) as context:
+            text_nodes_to_html_nodes([TextNode("Test", "word")])
+        self.assertEqual(str(context.exception), "Invalid TextType.")
+
+
+class TestTextNodesToHTML(unittest.TestCase):
+    def test_matches_leaf_node_html(self):
+        """
+        Test that rendering a stream directly matches joining the HTML of
+        its LeafNodes, including escaped attribute values.
+        """
+        text_nodes = [
+            TextNode("Some ", TextType.TEXT),
+            TextNode("bold", TextType.BOLD),
+            TextNode("italic", TextType.ITALIC),
+            TextNode("<code>", TextType.CODE),
+            TextNode("link", TextType.LINK, 'https://example.com?a=1&b="2"'),
+            TextNode("a <b> & 'c'", TextType.IMAGE, "https://example.com/a.png"),
+            TextNode("", TextType.TEXT),
+        ]
+
+        self.assertEqual(
+            text_nodes_to_html(text_nodes),
+            "".join(
+                text_node_to_html_node(node).to_html() for node in text_nodes
+            )
+        )
+
+    def test_empty_stream(self):
+        """Test that an empty stream renders to an empty string."""
+        self.assertEqual(text_nodes_to_html([]), "")
+
+    def test_invalid_type(self):
+        """
+        Test that an Exception is raised when a TextNode in the stream has
+        an invalid type.
+        """
+        with self.assertRaises(Exception) as context:
+            text_nodes_to_html([TextNode("Test", None)])
+        self.assertEqual(str(context.exception), "Invalid TextType.")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,156 @@
+import os
+import tempfile
+import unittest
+
+from build import render_page
+from watch import DependencyGraph, FileWatcher, IncrementalBuilder
+
+
+class TestDependencyGraph(unittest.TestCase):
+    def test_affected_pages(self):
+        """Test that every page depending on a changed path is affected."""
+        graph = DependencyGraph()
+        graph.set_dependencies("a.md", ["a.md", "template.html"])
+        graph.set_dependencies("b.md", ["b.md", "template.html"])
+
+        self.assertEqual(graph.affected_pages(["a.md"]), {"a.md"})
+        self.assertEqual(
+            graph.affected_pages(["template.html"]), {"a.md", "b.md"}
+        )
+        self.assertEqual(graph.affected_pages(["other.md"]), set())
+
+    def test_replace_dependencies(self):
+        """
+        Test that setting a page's dependencies again drops the edges it
+        no longer has.
+        """
+        graph = DependencyGraph()
+        graph.set_dependencies("a.md", ["a.md", "old.html"])
+        graph.set_dependencies("a.md", ["a.md", "new.html"])
+
+        self.assertEqual(graph.affected_pages(["old.html"]), set())
+        self.assertEqual(graph.affected_pages(["new.html"]), {"a.md"})
+
+    def test_remove_page(self):
+        """Test that a removed page is no longer affected by any path."""
+        graph = DependencyGraph()
+        graph.set_dependencies("a.md", ["a.md"])
+        graph.remove_page("a.md")
+
+        self.assertEqual(graph.affected_pages(["a.md"]), set())
+        self.assertEqual(graph.dependents, {})
+
+
+class TestIncrementalBuilder(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.content_dir = os.path.join(self.directory.name, "content")
+        self.public_dir = os.path.join(self.directory.name, "public")
+        os.makedirs(self.content_dir)
+        for name in ["a.md", "b.md"]:
+            self.write(name, f"# {name}")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, markdown):
+        path = os.path.join(self.content_dir, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(markdown)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        return path
+
+    def read_output(self, name):
+        with open(os.path.join(self.public_dir, name), encoding="utf-8") as file:
+            return file.read()
+
+    def test_rebuild_only_changed_page(self):
+        """
+        Test that editing one page re-renders only that page.
+        """
+        builder = IncrementalBuilder(self.content_dir, self.public_dir)
+        builder.build_all()
+        watcher = FileWatcher(builder.watch_paths())
+
+        path = self.write("a.md", "# Changed")
+        rebuilt = builder.rebuild(watcher.poll())
+
+        self.assertEqual(rebuilt, [path])
+        self.assertEqual(self.read_output("a.html"), render_page("# Changed"))
+
+    def test_rebuild_added_and_removed_pages(self):
+        """
+        Test that added pages are rendered and removed pages have their
+        output deleted.
+        """
+        builder = IncrementalBuilder(self.content_dir, self.public_dir)
+        builder.build_all()
+        watcher = FileWatcher(builder.watch_paths())
+
+        self.write("c.md", "# New")
+        os.remove(os.path.join(self.content_dir, "b.md"))
+        builder.rebuild(watcher.poll())
+
+        self.assertEqual(self.read_output("c.html"), render_page("# New"))
+        self.assertFalse(
+            os.path.exists(os.path.join(self.public_dir, "b.html"))
+        )
+
+    def test_rebuild_on_template_change(self):
+        """
+        Test that editing a template re-renders every page with the
+        recompiled template.
+        """
+        template_path = os.path.join(self.directory.name, "base.html")
+        with open(template_path, "w", encoding="utf-8") as file:
+            file.write("<main>{{ content }}</main>")
+        builder = IncrementalBuilder(
+            self.content_dir, self.public_dir, template_path=template_path
+        )
+        builder.build_all()
+        watcher = FileWatcher(builder.watch_paths())
+
+        with open(template_path, "w", encoding="utf-8") as file:
+            file.write("<title>{{ title }}</title>{{ content }}")
+        stat = os.stat(template_path)
+        os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        rebuilt = builder.rebuild(watcher.poll())
+
+        self.assertEqual(len(rebuilt), 2)
+        self.assertEqual(
+            self.read_output("a.html"),
+            "<title>a.md</title>" + render_page("# a.md")
+        )
+        self.assertEqual(builder.templates.compiles, 2)
+
+    def test_rebuild_reports_render_errors(self):
+        """
+        Test that a page that fails to render is reported with its error
+        while the other changed pages are still rebuilt.
+        """
+        builder = IncrementalBuilder(self.content_dir, self.public_dir)
+        builder.build_all()
+        watcher = FileWatcher(builder.watch_paths())
+
+        broken = self.write("a.md", "broken **bold")
+        fixed = self.write("b.md", "# Fixed")
+        rebuilt = builder.rebuild(watcher.poll())
+
+        self.assertEqual(rebuilt, [fixed])
+        self.assertEqual(list(builder.errors), [broken])
+        self.assertIn("Invalid Markdown", builder.errors[broken])
+        self.assertEqual(self.read_output("a.html"), render_page("# a.md"))
+
+        self.write("a.md", "# Repaired")
+        self.assertEqual(builder.rebuild(watcher.poll()), [broken])
+        self.assertEqual(builder.errors, {})
+
+    def test_poll_without_changes(self):
+        """Test that polling an unchanged tree reports no changes."""
+        watcher = FileWatcher([self.content_dir])
+        self.assertEqual(watcher.poll(), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
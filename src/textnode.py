@@ -1,6 +1,13 @@
+import functools
+
 from enum import Enum
 
-from leafnode import LeafNode
+from htmlnode import render_props
+from leafnode import FrozenLeafNode, LeafNode
+
+
+LEAF_CACHE_SIZE = 8192
+INTERN_TEXT_LENGTH = 24
 
 
 class TextType(Enum):
@@ -11,8 +18,12 @@ class TextType(Enum):
     LINK = "link"
     IMAGE = "image"
 
+    __hash__ = object.__hash__
+
 
 class TextNode:
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(self, text, text_type, url=None):
         self.text = text
         self.text_type = text_type
@@ -42,6 +53,81 @@ def text_node_to_html_node(text_node):
         case TextType.LINK:
             return LeafNode("a", text_node.text, {"href": text_node.url})
         case TextType.IMAGE:
-            return LeafNode("img", None, {"src": text_node.url, "alt": text_node.text})
+            return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
         case _:
             raise Exception("Invalid TextType.")
+
+
+TEXT_TYPE_TAGS = {
+    TextType.TEXT: None,
+    TextType.BOLD: "b",
+    TextType.ITALIC: "i",
+    TextType.CODE: "code",
+}
+
+TEXT_TYPE_TAG_PAIRS = {
+    TextType.BOLD: ("<b>", "</b>"),
+    TextType.ITALIC: ("<i>", "</i>"),
+    TextType.CODE: ("<code>", "</code>"),
+}
+
+
+@functools.lru_cache(maxsize=LEAF_CACHE_SIZE)
+def interned_leaf_node(text_type, text, url=None):
+    if text_type is TextType.LINK:
+        return FrozenLeafNode("a", text, {"href": url})
+    if text_type is TextType.IMAGE:
+        return FrozenLeafNode("img", "", {"src": url, "alt": text})
+    try:
+        return FrozenLeafNode(TEXT_TYPE_TAGS[text_type], text)
+    except KeyError:
+        raise Exception("Invalid TextType.") from None
+
+
+def leaf_cache_info():
+    return interned_leaf_node.cache_info()
+
+
+def text_nodes_to_html_nodes(text_nodes):
+    TEXT = TextType.TEXT
+    leaf_node = interned_leaf_node
+    html_nodes = []
+    append = html_nodes.append
+    for node in text_nodes:
+        text_type = node.text_type
+        text = node.text
+        if text_type is TEXT:
+            append(LeafNode(None, text))
+        elif len(text) > INTERN_TEXT_LENGTH:
+            append(text_node_to_html_node(node))
+        else:
+            append(leaf_node(text_type, text, node.url))
+    return html_nodes
+
+
+def text_nodes_to_html(text_nodes):
+    TEXT = TextType.TEXT
+    LINK = TextType.LINK
+    IMAGE = TextType.IMAGE
+    tag_pairs = TEXT_TYPE_TAG_PAIRS
+    parts = []
+    append = parts.append
+    for node in text_nodes:
+        text_type = node.text_type
+        if text_type is TEXT:
+            append(node.text)
+        elif text_type is LINK:
+            props = render_props((("href", node.url),))
+            append(f"<a{props}>{node.text}</a>")
+        elif text_type is IMAGE:
+            props = render_props((("src", node.url), ("alt", node.text)))
+            append(f"<img{props}></img>")
+        else:
+            try:
+                open_tag, close_tag = tag_pairs[text_type]
+            except KeyError:
+                raise Exception("Invalid TextType.") from None
+            append(open_tag)
+            append(node.text)
+            append(close_tag)
+    return "".join(parts)
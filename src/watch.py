@@ -0,0 +1,215 @@
+import os
+import time
+
+from assets import ASSET_EXCLUDE_PATTERNS, AssetPipeline, content_patterns
+from block_cache import BlockCache
+from build import (
+    apply_template,
+    find_pages,
+    page_output_path,
+    page_title,
+    render_page
+)
+from output_writer import OutputWriter
+from template import TemplateLoader
+
+
+class DependencyGraph:
+    def __init__(self):
+        self.dependencies = {}
+        self.dependents = {}
+
+    def __repr__(self):
+        return f"DependencyGraph({len(self.dependencies)} pages)"
+
+    def set_dependencies(self, page, paths):
+        self.remove_page(page)
+        self.dependencies[page] = frozenset(paths)
+        for path in self.dependencies[page]:
+            self.dependents.setdefault(path, set()).add(page)
+
+    def remove_page(self, page):
+        for path in self.dependencies.pop(page, ()):
+            pages = self.dependents[path]
+            pages.discard(page)
+            if not pages:
+                del self.dependents[path]
+
+    def affected_pages(self, paths):
+        pages = set()
+        for path in paths:
+            pages.update(self.dependents.get(path, ()))
+        return pages
+
+
+def snapshot(paths):
+    files = {}
+    stack = list(paths)
+    while stack:
+        path = stack.pop()
+        try:
+            if os.path.isfile(path):
+                stat = os.stat(path)
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+                continue
+            entries = os.scandir(path)
+        except FileNotFoundError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+class FileWatcher:
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self.files = snapshot(self.paths)
+
+    def __repr__(self):
+        return f"FileWatcher({self.paths}, {len(self.files)} files)"
+
+    def poll(self):
+        files = snapshot(self.paths)
+        changed = {
+            path for path, stat in files.items()
+            if self.files.get(path) != stat
+        }
+        changed.update(path for path in self.files if path not in files)
+        self.files = files
+        return changed
+
+
+class IncrementalBuilder:
+    def __init__(
+        self,
+        content_dir,
+        public_dir,
+        block_cache_bytes=64 * 1024 * 1024,
+        template_path=None
+    ):
+        self.content_dir = content_dir
+        self.public_dir = public_dir
+        self.template_path = template_path
+        self.templates = TemplateLoader()
+        self.graph = DependencyGraph()
+        self.block_cache = BlockCache(block_cache_bytes)
+        self.writer = OutputWriter()
+        self.assets = AssetPipeline(content_dir, public_dir)
+        self.outputs = {}
+        self.errors = {}
+
+    def __repr__(self):
+        return (
+            f"IncrementalBuilder({self.content_dir}, {self.public_dir}, "
+            f"{len(self.outputs)} pages)"
+        )
+
+    def template(self):
+        if self.template_path is None:
+            return None
+        return self.templates.load(self.template_path)
+
+    def page_dependencies(self, source_path):
+        template = self.template()
+        if template is None:
+            return [source_path]
+        return [source_path, *template.dependencies]
+
+    def build_page(self, source_path):
+        with open(source_path, encoding="utf-8") as file:
+            markdown = file.read()
+        html = render_page(markdown, self.block_cache)
+        template = self.template()
+        if template is not None:
+            html = apply_template(
+                template, html, page_title(markdown, source_path)
+            )
+
+        output_path = page_output_path(
+            source_path, self.content_dir, self.public_dir
+        )
+        self.writer.write(output_path, html.encode("utf-8"))
+        self.outputs[source_path] = output_path
+        self.graph.set_dependencies(
+            source_path, self.page_dependencies(source_path)
+        )
+
+    def remove_page(self, source_path):
+        output_path = self.outputs.pop(source_path, None)
+        if output_path is not None and os.path.exists(output_path):
+            os.remove(output_path)
+        self.graph.remove_page(source_path)
+
+    def try_build_page(self, source_path):
+        try:
+            self.build_page(source_path)
+        except (ValueError, OSError) as error:
+            self.errors[source_path] = str(error)
+            return False
+        return True
+
+    def run_assets(self):
+        self.assets.exclude = ASSET_EXCLUDE_PATTERNS + content_patterns(
+            self.watch_paths()[1:], self.content_dir
+        )
+        self.assets.run()
+
+    def build_all(self):
+        self.errors = {}
+        for source_path in find_pages(self.content_dir):
+            self.try_build_page(source_path)
+        self.run_assets()
+        self.writer.flush()
+        return len(self.outputs)
+
+    def rebuild(self, changed_paths):
+        self.templates.invalidate(changed_paths)
+        pages = self.graph.affected_pages(changed_paths)
+        pages.update(
+            path for path in changed_paths
+            if path.endswith(".md") and path not in self.outputs
+        )
+
+        rebuilt = []
+        self.errors = {}
+        for source_path in sorted(pages):
+            if os.path.exists(source_path):
+                if self.try_build_page(source_path):
+                    rebuilt.append(source_path)
+            else:
+                self.remove_page(source_path)
+        if any(not path.endswith(".md") for path in changed_paths):
+            self.run_assets()
+        self.writer.flush()
+        return rebuilt
+
+    def watch_paths(self):
+        try:
+            template = self.template()
+        except (ValueError, OSError):
+            return [self.content_dir, self.template_path]
+        if template is None:
+            return [self.content_dir]
+        return [self.content_dir, *template.dependencies]
+
+    def watch(self, interval=0.1, on_rebuild=None):
+        watcher = FileWatcher(self.watch_paths())
+        while True:
+            time.sleep(interval)
+            changed = watcher.poll()
+            if not changed:
+                continue
+
+            start = time.perf_counter()
+            rebuilt = self.rebuild(changed)
+            watch_paths = self.watch_paths()
+            if watch_paths != watcher.paths:
+                watcher = FileWatcher(watch_paths)
+            if on_rebuild is not None:
+                on_rebuild(rebuilt, time.perf_counter() - start, self.errors)